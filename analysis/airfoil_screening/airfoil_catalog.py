@@ -0,0 +1,113 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Geometry Catalog
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Scans a directory of airfoil coordinate files (Selig or Lednicer format), derives
+# shape metadata for each one and keeps it in an on-disk SQLite index. The index is
+# rebuilt incrementally: only files that are new or whose size/mtime changed are
+# re-read, and entries for deleted files are dropped. Screening can then select
+# candidates with a query such as "0.09 <= maxThickness <= 0.13" instead of a
+# hand-edited name list.
+
+import sqlite3
+from pathlib import Path
+import pandas as pd
+from airfoil_geometry import computeShapeMetrics,readAirfoilCoordinates
+
+CATALOG_COLUMNS = [
+    "name","path","sizeBytes","mtimeNs","format","title","pointCount",
+    "maxThickness","xMaxThickness","maxCamber","xMaxCamber","teGap",
+]
+METRIC_STATIONS = 201 # Cosine-spaced x/c stations used for thickness and camber
+
+# ============================== #
+#|        SHAPE METADATA        |#
+# ============================== #
+def describeAirfoilFile(datPath: Path) -> dict:
+    datPath = Path(datPath)
+    stat = datPath.stat()
+    title,fileFormat,x,y = readAirfoilCoordinates(datPath)
+    return {
+        "name": datPath.stem,
+        "path": str(datPath),
+        "sizeBytes": stat.st_size,
+        "mtimeNs": stat.st_mtime_ns,
+        "format": fileFormat,
+        "title": title,
+        "pointCount": len(x),
+        **computeShapeMetrics(x,y,METRIC_STATIONS),
+    }
+
+# ============================== #
+#|         ON-DISK INDEX        |#
+# ============================== #
+def openCatalog(indexPath: Path) -> sqlite3.Connection:
+    Path(indexPath).parent.mkdir(parents=True,exist_ok=True)
+    connection = sqlite3.connect(indexPath)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS airfoils ("
+        "name TEXT PRIMARY KEY, path TEXT, sizeBytes INTEGER, mtimeNs INTEGER, format TEXT, "
+        "title TEXT, pointCount INTEGER, maxThickness REAL, xMaxThickness REAL, "
+        "maxCamber REAL, xMaxCamber REAL, teGap REAL)"
+    )
+    connection.execute("CREATE INDEX IF NOT EXISTS airfoilsThickness ON airfoils (maxThickness)")
+    connection.execute("CREATE INDEX IF NOT EXISTS airfoilsCamber ON airfoils (maxCamber)")
+    return connection
+
+def updateCatalog(geometryDirectory: Path,indexPath: Path,verbose: bool = False) -> pd.DataFrame:
+    geometryFiles = {path.stem: path for path in sorted(Path(geometryDirectory).glob("*.dat"))}
+
+    connection = openCatalog(indexPath)
+    try:
+        known = {
+            name: (sizeBytes,mtimeNs)
+            for name,sizeBytes,mtimeNs in connection.execute("SELECT name, sizeBytes, mtimeNs FROM airfoils")
+        }
+
+        removed = [name for name in known if name not in geometryFiles]
+        changed = []
+        for name,path in geometryFiles.items():
+            stat = path.stat()
+            if known.get(name) != (stat.st_size,stat.st_mtime_ns):
+                changed.append(path)
+
+        rows = []
+        for path in changed:
+            try:
+                rows.append(describeAirfoilFile(path))
+            except (ValueError,IndexError,OSError) as error:
+                print(f"[WARNING] Skipping unreadable airfoil file {path}: {error}\n")
+
+        with connection:
+            connection.executemany("DELETE FROM airfoils WHERE name = ?",[(name,) for name in removed])
+            connection.executemany(
+                f"INSERT OR REPLACE INTO airfoils ({', '.join(CATALOG_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(CATALOG_COLUMNS))})",
+                [tuple(row[column] for column in CATALOG_COLUMNS) for row in rows]
+            )
+
+        print(f"[PROGRAM] Airfoil catalog: {len(geometryFiles)} files, {len(rows)} (re)indexed, "
+              f"{len(removed)} removed.\n")
+        if verbose:
+            for row in rows:
+                print(f"[DEBUG] Indexed {row['name']} ({row['format']}, t/c = {row['maxThickness']:.4f}).\n")
+
+        return pd.read_sql_query("SELECT * FROM airfoils ORDER BY name",connection)
+    finally:
+        connection.close()
+
+def loadCatalog(indexPath: Path) -> pd.DataFrame:
+    if not Path(indexPath).exists():
+        return pd.DataFrame(columns=CATALOG_COLUMNS)
+    connection = sqlite3.connect(indexPath)
+    try:
+        return pd.read_sql_query("SELECT * FROM airfoils ORDER BY name",connection)
+    finally:
+        connection.close()
+
+def queryCatalog(catalog: pd.DataFrame,expression: str) -> list:
+    # expression is a pandas query over the catalog columns, e.g.
+    #   "0.09 <= maxThickness <= 0.13 and maxCamber > 0.01"
+    return catalog.query(expression)["name"].tolist()
@@ -0,0 +1,201 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Shared Airfoil Geometry
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# One place to read airfoil coordinate files (Selig or Lednicer format), repanel them
+# onto cosine-spaced points and derive thickness and camber distributions, so the
+# screening catalog, the XFoil input, the panel method and the OpenFOAM STL export all
+# see the same geometry. Repaneled geometry is cached as .npz under a hash of the file
+# contents and the panel count; an edited .dat is a cache miss, an unchanged one is
+# never re-parsed.
+#
+# Repaneled points run in Selig order (TE -> upper -> LE -> lower -> TE) with the upper
+# and lower surfaces sampled at the same x/c stations, so thickness and camber are plain
+# differences and sums over the two halves and work on whole batches at once.
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+import numpy as np
+
+GEOMETRY_CACHE_VERSION = 1 # Bump when the repaneling changes so old cache entries are ignored
+DEFAULT_PANELS = 160 # XFoil's own default node count for PANE
+
+# ============================== #
+#|       COORDINATE READING     |#
+# ============================== #
+def parseCoordinatePair(line: str):
+    parts = line.replace(",", " ").split()
+    if len(parts) < 2:
+        return None
+    try:
+        return float(parts[0]),float(parts[1])
+    except ValueError:
+        return None
+
+def readAirfoilCoordinates(datPath: Path):
+    # Returns (title, fileFormat, x, y) with points in Selig order: trailing edge over the
+    # upper surface to the leading edge and back along the lower surface.
+    lines = Path(datPath).read_text(encoding="utf-8",errors="replace").splitlines()
+    lines = [line for line in lines if line.strip()] + [""]
+
+    title = Path(datPath).stem
+    firstPair = parseCoordinatePair(lines[0])
+    if firstPair is None:
+        title = lines[0].strip()
+        lines = lines[1:]
+
+    pairs = [pair for pair in (parseCoordinatePair(line) for line in lines) if pair is not None]
+    if len(pairs) < 5:
+        raise ValueError(f"Too few coordinate points in {datPath}.")
+
+    # Lednicer files open with the upper/lower point counts, e.g. "61.  61."
+    upperCount,lowerCount = pairs[0]
+    isLednicer = (
+        upperCount > 1.5 and lowerCount > 1.5
+        and float(upperCount).is_integer() and float(lowerCount).is_integer()
+        and int(upperCount) + int(lowerCount) <= len(pairs) - 1
+    )
+    if isLednicer:
+        upper = np.array(pairs[1:1 + int(upperCount)],dtype=float)
+        lower = np.array(pairs[1 + int(upperCount):1 + int(upperCount) + int(lowerCount)],dtype=float)
+        # Both surfaces run LE -> TE; Selig order is upper reversed, then lower without the repeated LE
+        if np.allclose(upper[0],lower[0]):
+            lower = lower[1:]
+        coordinates = np.vstack([upper[::-1],lower])
+        fileFormat = "lednicer"
+    else:
+        coordinates = np.array(pairs,dtype=float)
+        fileFormat = "selig"
+
+    return title,fileFormat,coordinates[:,0],coordinates[:,1]
+
+def writeSeligFile(datPath: Path,title: str,x: np.ndarray,y: np.ndarray) -> Path:
+    # Plain Selig file that XFoil's LOAD accepts; written through a temporary file so
+    # concurrent readers never see a partial geometry
+    datPath = Path(datPath)
+    lines = [title] + [f"{xi:12.8f} {yi:12.8f}" for xi,yi in zip(x,y)]
+    pendingPath = datPath.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    pendingPath.write_text("\n".join(lines) + "\n",encoding="utf-8")
+    os.replace(pendingPath,datPath)
+    return datPath
+
+# ============================== #
+#|          REPANELING          |#
+# ============================== #
+def splitSurfaces(x: np.ndarray,y: np.ndarray):
+    # Chord-normalized (upperX, upperY, lowerX, lowerY), each sorted LE -> TE
+    leIndex = int(np.argmin(x))
+    chord = float(np.max(x) - x[leIndex])
+    xNorm = (x - x[leIndex]) / chord
+    yNorm = (y - y[leIndex]) / chord
+
+    upperX,upperY = xNorm[:leIndex + 1][::-1],yNorm[:leIndex + 1][::-1]
+    lowerX,lowerY = xNorm[leIndex:],yNorm[leIndex:]
+    if upperY.mean() < lowerY.mean():
+        upperX,upperY,lowerX,lowerY = lowerX,lowerY,upperX,upperY
+
+    upperOrder = np.argsort(upperX,kind="stable")
+    lowerOrder = np.argsort(lowerX,kind="stable")
+    return upperX[upperOrder],upperY[upperOrder],lowerX[lowerOrder],lowerY[lowerOrder]
+
+def cosineStations(count: int) -> np.ndarray:
+    # x/c stations clustered at both the leading and trailing edge
+    return 0.5 * (1.0 - np.cos(np.linspace(0.0,np.pi,count)))
+
+def repanelAirfoil(x: np.ndarray,y: np.ndarray,panels: int = DEFAULT_PANELS):
+    # Returns panels + 1 nodes in Selig order (TE -> upper -> LE -> lower -> TE), chord-normalized,
+    # with cosine clustering at both the leading and trailing edge.
+    upperX,upperY,lowerX,lowerY = splitSurfaces(x,y)
+    xStations = cosineStations(panels // 2 + 1)
+    yUpper = np.interp(xStations,upperX,upperY)
+    yLower = np.interp(xStations,lowerX,lowerY)
+
+    xNodes = np.concatenate([xStations[::-1],xStations[1:]])
+    yNodes = np.concatenate([yUpper[::-1],yLower[1:]])
+    return xNodes,yNodes
+
+def thicknessCamber(xNodes: np.ndarray,yNodes: np.ndarray):
+    # xNodes, yNodes: (..., panels + 1) from repanelAirfoil, any leading batch shape.
+    # Returns (xStations, thickness, camber), each (..., panels // 2 + 1), LE -> TE.
+    stations = (xNodes.shape[-1] + 1) // 2
+    xStations = xNodes[...,stations - 1:]
+    yUpper = yNodes[...,:stations][...,::-1]
+    yLower = yNodes[...,stations - 1:]
+    return xStations,yUpper - yLower,0.5 * (yUpper + yLower)
+
+def computeShapeMetrics(x: np.ndarray,y: np.ndarray,stations: int = 201) -> dict:
+    xNodes,yNodes = repanelAirfoil(x,y,2 * (stations - 1))
+    xStations,thickness,camber = thicknessCamber(xNodes,yNodes)
+    thicknessIndex = int(np.argmax(thickness))
+    camberIndex = int(np.argmax(np.abs(camber)))
+
+    leIndex = int(np.argmin(x))
+    chord = float(np.max(x) - x[leIndex])
+    xNorm = (x - x[leIndex]) / chord
+    yNorm = (y - y[leIndex]) / chord
+    return {
+        "maxThickness": float(thickness[thicknessIndex]),
+        "xMaxThickness": float(xStations[thicknessIndex]),
+        "maxCamber": float(camber[camberIndex]),
+        "xMaxCamber": float(xStations[camberIndex]),
+        "teGap": float(np.hypot(xNorm[0] - xNorm[-1],yNorm[0] - yNorm[-1])),
+    }
+
+# ============================== #
+#|        GEOMETRY CACHE        |#
+# ============================== #
+def geometryCacheKey(datPath: Path,panels: int) -> str:
+    digest = hashlib.sha256(Path(datPath).read_bytes())
+    digest.update(f"panels={panels};version={GEOMETRY_CACHE_VERSION}".encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+def buildAirfoilGeometry(datPath: Path,panels: int = DEFAULT_PANELS) -> dict:
+    title,fileFormat,x,y = readAirfoilCoordinates(datPath)
+    xNodes,yNodes = repanelAirfoil(x,y,panels)
+    xStations,thickness,camber = thicknessCamber(xNodes,yNodes)
+    return {
+        "title": title,
+        "format": fileFormat,
+        "xRaw": x,
+        "yRaw": y,
+        "x": xNodes,
+        "y": yNodes,
+        "xStations": xStations,
+        "thickness": thickness,
+        "camber": camber,
+    }
+
+def loadAirfoilGeometry(datPath: Path,panels: int = DEFAULT_PANELS,cacheDirectory: Path = None) -> dict:
+    # Raw and repaneled coordinates plus thickness/camber; with a cacheDirectory the result is
+    # read from (or written to) <name>_<hash>.npz instead of being recomputed
+    datPath = Path(datPath)
+    if cacheDirectory is None:
+        return buildAirfoilGeometry(datPath,panels)
+
+    cachePath = Path(cacheDirectory) / f"{datPath.stem}_{geometryCacheKey(datPath,panels)}.npz"
+    if cachePath.exists():
+        with np.load(cachePath) as cached:
+            geometry = {key: cached[key] for key in cached.files}
+        geometry["title"] = str(geometry["title"])
+        geometry["format"] = str(geometry["format"])
+        return geometry
+
+    geometry = buildAirfoilGeometry(datPath,panels)
+    cachePath.parent.mkdir(parents=True,exist_ok=True)
+    pendingPath = cachePath.with_name(f"{cachePath.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npz")
+    np.savez(pendingPath,**geometry)
+    os.replace(pendingPath,cachePath)
+    return geometry
+
+def repaneledDatFile(datPath: Path,panels: int,cacheDirectory: Path) -> Path:
+    # Selig file of the cached repaneling, e.g. for XFoil's LOAD; rewritten only on a cache miss
+    datPath = Path(datPath)
+    outPath = Path(cacheDirectory) / f"{datPath.stem}_{geometryCacheKey(datPath,panels)}.dat"
+    if not outPath.exists():
+        geometry = loadAirfoilGeometry(datPath,panels,cacheDirectory)
+        writeSeligFile(outPath,geometry["title"],geometry["x"],geometry["y"])
+    return outPath
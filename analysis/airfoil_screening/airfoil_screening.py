@@ -4,20 +4,79 @@
 #Airfoil Selection: Preliminary Data Obtainment
 #Utilizes XFoil 6.99 for Windows
 
+# ============================== #
+#|      PROGRAM DESCRIPTION     |#
+# ============================== #
+# Runs the candidate airfoils through XFoil, parses the polars, extracts stall and
+# lift-curve metrics, scores the candidates, plots the results and rewrites
+# airfoil_selection.md. Each stage is a function, so the module can be imported and
+# reused; running it as a script exposes the stages as subcommands:
+#   python airfoil_screening.py            # Full pipeline (same as 'all')
+#   python airfoil_screening.py run        # XFoil sweep (plus the optional sweep grid)
+#   python airfoil_screening.py parse      # .pol files -> one table, data_processed/polars.npz
+#   python airfoil_screening.py score      # Metrics and rankings from the processed polars
+#   python airfoil_screening.py plot       # Figures (the only stage that loads matplotlib/seaborn)
+#   python airfoil_screening.py plot --preview
+#                                          # Low-dpi figures in figures/preview/ for quick looks
+#   python airfoil_screening.py report     # Rewrite airfoil_selection.md
+#   python airfoil_screening.py sensitivity
+#                                          # Rank probabilities under randomly drawn score weights
+#   python airfoil_screening.py surrogate  # (alpha, Re) lookup tables -> data_processed/polar_surrogate.npz
+#   python airfoil_screening.py --trace all
+#                                          # Stage/XFoil timings -> data_processed/trace.json + trace_summary.csv
+#   python airfoil_screening.py catalog    # (Re)index geometry/ and list matching airfoils
+#   python airfoil_screening.py --query "0.09 <= maxThickness <= 0.13" run
+#                                          # Screen catalog matches instead of AIRFOILS
+#   python airfoil_screening.py prefilter  # Inviscid panel-method check only, no XFoil
+#   python airfoil_screening.py --prefilter all
+#                                          # Send only airfoils passing the panel check to XFoil
+# The sibling modules (xfoil_session.py, polar_io.py, ...) are imported by name from this
+# file's directory, which is put on sys.path, so the script runs from any working directory.
+# pandas and the stage-specific siblings are only imported when a stage needs them, which
+# keeps 'python airfoil_screening.py --help' and the module import itself fast.
+
+from __future__ import annotations
+import argparse
+import functools
+import importlib
+import sys
 import subprocess
 import pathlib
+import os
+import shutil
+import tempfile
+import hashlib
+import threading
+import itertools
+import sqlite3
+import time
+import json
+from concurrent.futures import ThreadPoolExecutor,ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 from datetime import date
+from typing import TYPE_CHECKING
+
+if str(pathlib.Path(__file__).resolve().parent) not in sys.path:
+    sys.path.insert(0,str(pathlib.Path(__file__).resolve().parent))
+from polar_io import POLAR_COLUMNS,formatPolarText,parsePolarRows,readColumnarPolar,readPolarTable,writeColumnarPolar
+from pipeline_trace import TRACER
+if TYPE_CHECKING: # Annotation only; polar_surrogate is imported by surrogateStage on first use
+    from polar_surrogate import PolarSurrogate
+
+class LazyModule:
+    # Imports the named module on first attribute access; pandas alone takes ~0.2 s to import
+    def __init__(self,name: str):
+        self.name = name
+
+    def __getattr__(self,attribute: str):
+        return getattr(importlib.import_module(self.name),attribute)
+
+pd = LazyModule("pandas")
 
 # ============================== #
 #|         CONFIGURATION        |#
 # ============================== #
-sns.set_theme(style='whitegrid',context='talk',palette='deep')
-
 username = "Chris Dillow" # Set this to your name for it to be applied to data outputs
 # For other users running this script for your own projects, change the AIRFOILS array items
 # and other configuration inputs to match your project's needs before running.
@@ -44,27 +103,62 @@ def computeReynolds(fluidDensity,fluidVelocity,characteristicLength,dynamicVisco
     return (fluidDensity * fluidVelocity * characteristicLength) / dynamicViscocity
 
 RE = computeReynolds(fluidDensity,fluidVelocity,characteristicLength,dynamicViscocity)
-print(f"[PROGRAM] Using Reynolds Number (Re) ≈ {RE:.0f} based on:\n",
-      f"Fluid Velocity (V) = {fluidVelocity} m/s\n",
-      f"Characteristic Length (c) = {characteristicLength} m.\n")
-
-geometryDirectory = pathlib.Path("geometry")
-rawDirectory = pathlib.Path("data_raw")
-processedDirectory = pathlib.Path("data_processed")
-figureDirectory = pathlib.Path("figures")
-xfoilExecutable = pathlib.Path("xfoil/xfoil.exe")
-
-for directory in [geometryDirectory,rawDirectory,processedDirectory,figureDirectory]:
-    directory.mkdir(parents=True,exist_ok=True)
-
-if not xfoilExecutable.exists():
-    print(f"[ERROR] XFoil not found at {xfoilExecutable}.\n")
-    print("Please download the appropriate build for your device and place it in /analysis/airfoil_screening/xfoil/")
-else:
-    print(f"[PROGRAM] XFoil found at {xfoilExecutable}.\n")
+
+# ===== Sweep Grid ===== #
+# Optional (Re, Mach, Ncrit) grid run for every airfoil on top of the cruise RE above.
+# Leave SWEEP_REYNOLDS empty to skip; results are stored in data_processed/sweep_polars.sqlite.
+SWEEP_REYNOLDS = [] # e.g. [computeReynolds(fluidDensity,v,c,dynamicViscocity) for v in (15.0,30.0,45.0) for c in (0.15,0.20)]
+SWEEP_MACH = [0.0]
+SWEEP_NCRIT = [9.0] # 9 is XFoil's default; lower values model a turbulent freestream
+
+# Paths are anchored to this file so the module works from any working directory
+ROOT_DIR = pathlib.Path(__file__).resolve().parent
+geometryDirectory = ROOT_DIR / "geometry"
+rawDirectory = ROOT_DIR / "data_raw"
+processedDirectory = ROOT_DIR / "data_processed"
+figureDirectory = ROOT_DIR / "figures"
+scratchDirectory = rawDirectory / "scratch" # Per-job XFoil working directories, cleaned after each run
+polarCacheDirectory = rawDirectory / "cache" # Content-addressed polars from previous XFoil runs
+geometryCacheDirectory = rawDirectory / "geometry_cache" # Repaneled geometry (.npz/.dat) keyed by .dat contents
+sweepStorePath = processedDirectory / "sweep_polars.sqlite"
+catalogIndexPath = processedDirectory / "airfoil_catalog.sqlite" # Shape metadata for every file in geometry/
+surrogatePath = processedDirectory / "polar_surrogate.npz" # (alpha, Re) lookup tables built by the surrogate stage
+xfoilExecutable = ROOT_DIR / "xfoil" / "xfoil.exe"
+selectionMD = ROOT_DIR / "airfoil_selection.md"
 
 VERBOSE = False # Set to 'True' for detailed XFoil logs and debug prints
+TRACE = False # Set to 'True' (or pass --trace) for per-stage and per-run timing in data_processed/trace.json
+XFOIL_WORKERS = max(1,(os.cpu_count() or 1) - 1) # Concurrent XFoil processes; set to 1 for a serial sweep
+XFOIL_ITERATIONS = 200 # OPTIONAL: Increase or decrease iterations for refined data
+XFOIL_SESSIONS = False # Set to 'True' to reuse long-lived XFoil sessions instead of one process per run
+XFOIL_INPUT_PANELS = None # e.g. 160: give XFoil the shared cosine repaneling and skip PANE; None lets XFoil panel the raw .dat
+XFOIL_TIMEOUT = 120.0 # Seconds before a hung XFoil run is killed (per grid point for sweep grids); None to wait indefinitely
+XFOIL_RETRY_ROUNDS = 2 # Retries of non-converged angles only; 0 to accept gaps as they are
+XFOIL_RETRY_ITERATION_FACTOR = 2 # ITER grows by this factor on every retry round
+POLAR_CACHE = True # Set to 'False' to always rerun XFoil, even when inputs are unchanged
+POLAR_CACHE_MAX_MB = 256 # Least-recently-used polars are evicted past this size
 DIAGNOSTIC_LINEAR_PLOTS = True # Set to 'False' if you do not want linear region plots
+PLOT_WORKERS = max(1,(os.cpu_count() or 1) - 1) # Processes rendering figures; 1 renders in-process
+FIGURE_DPI = 300
+PREVIEW_DPI = 72 # 'plot --preview' writes to figures/preview/ at this dpi
+POLAR_COLUMNAR_FORMAT = "npz" # Processed polar table as "npz" or "parquet" (needs pyarrow); None writes polars.csv
+PER_AIRFOIL_POLAR_CSV = False # Set to 'True' to also write data_processed/<airfoil>_polar.csv for every airfoil
+
+# ===== Adaptive AoA Refinement ===== #
+# Coarse sweep first, then finer ASEQ passes only where Cl(alpha) bends or Cd changes quickly
+# (stall, drag bucket edges). Pass n steps ADAPTIVE_COARSE_STEP / 2**n on one fixed grid, so
+# refined angles coincide with earlier ones, down to the first step at or below ADAPTIVE_FINE_STEP.
+ADAPTIVE_AOA = False # Set to 'True' to replace the uniform AOA_RANGE sweep with adaptive passes
+ADAPTIVE_COARSE_STEP = 2.0 # Degrees; first pass over the full AOA_RANGE span
+ADAPTIVE_FINE_STEP = 0.25 # Degrees; passes stop at the first ADAPTIVE_COARSE_STEP / 2**n at or below this
+ADAPTIVE_CL_CURVATURE = 0.01 # |d2Cl/dalpha2| (per deg^2) above which an interval is refined
+ADAPTIVE_CD_CHANGE = 0.3 # Relative Cd change between neighbors above which an interval is refined
+
+# ===== Panel Pre-Filter ===== #
+# Inviscid panel-method screen run before XFoil; airfoils outside either band are dropped.
+PANEL_PREFILTER = False # Set to 'True' (or pass --prefilter) to screen every run
+PANEL_ALPHA_ZERO_LIFT_RANGE = (-5.0,0.5) # Degrees; inviscid zero-lift angle band
+PANEL_CM_RANGE = (-0.12,0.02) # Inviscid Cm about c/4, averaged over the panel alpha sweep
 
 def normalizeSeries(metricSeries: pd.Series) -> pd.Series:
     cleanedSeries = metricSeries.replace([np.inf,-np.inf],np.nan)
@@ -81,72 +175,350 @@ def normalizeSeries(metricSeries: pd.Series) -> pd.Series:
     normalizedValues = (cleanedSeries - minValue) / (maxValue - minValue)
     return normalizedValues.reindex(metricSeries.index)
 
+def ensureDirectories() -> None:
+    for directory in [geometryDirectory,rawDirectory,processedDirectory,figureDirectory]:
+        directory.mkdir(parents=True,exist_ok=True)
+
+def checkXfoilExecutable() -> bool:
+    if not xfoilExecutable.exists():
+        print(f"[ERROR] XFoil not found at {xfoilExecutable}.\n")
+        print("Please download the appropriate build for your device and place it in /analysis/airfoil_screening/xfoil/")
+        return False
+    print(f"[PROGRAM] XFoil found at {xfoilExecutable}.\n")
+    return True
+
 # ============================== #
 #|        XFOIL EXECUTION       |#
 # ============================== #
-def buildXfoilCommand(airfoilName: str,re: float,aoaRange) -> str:
-    airfoilDAT = geometryDirectory / f"{airfoilName}.dat"
-    polarFile = rawDirectory / f"{airfoilName}_Re{int(re)}.pol"
+def xfoilGeometryFile(airfoilName: str) -> Path:
+    # The .dat XFoil loads: the raw geometry, or its cached cosine repaneling when
+    # XFOIL_INPUT_PANELS is set, so XFoil, the panel method and the STL export share nodes
+    datPath = geometryDirectory / f"{airfoilName}.dat"
+    if XFOIL_INPUT_PANELS is None:
+        return datPath
+    from airfoil_geometry import repaneledDatFile
+    return repaneledDatFile(datPath,XFOIL_INPUT_PANELS,geometryCacheDirectory)
+
+def xfoilPanelingCommands() -> list:
+    # A pre-repaneled input is used node for node; PANE would replace it with XFoil's own paneling
+    return ["PANE"] if XFOIL_INPUT_PANELS is None else []
+
+def aseqCommand(aoaRange) -> str:
+    aoaList = list(aoaRange)
+    aStart = aoaList[0]
+    aEnd = aoaList[-1]
+    aStep = aoaList[1] - aoaList[0] if len(aoaList) > 1 else 1.0
+    return f"ASEQ {aStart} {aEnd} {aStep}"
+
+def buildXfoilCommand(airfoilName: str,re: float,aoaRange,
+                      airfoilDAT: Path = None,polarFile: Path = None,
+                      mach: float = 0.0,ncrit: float = None,aseqSegments=None,
+                      iterations: int = None,reinitialize: bool = False) -> str:
+    if airfoilDAT is None:
+        airfoilDAT = xfoilGeometryFile(airfoilName)
+    if polarFile is None:
+        polarFile = rawDirectory / f"{airfoilName}_Re{int(re)}.pol"
+    if iterations is None:
+        iterations = XFOIL_ITERATIONS
 
     cmdLines = [
         f"LOAD {airfoilDAT}",
         "", # Use a blank line in case XFoil sends a prompt
-        "PANE",
+        *xfoilPanelingCommands(),
         "",
         "PLOP",
         "G",
         "",
         "OPER",
         f"VISC {int(re)}",
-        "MACH 0.0",
-        "ITER 200", # OPTIONAL: Increase or decrease iterations for refined data
+        f"MACH {mach}",
+    ]
+    if ncrit is not None:
+        cmdLines += ["VPAR",f"N {ncrit}",""]
+    cmdLines += [
+        f"ITER {iterations}",
         "PACC",
         f"{polarFile}",
         "", # No dump file
     ]
 
     # ===== AoA Sweep ===== #
-    aoaList = list(aoaRange)
-    aStart = aoaList[0]
-    aEnd = aoaList[-1]
-    aStep = aoaList[1] - aoaList[0] if len(aoaList) > 1 else 1.0
-
-    cmdLines.append(f"ASEQ {aStart} {aEnd} {aStep}")
+    if aseqSegments is None:
+        cmdLines.append(aseqCommand(aoaRange))
+    else:
+        # Several ASEQ blocks march on from one another and accumulate into the same polar;
+        # reinitialize restarts the boundary layer so each block marches only from its own start
+        for aStart,aEnd,aStep in aseqSegments:
+            if reinitialize:
+                cmdLines.append("INIT")
+            cmdLines.append(f"ASEQ {aStart} {aEnd} {aStep}")
     cmdLines.append("QUIT")
     cmdLines.append("")
 
     return "\n".join(cmdLines)
 
-def runXfoil(airfoilName,re,aoaRange):
+# ===== Polar Cache ===== #
+# Polars are stored under a hash of the geometry file contents plus the full XFoil script,
+# so any change to the .dat, Re, AoA range, ITER or other command inputs is a cache miss.
+# The retry settings are hashed too, since retries fill in angles the first pass missed.
+polarCacheLock = threading.Lock()
+
+def polarCacheKey(airfoilDAT: Path,script: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(airfoilDAT.read_bytes())
+    digest.update(script.encode("utf-8"))
+    digest.update(f"retry {XFOIL_RETRY_ROUNDS} {XFOIL_RETRY_ITERATION_FACTOR}".encode("utf-8"))
+    return digest.hexdigest()
+
+def loadCachedPolar(key: str,polarFile: Path) -> bool:
+    cachedPolar = polarCacheDirectory / f"{key}.pol"
+    if not cachedPolar.exists():
+        return False
+    shutil.copyfile(cachedPolar,polarFile)
+    os.utime(cachedPolar) # Mark as recently used for eviction
+    return True
+
+def storeCachedPolar(key: str,polarFile: Path) -> None:
+    polarCacheDirectory.mkdir(parents=True,exist_ok=True)
+    cachedPolar = polarCacheDirectory / f"{key}.pol"
+    pendingPolar = polarCacheDirectory / f"{key}.{threading.get_ident()}.tmp"
+    shutil.copyfile(polarFile,pendingPolar)
+    os.replace(pendingPolar,cachedPolar)
+    evictPolarCache(POLAR_CACHE_MAX_MB * 1024 * 1024)
+
+def evictPolarCache(maxBytes: int) -> None:
+    with polarCacheLock:
+        entries = []
+        for path in polarCacheDirectory.glob("*.pol"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime,stat.st_size,path))
+
+        totalBytes = sum(size for _,size,_ in entries)
+        for _,size,path in sorted(entries):
+            if totalBytes <= maxBytes:
+                break
+            path.unlink(missing_ok=True)
+            totalBytes -= size
+            if VERBOSE:
+                print(f"[DEBUG] Evicted cached polar {path.name}.\n")
+
+# ===== Watchdog and Run Log ===== #
+# Every XFoil process runs under XFOIL_TIMEOUT, and each one is logged with its wall time,
+# outcome and converged point count; runStage writes the log to data_processed/xfoil_runs.csv.
+xfoilRunLog = []
+xfoilRunLogLock = threading.Lock()
+
+def recordXfoilRun(**fields) -> dict:
+    with xfoilRunLogLock:
+        xfoilRunLog.append(fields)
+    return fields
+
+def runXfoilProcess(script: str,jobDirectory: Path,label: str,timeout: float = None):
+    # Returns (result, seconds, timedOut). A run past timeout (default XFOIL_TIMEOUT) is killed;
+    # whatever it already wrote to its polar file is still used by the caller.
+    if timeout is None:
+        timeout = XFOIL_TIMEOUT
+    startTime = time.perf_counter()
+    try:
+        result = subprocess.run(
+            [str(xfoilExecutable.resolve())],
+            input=script.replace("\n","\r\n"),
+            text=True,
+            capture_output=True,
+            cwd=jobDirectory,
+            timeout=timeout,
+        )
+        timedOut = False
+    except subprocess.TimeoutExpired as error:
+        # TimeoutExpired carries bytes even for text=True runs
+        stdout,stderr = [output.decode(errors="replace") if isinstance(output,bytes) else (output or "")
+                         for output in (error.stdout,error.stderr)]
+        result = subprocess.CompletedProcess(error.cmd,-1,stdout,stderr)
+        timedOut = True
+        print(f"[WARNING] XFoil run for {label} exceeded {timeout:.0f} s and was killed.\n")
+    return result,time.perf_counter() - startTime,timedOut
+
+def writeXfoilRunLog() -> pd.DataFrame:
+    with xfoilRunLogLock:
+        runLog = pd.DataFrame(xfoilRunLog)
+        xfoilRunLog.clear()
+    if runLog.empty:
+        return runLog
+
+    runLog.to_csv(processedDirectory / "xfoil_runs.csv",index=False)
+    retries = runLog[runLog['kind'] == "retry"]
+    print(f"[PROGRAM] XFoil time: {len(runLog)} runs, {runLog['seconds'].sum():.1f} s total, "
+          f"{len(retries)} retry runs recovering {int(retries['recovered'].sum())} points, "
+          f"{int(runLog['timedOut'].sum())} timeouts.\n")
+    if VERBOSE:
+        perAirfoil = runLog.groupby('airfoil').agg(
+            runs=('kind','size'),seconds=('seconds','sum'),
+            retries=('kind',lambda kind: int((kind == "retry").sum())),timeouts=('timedOut','sum'),
+        )
+        print(perAirfoil.round(2).to_string(),"\n")
+    return runLog
+
+def executeXfoilScript(airfoilName: str,re: float,script: str,kind: str = "sweep",requested: int = None):
+    # Runs one XFoil script in its own scratch directory and returns (result, polarText, runRecord);
+    # polarText is None when XFoil did not write a polar, runRecord is this run's log entry.
     if not xfoilExecutable.exists():
         raise FileNotFoundError(
             f"XFoil executable not found at {xfoilExecutable}.\n"
             f"Place xfoil.exe in the xfoil directory and rerun.\n"
         )
 
-    script = buildXfoilCommand(airfoilName,re,aoaRange)
-    print(f"[PROGRAM] Running XFoil for {airfoilName} at Re={re:.0f}...\n")
+    # Each job runs in its own scratch directory with short local filenames, so concurrent
+    # PACC writes never collide and XFoil's filename length limit is never hit.
+    scratchDirectory.mkdir(parents=True,exist_ok=True)
+    jobDirectory = Path(tempfile.mkdtemp(prefix=f"{airfoilName}_Re{int(re)}_",dir=scratchDirectory))
+    shutil.copyfile(xfoilGeometryFile(airfoilName),jobDirectory / "airfoil.dat")
+
     if VERBOSE:
         print(f"[DEBUG] XFoil command script for {airfoilName}:\n{script}\n")
-    
-    result = subprocess.run(
-        [str(xfoilExecutable)],
-        input=script.replace("\n","\r\n"),
-        text=True,
-        capture_output=True
+
+    try:
+        result,seconds,timedOut = runXfoilProcess(script,jobDirectory,f"{airfoilName} at Re={re:.0f}")
+        scratchPolar = jobDirectory / "polar.pol"
+        polarText = scratchPolar.read_text(encoding="utf-8",errors="replace") if scratchPolar.exists() else None
+    finally:
+        shutil.rmtree(jobDirectory,ignore_errors=True)
+
+    runRecord = recordXfoilRun(
+        airfoil=airfoilName,re=re,kind=kind,seconds=seconds,timedOut=timedOut,
+        returnCode=result.returncode,requested=requested,
+        converged=len(parsePolarRows(polarText.splitlines())) if polarText else 0,recovered=0,
     )
+    return result,polarText,runRecord
+
+# ===== Non-Convergence Recovery ===== #
+def aseqSegmentsThrough(alphas) -> list:
+    # ASEQ (start, end, step) segments visiting alphas in the order given; equally spaced runs
+    # share one segment and each segment starts where the previous one ended, so the march
+    # carries on from a point XFoil has just solved
+    segments = []
+    for aFrom,aTo in zip(alphas[:-1],alphas[1:]):
+        aStep = round(float(aTo - aFrom),6)
+        if segments and abs(aStep - segments[-1][2]) < 1e-6:
+            segments[-1] = (segments[-1][0],float(aTo),segments[-1][2])
+        elif aStep:
+            segments.append((float(aFrom),float(aTo),aStep))
+    return segments
+
+def snapRowsToGrid(rows,gridAlphas) -> dict:
+    # {grid alpha: row} for the rows within a quarter spacing of a grid angle. XFoil prints alpha
+    # to 3 decimals after summing ASEQ steps, so rows are matched by distance, not by rounded
+    # value; a later row for the same grid angle replaces an earlier one.
+    grid = np.array(sorted(set(gridAlphas)),dtype=float)
+    if not grid.size:
+        return {}
+    tolerance = 0.25 * float(np.min(np.diff(grid))) if grid.size > 1 else 1e-3
+    rowsByAlpha = {}
+    for row in rows:
+        index = int(np.argmin(np.abs(grid - row['alpha'])))
+        if abs(grid[index] - row['alpha']) <= tolerance:
+            rowsByAlpha[float(grid[index])] = row
+    return rowsByAlpha
+
+def missingAlphaSegments(expectedAlphas,convergedAlphas) -> list:
+    # Groups the missing angles into runs of neighbors on the expected grid. Each run is swept
+    # from the converged grid angle just below it (or above it, marching down, when there is none),
+    # through the missing angles themselves, so every retried angle stays on the grid.
+    expectedAlphas = sorted(expectedAlphas)
+    converged = set(convergedAlphas)
+
+    segments = []
+    run = []
+    for index,alpha in enumerate(expectedAlphas + [None]):
+        if alpha is not None and alpha not in converged:
+            run.append(alpha)
+            continue
+        if run:
+            below = index - len(run) - 1
+            if below >= 0:
+                segments += aseqSegmentsThrough([expectedAlphas[below]] + run)
+            elif alpha is not None:
+                segments += aseqSegmentsThrough([alpha] + run[::-1])
+            run = []
+    return segments
+
+def recoverMissingAlphas(airfoilName: str,re: float,expectedAlphas,rowsByAlpha: dict) -> int:
+    # Retries only the expected angles absent from rowsByAlpha (non-converged, or lost to a
+    # timeout), with more iterations each round. Recovered rows are added to rowsByAlpha.
+    # rowsByAlpha is keyed by grid angle (see snapRowsToGrid).
+    expectedAlphas = sorted(set(expectedAlphas))
+    recovered = 0
+    for attempt in range(1,XFOIL_RETRY_ROUNDS + 1):
+        missing = [alpha for alpha in expectedAlphas if alpha not in rowsByAlpha]
+        segments = missingAlphaSegments(expectedAlphas,rowsByAlpha.keys())
+        if not missing or not segments:
+            break
+        iterations = XFOIL_ITERATIONS * XFOIL_RETRY_ITERATION_FACTOR ** attempt
+        script = buildXfoilCommand(airfoilName,re,None,airfoilDAT=Path("airfoil.dat"),
+                                   polarFile=Path("polar.pol"),aseqSegments=segments,
+                                   iterations=iterations,reinitialize=True)
+        if VERBOSE:
+            print(f"[DEBUG] Retry {attempt} for {airfoilName}: {len(missing)} missing angles, "
+                  f"ITER {iterations}, segments {segments}\n")
+        _,polarText,runRecord = executeXfoilScript(airfoilName,re,script,kind="retry",requested=len(missing))
+
+        roundRecovered = 0
+        retried = snapRowsToGrid(parsePolarRows(polarText.splitlines()),expectedAlphas) if polarText else {}
+        for alpha,row in retried.items():
+            if alpha not in rowsByAlpha:
+                rowsByAlpha[alpha] = row
+                roundRecovered += 1
+        runRecord['recovered'] = roundRecovered
+        recovered += roundRecovered
+    return recovered
+
+@TRACER.traced(category="xfoil",items=lambda polarFile: int(polarFile is not None),
+               details=lambda airfoilName,re,aoaRange: {"airfoil": airfoilName,"re": re})
+def runXfoil(airfoilName,re,aoaRange):
+    if ADAPTIVE_AOA:
+        return runXfoilAdaptive(airfoilName,re,aoaRange)
 
     polarFile = rawDirectory / f"{airfoilName}_Re{int(re)}.pol"
-    polarExists = polarFile.exists()
+    airfoilDAT = xfoilGeometryFile(airfoilName)
+    script = buildXfoilCommand(airfoilName,re,aoaRange,
+                               airfoilDAT=Path("airfoil.dat"),polarFile=Path("polar.pol"))
+
+    cacheKey = polarCacheKey(airfoilDAT,script) if POLAR_CACHE else None
+    if cacheKey is not None and loadCachedPolar(cacheKey,polarFile):
+        print(f"[PROGRAM] Using cached polar for {airfoilName} at Re={re:.0f}.\n")
+        return polarFile
 
-    if not polarExists:
+    print(f"[PROGRAM] Running XFoil for {airfoilName} at Re={re:.0f}...\n")
+    aoaList = list(aoaRange)
+    result,polarText,runRecord = executeXfoilScript(airfoilName,re,script,requested=len(aoaList))
+
+    if polarText is not None and XFOIL_RETRY_ROUNDS:
+        rowsByAlpha = snapRowsToGrid(parsePolarRows(polarText.splitlines()),aoaList)
+        recovered = recoverMissingAlphas(airfoilName,re,aoaList,rowsByAlpha)
+        if recovered:
+            print(f"[PROGRAM] Recovered {recovered} non-converged angles for {airfoilName}.\n")
+            rows = [rowsByAlpha[alpha] for alpha in sorted(rowsByAlpha)]
+            polarText = formatPolarText(airfoilName.upper(),re,rows)
+
+    if polarText is None:
         print(f"[ERROR] XFoil did not produce a polar file for {airfoilName}.\n")
         print(f"         Expected: {polarFile}\n")
         if VERBOSE:
             print(f"[DEBUG] XFoil STDOUT:\n",result.stdout)
             print(f"[DEBUG] XFoil STDERR:\n",result.stderr)
-        return
-    
+        return None
+
+    # Replacing (rather than appending to) the previous polar keeps reruns from mixing rows
+    pendingPolar = polarFile.with_suffix(f".{threading.get_ident()}.tmp")
+    pendingPolar.write_text(polarText,encoding="utf-8")
+    os.replace(pendingPolar,polarFile)
+
+    # A polar cut short by the watchdog is kept for this run but never cached
+    if cacheKey is not None and not runRecord['timedOut']:
+        storeCachedPolar(cacheKey,polarFile)
+
     if result.returncode != 0:
         print(
             f"[WARNING] XFoil returned nonzero exit code ({result.returncode}) "
@@ -159,65 +531,529 @@ def runXfoil(airfoilName,re,aoaRange):
     else:
         if VERBOSE:
             print(f"[DEBUG] XFoil completed cleanly for {airfoilName}.\n")
-    
+
     print(f"[PROGRAM] XFoil process complete for {airfoilName}.\n")
+    return polarFile
+
+# ===== Adaptive AoA Refinement ===== #
+def findRefinementIntervals(alpha: np.ndarray,cl: np.ndarray,cd: np.ndarray) -> list:
+    # alpha is sorted. Flags the spans around high Cl curvature, large relative Cd jumps and
+    # the Cl peak, up to one point past the peak (deep post-stall detail is not scored);
+    # returns merged (start, end) spans.
+    if alpha.size < 3:
+        return [(float(alpha[0]),float(alpha[-1]))] if alpha.size else []
+
+    slopes = np.diff(cl) / np.diff(alpha)
+    curvature = np.abs(np.diff(slopes)) / (0.5 * (alpha[2:] - alpha[:-2]))
+    curved = np.flatnonzero(curvature > ADAPTIVE_CL_CURVATURE)
+    cdChange = np.abs(np.diff(cd)) / (0.5 * (cd[1:] + cd[:-1]))
+    dragJumps = np.flatnonzero(cdChange > ADAPTIVE_CD_CHANGE)
+    peak = int(np.argmax(cl))
+    limit = float(alpha[min(peak + 1,alpha.size - 1)])
+
+    starts = np.concatenate([alpha[curved],alpha[dragJumps],[alpha[max(peak - 1,0)]]])
+    ends = np.concatenate([alpha[curved + 2],alpha[dragJumps + 1],[limit]])
+    keep = starts < limit
+    starts,ends = starts[keep],np.minimum(ends[keep],limit)
+
+    intervals = []
+    for start,end in sorted(zip(starts.tolist(),ends.tolist())):
+        if intervals and start <= intervals[-1][1]:
+            intervals[-1] = (intervals[-1][0],max(intervals[-1][1],end))
+        else:
+            intervals.append((start,end))
+    return intervals
+
+def adaptiveGridAlphas(aStart: float,aEnd: float,fineStep: float) -> list:
+    # The lattice aStart + k * fineStep every adaptive pass samples from, plus aEnd when the span
+    # is not a whole number of fine steps (the last coarse step is clipped to the interval)
+    aStart,aEnd = float(aStart),float(aEnd)
+    count = int(np.floor((aEnd - aStart) / fineStep + 1e-9))
+    gridAlphas = [round(aStart + index * fineStep,6) for index in range(count + 1)]
+    if aEnd - gridAlphas[-1] > 1e-6:
+        gridAlphas.append(round(float(aEnd),6))
+    return gridAlphas
+
+def runXfoilAdaptive(airfoilName,re,aoaRange):
+    polarFile = rawDirectory / f"{airfoilName}_Re{int(re)}.pol"
+    airfoilDAT = xfoilGeometryFile(airfoilName)
+    aoaList = list(aoaRange)
 
-for candidate in AIRFOILS:
-    runXfoil(candidate,RE,AOA_RANGE)
+    # Pass n takes every 2**(levels - n)-th lattice index, i.e. a step of ADAPTIVE_COARSE_STEP / 2**n
+    levels = 0
+    while ADAPTIVE_COARSE_STEP / 2 ** levels > ADAPTIVE_FINE_STEP + 1e-9:
+        levels += 1
+    gridAlphas = adaptiveGridAlphas(aoaList[0],aoaList[-1],ADAPTIVE_COARSE_STEP / 2 ** levels)
+    gridIndex = {alpha: index for index,alpha in enumerate(gridAlphas)}
+
+    def passPlan(spans,stride):
+        # (ASEQ segments, angles) for one pass over (first, last) lattice index spans
+        segments,passAlphas = [],[]
+        for first,last in spans:
+            spanAlphas = [gridAlphas[index] for index in range(first,last,stride)] + [gridAlphas[last]]
+            segments += aseqSegmentsThrough(spanAlphas)
+            passAlphas += spanAlphas
+        return segments,passAlphas
+
+    # The cache key covers the first pass plus every refinement setting
+    level = 0
+    segments,passAlphas = passPlan([(0,len(gridAlphas) - 1)],2 ** levels)
+    firstScript = buildXfoilCommand(airfoilName,re,aoaRange,airfoilDAT=Path("airfoil.dat"),
+                                    polarFile=Path("polar.pol"),aseqSegments=segments)
+    adaptiveSettings = (f"\nADAPTIVE {ADAPTIVE_COARSE_STEP} {ADAPTIVE_FINE_STEP} "
+                        f"{ADAPTIVE_CL_CURVATURE} {ADAPTIVE_CD_CHANGE}")
+    cacheKey = polarCacheKey(airfoilDAT,firstScript + adaptiveSettings) if POLAR_CACHE else None
+    if cacheKey is not None and loadCachedPolar(cacheKey,polarFile):
+        print(f"[PROGRAM] Using cached polar for {airfoilName} at Re={re:.0f}.\n")
+        return polarFile
+
+    print(f"[PROGRAM] Running adaptive XFoil sweep for {airfoilName} at Re={re:.0f}...\n")
+    rowsByAlpha = {}
+    passCount = 0
+    while True:
+        # Refinement spans start on an angle an earlier pass converged; INIT makes each span
+        # march from there instead of from wherever the previous span ended (often past stall)
+        script = buildXfoilCommand(airfoilName,re,aoaRange,airfoilDAT=Path("airfoil.dat"),
+                                   polarFile=Path("polar.pol"),aseqSegments=segments,
+                                   reinitialize=level > 0)
+        _,polarText,_ = executeXfoilScript(airfoilName,re,script,kind="adaptive",requested=len(passAlphas))
+        passCount += 1
+        if polarText is not None:
+            # Later (finer) passes overwrite repeated angles
+            rowsByAlpha.update(snapRowsToGrid(parsePolarRows(polarText.splitlines()),passAlphas))
+            recoverMissingAlphas(airfoilName,re,passAlphas,rowsByAlpha)
+        if VERBOSE:
+            print(f"[DEBUG] Adaptive pass {passCount} for {airfoilName}: {segments}\n")
+
+        if level >= levels or not rowsByAlpha:
+            break
+        alphas = sorted(rowsByAlpha)
+        intervals = findRefinementIntervals(
+            np.array(alphas),
+            np.array([rowsByAlpha[alpha]['cl'] for alpha in alphas]),
+            np.array([rowsByAlpha[alpha]['cd'] for alpha in alphas]),
+        )
+        if not intervals:
+            break
+        level += 1
+        segments,passAlphas = passPlan([(gridIndex[start],gridIndex[end]) for start,end in intervals],
+                                       2 ** (levels - level))
+
+    if not rowsByAlpha:
+        print(f"[ERROR] XFoil did not produce a polar file for {airfoilName}.\n")
+        return None
+
+    rows = [rowsByAlpha[alpha] for alpha in sorted(rowsByAlpha)]
+    polarFile.write_text(formatPolarText(airfoilName.upper(),re,rows),encoding="utf-8")
+    if cacheKey is not None:
+        storeCachedPolar(cacheKey,polarFile)
+
+    print(f"[PROGRAM] Adaptive XFoil sweep complete for {airfoilName}: "
+          f"{len(rows)} points in {passCount} passes.\n")
+    return polarFile
+
+def runXfoilSessionSweep(jobs,workers: int = None):
+    if workers is None:
+        workers = XFOIL_WORKERS
+    # Same contract as runXfoilSweep, but cache misses are sent to a pool of persistent
+    # XFoil sessions and the listed polar rows are written out by Python.
+    jobs = list(jobs)
+    results = [None] * len(jobs)
+    pending = []
+    for index,(airfoilName,re,aoaRange) in enumerate(jobs):
+        polarFile = rawDirectory / f"{airfoilName}_Re{int(re)}.pol"
+        airfoilDAT = xfoilGeometryFile(airfoilName)
+        script = buildXfoilCommand(airfoilName,re,aoaRange,
+                                   airfoilDAT=Path("airfoil.dat"),polarFile=Path("polar.pol"))
+        cacheKey = polarCacheKey(airfoilDAT,script) if POLAR_CACHE else None
+        if cacheKey is not None and loadCachedPolar(cacheKey,polarFile):
+            print(f"[PROGRAM] Using cached polar for {airfoilName} at Re={re:.0f}.\n")
+            results[index] = polarFile
+            continue
+        pending.append((index,airfoilName,re,aoaRange,polarFile,airfoilDAT,cacheKey))
+
+    if not pending:
+        return results
+
+    if not xfoilExecutable.exists():
+        raise FileNotFoundError(
+            f"XFoil executable not found at {xfoilExecutable}.\n"
+            f"Place xfoil.exe in the xfoil directory and rerun.\n"
+        )
+
+    from xfoil_session import XfoilSessionPool
+    print(f"[PROGRAM] Running {len(pending)} XFoil cases on {min(workers,len(pending))} persistent sessions...\n")
+    with XfoilSessionPool(xfoilExecutable.resolve(),min(workers,len(pending)),scratchDirectory,
+                          iterations=XFOIL_ITERATIONS,repanel=XFOIL_INPUT_PANELS is None) as pool:
+        caseRows = pool.runCases([(airfoilDAT,re,aoaRange) for _,_,re,aoaRange,_,airfoilDAT,_ in pending])
+
+    for (index,airfoilName,re,aoaRange,polarFile,airfoilDAT,cacheKey),rows in zip(pending,caseRows):
+        if not rows:
+            print(f"[ERROR] XFoil session returned no polar rows for {airfoilName} at Re={re:.0f}.\n")
+            continue
+        polarFile.write_text(formatPolarText(airfoilName.upper(),re,rows),encoding="utf-8")
+        if cacheKey is not None:
+            storeCachedPolar(cacheKey,polarFile)
+        results[index] = polarFile
+        print(f"[PROGRAM] XFoil session complete for {airfoilName} ({len(rows)} points).\n")
+
+    return results
+
+def runXfoilSweep(jobs,workers: int = None):
+    # Runs (airfoilName, re, aoaRange) jobs concurrently. Each job is its own XFoil process,
+    # so a thread pool is enough to keep every worker's XFoil busy. Results are returned
+    # in job order regardless of completion order, matching a serial sweep.
+    if workers is None:
+        workers = XFOIL_WORKERS
+    jobs = list(jobs)
+    if XFOIL_SESSIONS and not ADAPTIVE_AOA: # Adaptive passes are scripted per process
+        return runXfoilSessionSweep(jobs,workers)
+    if workers <= 1 or len(jobs) <= 1:
+        return [runXfoil(airfoilName,re,aoaRange) for airfoilName,re,aoaRange in jobs]
+
+    print(f"[PROGRAM] Running {len(jobs)} XFoil jobs on {min(workers,len(jobs))} workers...\n")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(runXfoil,airfoilName,re,aoaRange) for airfoilName,re,aoaRange in jobs]
+        return [future.result() for future in futures]
 
 # ============================== #
-#|   LOAD DATAFRAMES AND MERGE  |#
+#|          SWEEP GRID          |#
 # ============================== #
-def parsePolar(airfoilName):
-    polarFile = rawDirectory / f"{airfoilName}_Re{int(RE)}.pol"
-    if not polarFile.exists():
-        raise FileNotFoundError(f"Polar file not found: {polarFile}\n")
-    
-    rows = []
-    with polarFile.open() as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("#") or line.startswith("-----"):
-                continue
-            parts = line.split()
-            if len(parts) != 7:
-                continue
-            try:
-                alpha = float(parts[0])
-                cl = float(parts[1])
-                cd = float(parts[2])
-                cdp = float(parts[3]) # Pressure Drag Coefficient
-                cm = float(parts[4])
-                topXtr = float(parts[5])
-                botXtr = float(parts[6])
-                rows.append({
-                    "alpha": alpha,
-                    "cl": cl,
-                    "cd": cd,
-                    "cdp": cdp,
-                    "cm": cm,
-                    "top_xtr": topXtr,
-                    "bot_xtr": botXtr,
-                })
-            except ValueError:
+# Each airfoil's whole (Re, Mach, Ncrit) grid is one scheduled job: a single XFoil process
+# (or session) loads and panels the geometry once and runs every uncached grid point.
+def buildSweepGrid(reynoldsValues,machValues,ncritValues) -> list:
+    return [(float(re),float(mach),float(ncrit))
+            for re,mach,ncrit in itertools.product(reynoldsValues,machValues,ncritValues)]
+
+def buildXfoilGridCommand(airfoilDAT: Path,gridPoints,aoaRange,polarFiles) -> str:
+    cmdLines = [
+        f"LOAD {airfoilDAT}",
+        "",
+        *xfoilPanelingCommands(),
+        "",
+        "PLOP",
+        "G",
+        "",
+        "OPER",
+    ]
+    for pointIndex,((re,mach,ncrit),polarFile) in enumerate(zip(gridPoints,polarFiles)):
+        # VISC toggles viscous mode, so only the first point uses it; RE changes Re afterwards
+        cmdLines.append(f"VISC {int(re)}" if pointIndex == 0 else f"RE {int(re)}")
+        cmdLines += [
+            f"MACH {mach}",
+            "VPAR",
+            f"N {ncrit}",
+            "",
+            f"ITER {XFOIL_ITERATIONS}",
+            "PACC",
+            f"{polarFile}",
+            "", # No dump file
+            "INIT",
+            aseqCommand(aoaRange),
+            "PACC",
+            "PDEL 1", # XFoil only holds a handful of polars in memory
+        ]
+    cmdLines += ["","QUIT",""]
+    return "\n".join(cmdLines)
+
+def loadCachedPolarRows(key: str):
+    cachedPolar = polarCacheDirectory / f"{key}.pol"
+    if not cachedPolar.exists():
+        return None
+    os.utime(cachedPolar)
+    return parsePolarRows(cachedPolar.read_text(encoding="utf-8").splitlines())
+
+@TRACER.traced(category="xfoil",items=lambda result: len(result[0]),
+               details=lambda airfoilName,gridPoints,aoaRange: {"airfoil": airfoilName,"gridPoints": len(gridPoints)})
+def runXfoilGridProcess(airfoilName: str,gridPoints,aoaRange):
+    # Returns (rows per grid point, timedOut). The watchdog allows XFOIL_TIMEOUT per grid point.
+    scratchDirectory.mkdir(parents=True,exist_ok=True)
+    jobDirectory = Path(tempfile.mkdtemp(prefix=f"{airfoilName}_grid_",dir=scratchDirectory))
+    shutil.copyfile(xfoilGeometryFile(airfoilName),jobDirectory / "airfoil.dat")
+    polarFiles = [Path(f"polar_{index:03d}.pol") for index in range(len(gridPoints))]
+    script = buildXfoilGridCommand(Path("airfoil.dat"),gridPoints,aoaRange,polarFiles)
+    if VERBOSE:
+        print(f"[DEBUG] XFoil grid script for {airfoilName}:\n{script}\n")
+
+    try:
+        timeout = None if XFOIL_TIMEOUT is None else XFOIL_TIMEOUT * len(gridPoints)
+        result,seconds,timedOut = runXfoilProcess(script,jobDirectory,f"{airfoilName} grid",timeout)
+        pointRows = []
+        for polarFile in polarFiles:
+            scratchPolar = jobDirectory / polarFile
+            if scratchPolar.exists():
+                pointRows.append(parsePolarRows(scratchPolar.read_text(encoding="utf-8").splitlines()))
+            else:
+                pointRows.append([])
+    finally:
+        shutil.rmtree(jobDirectory,ignore_errors=True)
+    recordXfoilRun(
+        airfoil=airfoilName,re=np.nan,kind="grid",seconds=seconds,timedOut=timedOut,
+        returnCode=result.returncode,requested=len(gridPoints) * len(list(aoaRange)),
+        converged=sum(len(rows) for rows in pointRows),recovered=0,
+    )
+    return pointRows,timedOut
+
+@TRACER.traced("sweepGrid",items=len)
+def runSweepGrid(airfoils,gridPoints,aoaRange,workers: int = None) -> pd.DataFrame:
+    if workers is None:
+        workers = XFOIL_WORKERS
+    gridPoints = list(gridPoints)
+    results = {} # (airfoilName, gridIndex) -> rows
+    pending = {} # airfoilName -> [(gridIndex, cacheKey)]
+    for airfoilName in airfoils:
+        airfoilDAT = xfoilGeometryFile(airfoilName)
+        for gridIndex,(re,mach,ncrit) in enumerate(gridPoints):
+            script = buildXfoilCommand(airfoilName,re,aoaRange,airfoilDAT=Path("airfoil.dat"),
+                                       polarFile=Path("polar.pol"),mach=mach,ncrit=ncrit)
+            cacheKey = polarCacheKey(airfoilDAT,script) if POLAR_CACHE else None
+            cachedRows = loadCachedPolarRows(cacheKey) if cacheKey is not None else None
+            if cachedRows is not None:
+                results[(airfoilName,gridIndex)] = cachedRows
+            else:
+                pending.setdefault(airfoilName,[]).append((gridIndex,cacheKey))
+
+    pointCount = sum(len(points) for points in pending.values())
+    print(f"[PROGRAM] Sweep grid: {len(airfoils)} airfoils x {len(gridPoints)} points, "
+          f"{len(airfoils) * len(gridPoints) - pointCount} cached, {pointCount} to run.\n")
+
+    if pending and not xfoilExecutable.exists():
+        raise FileNotFoundError(
+            f"XFoil executable not found at {xfoilExecutable}.\n"
+            f"Place xfoil.exe in the xfoil directory and rerun.\n"
+        )
+
+    def storeRows(airfoilName,gridIndex,cacheKey,rows,timedOut=False):
+        results[(airfoilName,gridIndex)] = rows
+        # Rows from a grid cut short by the watchdog are kept for this run but never cached
+        if cacheKey is not None and rows and not timedOut:
+            re,mach,ncrit = gridPoints[gridIndex]
+            pendingPolar = scratchDirectory / f"{cacheKey}.pol"
+            pendingPolar.write_text(formatPolarText(airfoilName.upper(),re,rows,mach=mach,ncrit=ncrit),encoding="utf-8")
+            storeCachedPolar(cacheKey,pendingPolar)
+            pendingPolar.unlink(missing_ok=True)
+
+    if pending and XFOIL_SESSIONS:
+        from xfoil_session import XfoilSessionPool
+        cases = []
+        sessionCases = []
+        for airfoilName,points in pending.items():
+            for gridIndex,cacheKey in points:
+                re,mach,ncrit = gridPoints[gridIndex]
+                cases.append((airfoilName,gridIndex,cacheKey))
+                sessionCases.append((xfoilGeometryFile(airfoilName),re,aoaRange,mach,ncrit))
+        with XfoilSessionPool(xfoilExecutable.resolve(),min(workers,len(pending)),scratchDirectory,
+                              iterations=XFOIL_ITERATIONS,repanel=XFOIL_INPUT_PANELS is None) as pool:
+            caseRows = pool.runCases(sessionCases)
+        for (airfoilName,gridIndex,cacheKey),rows in zip(cases,caseRows):
+            storeRows(airfoilName,gridIndex,cacheKey,rows)
+    elif pending:
+        def runAirfoilGrid(airfoilName):
+            points = pending[airfoilName]
+            print(f"[PROGRAM] Running XFoil grid for {airfoilName} ({len(points)} points)...\n")
+            pointRows,timedOut = runXfoilGridProcess(airfoilName,[gridPoints[gridIndex] for gridIndex,_ in points],aoaRange)
+            return airfoilName,points,pointRows,timedOut
+
+        with ThreadPoolExecutor(max_workers=max(1,min(workers,len(pending)))) as executor:
+            for airfoilName,points,pointRows,timedOut in executor.map(runAirfoilGrid,list(pending)):
+                for (gridIndex,cacheKey),rows in zip(points,pointRows):
+                    storeRows(airfoilName,gridIndex,cacheKey,rows,timedOut)
+
+    frames = []
+    for airfoilName in airfoils:
+        for gridIndex,(re,mach,ncrit) in enumerate(gridPoints):
+            rows = results.get((airfoilName,gridIndex))
+            if not rows:
+                print(f"[WARNING] No polar for {airfoilName} at Re={re:.0f}, Mach={mach}, Ncrit={ncrit}.\n")
                 continue
-    dataframe = pd.DataFrame(rows)
-    outCSV = processedDirectory / f"{airfoilName}_polar.csv"
-    dataframe.to_csv(outCSV,index=False)
-    print(f"[PROGRAM] Saved processed polar CSV for {airfoilName} to {outCSV}.\n")
-    return dataframe
-
-dataframes = []
-for candidate in AIRFOILS:
-    dataframe = parsePolar(candidate)
-    dataframe['airfoil'] = candidate.upper()
-    dataframes.append(dataframe)
-
-allPolars = pd.concat(dataframes,ignore_index=True)
-allPolars['cl_cd'] = allPolars['cl'] / allPolars['cd']
-print(f"[PROGRAM] Combined polar dataframe shape:",allPolars.shape)
+            frame = pd.DataFrame(rows)
+            frame.insert(0,"airfoil",airfoilName.upper())
+            frame.insert(1,"re",re)
+            frame.insert(2,"mach",mach)
+            frame.insert(3,"ncrit",ncrit)
+            frames.append(frame)
+
+    gridPolars = pd.concat(frames,ignore_index=True) if frames else pd.DataFrame()
+    writeSweepStore(gridPolars)
+    return gridPolars
+
+# ===== Indexed Polar Store ===== #
+# All grid points for all airfoils live in one SQLite table indexed by
+# (airfoil, re, mach, ncrit, alpha) instead of one .pol file per point.
+def writeSweepStore(gridPolars: pd.DataFrame,storePath: Path = None) -> None:
+    if gridPolars.empty:
+        return
+    if storePath is None:
+        storePath = sweepStorePath
+    columns = ["airfoil","re","mach","ncrit","alpha","cl","cd","cdp","cm","top_xtr","bot_xtr"]
+    connection = sqlite3.connect(storePath)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS polars ("
+            "airfoil TEXT, re REAL, mach REAL, ncrit REAL, alpha REAL, "
+            "cl REAL, cd REAL, cdp REAL, cm REAL, top_xtr REAL, bot_xtr REAL, "
+            "PRIMARY KEY (airfoil, re, mach, ncrit, alpha))"
+        )
+        # Replace whole grid points so a rerun never mixes old and new rows
+        points = gridPolars[["airfoil","re","mach","ncrit"]].drop_duplicates()
+        connection.executemany(
+            "DELETE FROM polars WHERE airfoil = ? AND re = ? AND mach = ? AND ncrit = ?",
+            points.itertuples(index=False,name=None)
+        )
+        connection.executemany(
+            f"INSERT OR REPLACE INTO polars ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            gridPolars[columns].itertuples(index=False,name=None)
+        )
+    connection.close()
+    print(f"[PROGRAM] Stored {len(gridPolars)} sweep grid rows in {storePath}.\n")
+
+def loadSweepStore(airfoil: str = None,storePath: Path = None) -> pd.DataFrame:
+    if storePath is None:
+        storePath = sweepStorePath
+    if not storePath.exists():
+        return pd.DataFrame()
+    query = "SELECT * FROM polars"
+    parameters = ()
+    if airfoil is not None:
+        query += " WHERE airfoil = ?"
+        parameters = (airfoil.upper(),)
+    connection = sqlite3.connect(storePath)
+    try:
+        return pd.read_sql_query(query + " ORDER BY airfoil, re, mach, ncrit, alpha",connection,params=parameters)
+    finally:
+        connection.close()
+
+# ============================== #
+#|        POLAR SURROGATE       |#
+# ============================== #
+@TRACER.traced("surrogate",items=lambda surrogate: len(surrogate.names()))
+def surrogateStage(airfoils=None,mach: float = None,ncrit: float = None) -> "PolarSurrogate":
+    # Lookup tables over every Re available per airfoil: the cruise polar plus the sweep grid
+    # rows at one (Mach, Ncrit) pair, which default to the first SWEEP_MACH / SWEEP_NCRIT values
+    from polar_surrogate import PolarSurrogate
+    if airfoils is None:
+        airfoils = AIRFOILS
+    if mach is None:
+        mach = SWEEP_MACH[0]
+    if ncrit is None:
+        ncrit = SWEEP_NCRIT[0]
+    names = [candidate.upper() for candidate in airfoils]
+
+    cruisePolars = loadProcessedPolars(airfoils)
+    cruisePolars['re'] = RE
+    sources = [cruisePolars]
+    sweepPolars = loadSweepStore()
+    if not sweepPolars.empty:
+        selected = (sweepPolars['airfoil'].isin(names)
+                    & np.isclose(sweepPolars['mach'],mach) & np.isclose(sweepPolars['ncrit'],ncrit))
+        sources.insert(0,sweepPolars[selected])
+    polars = pd.concat(sources,ignore_index=True)
+    polars = polars.drop_duplicates(subset=['airfoil','re','alpha'],keep='last')
+
+    startTime = time.perf_counter()
+    surrogate = PolarSurrogate.fromPolars(polars[['airfoil','re','alpha','cl','cd','cm']])
+    outPath = surrogate.save(surrogatePath)
+    print(f"[PROGRAM] Built polar surrogate for {len(surrogate.names())} airfoils in "
+          f"{time.perf_counter() - startTime:.2f} s and saved it to {outPath}.\n")
+    if VERBOSE:
+        for name in surrogate.names():
+            entry = surrogate.airfoils[name]
+            print(f"[DEBUG] {name}: {len(entry['alpha'])} alphas x {len(entry['re'])} Re "
+                  f"({entry['re'].min():.0f} to {entry['re'].max():.0f}).\n")
+    return surrogate
+
+# ============================== #
+#|      PANEL PRE-FILTER        |#
+# ============================== #
+@TRACER.traced("prefilter",items=len)
+def prefilterStage(airfoils=None) -> list:
+    # Returns the airfoils passing the inviscid bands and saves the full table for reference
+    if airfoils is None:
+        airfoils = AIRFOILS
+    from panel_method import panelScreen
+    inviscid = panelScreen(airfoils,geometryDirectory,cacheDirectory=geometryCacheDirectory)
+    inviscid['passed'] = (
+        inviscid['alphaZeroLift'].between(*PANEL_ALPHA_ZERO_LIFT_RANGE)
+        & inviscid['cmQuarterChord'].between(*PANEL_CM_RANGE)
+    )
+    inviscid.to_csv(processedDirectory / "panel_prefilter.csv")
+
+    passed = [candidate for candidate in inviscid.index if inviscid.at[candidate,'passed']]
+    print(f"[PROGRAM] Panel pre-filter passed {len(passed)} of {len(airfoils)} airfoils.\n")
+    if VERBOSE:
+        print(inviscid.round(4).to_string(),"\n")
+    return passed
+
+# ============================== #
+#|   LOAD DATAFRAMES AND MERGE  |#
+# ============================== #
+def processedPolarTablePath() -> Path:
+    suffix = f".{POLAR_COLUMNAR_FORMAT}" if POLAR_COLUMNAR_FORMAT else ".csv"
+    return processedDirectory / f"polars{suffix}"
+
+@TRACER.traced("parse",items=len)
+def parseStage(airfoils=None) -> pd.DataFrame:
+    # Reads every polar in one readPolarTable pass and writes them as a single table
+    if airfoils is None:
+        airfoils = AIRFOILS
+    polarFiles = [rawDirectory / f"{candidate}_Re{int(RE)}.pol" for candidate in airfoils]
+    for polarFile in polarFiles:
+        if not polarFile.exists():
+            raise FileNotFoundError(f"Polar file not found: {polarFile}\n")
+
+    table = readPolarTable(polarFiles,labels=[candidate.upper() for candidate in airfoils])
+    table = table.rename(columns={"polar": "airfoil"})
+
+    outTable = processedPolarTablePath()
+    pendingTable = outTable.with_name(f"{outTable.stem}.{os.getpid()}.tmp{outTable.suffix}")
+    if POLAR_COLUMNAR_FORMAT:
+        # Airfoil names as a fixed-width string array, so the .npz loads without pickle
+        columns = {column: table[column].to_numpy(dtype=str if column == 'airfoil' else None)
+                   for column in table.columns}
+        writeColumnarPolar(pendingTable,columns,fileFormat=POLAR_COLUMNAR_FORMAT)
+    else:
+        table.to_csv(pendingTable,index=False)
+    os.replace(pendingTable,outTable)
+    print(f"[PROGRAM] Saved {len(airfoils)} processed polars ({len(table)} rows) to {outTable}.\n")
+
+    if PER_AIRFOIL_POLAR_CSV:
+        candidates = {candidate.upper(): candidate for candidate in airfoils}
+        for airfoilName,dataframe in table.groupby('airfoil',sort=False):
+            dataframe[list(POLAR_COLUMNS)].to_csv(processedDirectory / f"{candidates[airfoilName]}_polar.csv",index=False)
+    return combinePolars([table[list(POLAR_COLUMNS) + ['airfoil']]])
+
+@TRACER.traced("loadProcessed",items=len)
+def loadProcessedPolars(airfoils=None) -> pd.DataFrame:
+    # Reads the table written by parseStage (or, failing that, per-airfoil CSVs), so scoring
+    # and plotting can run without XFoil
+    if airfoils is None:
+        airfoils = AIRFOILS
+    names = [candidate.upper() for candidate in airfoils]
+    tablePath = processedPolarTablePath()
+    if tablePath.exists():
+        table = readColumnarPolar(tablePath) if POLAR_COLUMNAR_FORMAT else pd.read_csv(tablePath)
+        table['airfoil'] = table['airfoil'].astype(str)
+        if set(names) <= set(table['airfoil']):
+            table = table[table['airfoil'].isin(names)]
+            order = {name: index for index,name in enumerate(dict.fromkeys(names))}
+            table = table.iloc[np.argsort(table['airfoil'].map(order).to_numpy(),kind="stable")]
+            return combinePolars([table[list(POLAR_COLUMNS) + ['airfoil']]])
+
+    dataframes = []
+    for candidate in airfoils:
+        processedCSV = processedDirectory / f"{candidate}_polar.csv"
+        if not processedCSV.exists():
+            raise FileNotFoundError(f"Processed polar not found: {processedCSV}. Run the 'parse' stage first.\n")
+        dataframe = pd.read_csv(processedCSV)
+        dataframe['airfoil'] = candidate.upper()
+        dataframes.append(dataframe)
+    return combinePolars(dataframes)
+
+def combinePolars(dataframes) -> pd.DataFrame:
+    allPolars = pd.concat(dataframes,ignore_index=True)
+    allPolars['cl_cd'] = allPolars['cl'] / allPolars['cd']
+    print(f"[PROGRAM] Combined polar dataframe shape:",allPolars.shape)
+    return allPolars
 
 # ============================== #
 #|         STALL METRICS        |#
@@ -241,20 +1077,11 @@ def computeStallMetrics(dataframeAirfoil: pd.DataFrame):
     
     return alphaAtClMax,clMax,clDrop
 
-stallRows = []
-for candidate in AIRFOILS:
-    dataframeAirfoil = allPolars[allPolars['airfoil'] == candidate.upper()]
-    aMax,clMax,clDrop = computeStallMetrics(dataframeAirfoil)
-    stallRows.append({
-        "airfoil": candidate.upper(),
-        "alphaAtClMax": aMax,
-        "clMax": clMax,
-        "ClDropPostStall": clDrop,
-    })
-
-stallDataframe = pd.DataFrame(stallRows).set_index("airfoil")
-print(f"[PROGRAM] Stall characteristics summary:\n")
-print(stallDataframe.round(4))
+def buildStallTable(metrics: pd.DataFrame) -> pd.DataFrame:
+    stallDataframe = metrics[STALL_COLUMNS]
+    print(f"[PROGRAM] Stall characteristics summary:\n")
+    print(stallDataframe.round(4))
+    return stallDataframe
 
 # ============================== #
 #|        SLOPE BEHAVIOR        |#
@@ -314,10 +1141,13 @@ def estimateLiftCurveLinearRegion(dataframeAirfoil: pd.DataFrame):
 
 def plotLinearRegionDiagnostic(airfoilName: str,dataframeAirfoil: pd.DataFrame,
                                slope: float,intercept: float,alphaLinMin: float,
-                               alphaLinMax: float,alphaStall: float):
-    diagnosticDirectory = figureDirectory / "linear_region"
+                               alphaLinMax: float,alphaStall: float,
+                               diagnosticDirectory: Path = None,dpi: int = FIGURE_DPI):
+    if diagnosticDirectory is None:
+        diagnosticDirectory = figureDirectory / "linear_region"
     diagnosticDirectory.mkdir(parents=True,exist_ok=True)
-    
+    plt,sns = loadPlottingLibraries()
+
     fig,ax = plt.subplots(figsize=(7,5))
 
     sns.lineplot(
@@ -348,95 +1178,166 @@ def plotLinearRegionDiagnostic(airfoilName: str,dataframeAirfoil: pd.DataFrame,
     ax.legend(loc='best')
 
     fig.tight_layout()
-    fig.savefig(diagnosticDirectory / f"{airfoilName}_linear_region.png",dpi=300)
+    fig.savefig(diagnosticDirectory / f"{airfoilName}_linear_region.png",dpi=dpi)
     plt.close(fig)
 
-slopeRows = []
-for candidate in AIRFOILS:
-    dataframeAirfoil = allPolars[allPolars['airfoil'] == candidate.upper()]
-    slope,alphaLinMin,alphaLinMax,r2 = estimateLiftCurveLinearRegion(dataframeAirfoil)
-
-    slopeRows.append({
-        "airfoil": candidate.upper(),
-        "liftCurveSlope": slope,
-        "alphaLinearMin": alphaLinMin,
-        "alphaLinearMax": alphaLinMax,
-        "linearFitR2": r2,
-    })
-
-    if DIAGNOSTIC_LINEAR_PLOTS and not np.isnan(slope):
-        intercept = np.mean(dataframeAirfoil['cl'] - slope * dataframeAirfoil['alpha'])
-        plotLinearRegionDiagnostic(
-            candidate.upper(),
-            dataframeAirfoil,
-            slope,
-            intercept,
-            alphaLinMin,
-            alphaLinMax,
-            aMax,
-        )
-
-slopeDataframe = pd.DataFrame(slopeRows).set_index("airfoil")
-print(f"[PROGRAM] Approximate lift-curve slopes and linear regions (per degree):\n")
-print(slopeDataframe.round({
-    "liftCurveSlope": 4,
-    "alphaLinearMin": 1,
-    "alphaLinearMax": 1,
-    "linearFitR2": 3,
-}))
+def buildSlopeTable(metrics: pd.DataFrame) -> pd.DataFrame:
+    slopeDataframe = metrics[SLOPE_COLUMNS]
+    print(f"[PROGRAM] Approximate lift-curve slopes and linear regions (per degree):\n")
+    print(slopeDataframe.round({
+        "liftCurveSlope": 4,
+        "alphaLinearMin": 1,
+        "alphaLinearMax": 1,
+        "linearFitR2": 3,
+    }))
+    return slopeDataframe
 
 # ============================== #
 #|  MAKE GENERAL SUMMARY TABLE  |#
 # ============================== #
-summaryRows = []
-for candidate in AIRFOILS:
-    dataframe = allPolars[allPolars['airfoil'] == candidate.upper()].copy()
-    if dataframe.empty:
-        continue
-    
-    # --- Set Example Metrics --- #
-    maxCl = dataframe['cl'].max()
-    minCd = dataframe['cd'].min()
-    maxClCd = dataframe['cl_cd'].max()
-
-    # --- Approximate the Cruise Band Filter (e.g., -2° to +6°) --- #
-    cruiseDataframe = dataframe[(dataframe['alpha'] >= -2) & (dataframe['alpha'] <= 6)]
-    cruiseClCd = cruiseDataframe['cl_cd'].max() if not cruiseDataframe.empty else float("nan")
-
-    summaryRows.append({
-        "airfoil": candidate.upper(),
-        "maxCl": maxCl,
+def buildSummaryTable(metrics: pd.DataFrame) -> pd.DataFrame:
+    # Airfoils without any polar rows are left out of the summary, as before
+    summaryDataframe = metrics.loc[metrics['rowCount'] > 0,SUMMARY_COLUMNS]
+    print(f"\n[PROGRAM] Airfoil performance summary:\n")
+    print(summaryDataframe.round(4))
+    return summaryDataframe
+
+# ============================== #
+#|         METRIC ENGINE        |#
+# ============================== #
+# Computes every per-airfoil metric in one pass over the combined polar table instead of
+# filtering allPolars once per airfoil per stage. Rows are sorted by (airfoil, alpha) so
+# each airfoil is a contiguous block, and every statistic is a ufunc.reduceat or
+# np.bincount over those blocks. Results match computeStallMetrics and
+# estimateLiftCurveLinearRegion applied airfoil by airfoil.
+STALL_COLUMNS = ["alphaAtClMax","clMax","ClDropPostStall"]
+SLOPE_COLUMNS = ["liftCurveSlope","alphaLinearMin","alphaLinearMax","linearFitR2"]
+SUMMARY_COLUMNS = ["maxCl","minCd","maxClCd","maxClCd_cruiseBand"]
+CRUISE_BAND = (-2.0,6.0) # Approximate cruise band for the summary's Cl/Cd, in degrees
+LINEAR_ALPHA_MIN = -4.0 # Lower edge of the lift-curve fit window, in degrees
+LINEAR_STALL_MARGIN = 2.0 # The fit window stops this far below stall
+LINEAR_RESIDUAL_LIMIT = 0.8 # Points further than this from the first fit are dropped
+
+# ===== Metric Uncertainty ===== #
+# Stall and lift-curve metrics are recomputed on resampled polars to give confidence intervals
+UNCERTAINTY_SAMPLES = 200 # Resamples per airfoil; 0 to skip
+UNCERTAINTY_METHOD = "bootstrap" # "bootstrap" resamples polar points; "jitter" perturbs Cl/Cd within solver tolerance
+UNCERTAINTY_CONFIDENCE = 0.95
+UNCERTAINTY_CL_TOLERANCE = 0.005 # Absolute Cl jitter (1 sigma), "jitter" only
+UNCERTAINTY_CD_TOLERANCE = 0.02 # Relative Cd jitter (1 sigma), "jitter" only
+UNCERTAINTY_SEED = 0
+
+def groupReduce(ufunc,values: np.ndarray,mask: np.ndarray,starts: np.ndarray,fill: float) -> np.ndarray:
+    # ufunc over the masked values of each contiguous group; NaN where a group has no values
+    reduced = ufunc.reduceat(np.where(mask,values,fill),starts)
+    counts = np.add.reduceat(mask.astype(np.int64),starts)
+    return np.where(counts > 0,reduced,np.nan)
+
+def groupFirstMax(codes,alpha,values,mask,starts,groupCount):
+    # Group maximum and the alpha where it first occurs (rows are alpha-sorted per group)
+    groupMax = groupReduce(np.maximum,values,mask,starts,-np.inf)
+    isMax = mask & (values == groupMax[codes])
+    firstRows = np.flatnonzero(isMax)
+    firstGroups,firstIndex = np.unique(codes[firstRows],return_index=True)
+    alphaAtMax = np.full(groupCount,np.nan)
+    alphaAtMax[firstGroups] = alpha[firstRows[firstIndex]]
+    return alphaAtMax,groupMax
+
+def groupLeastSquares(codes,x,y,mask,groupCount):
+    # Closed-form straight-line fit per group over the masked rows, using centred sums
+    weights = mask.astype(float)
+    xMasked = np.where(mask,x,0.0)
+    yMasked = np.where(mask,y,0.0)
+    n = np.bincount(codes,weights=weights,minlength=groupCount)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        meanX = np.bincount(codes,weights=xMasked,minlength=groupCount) / n
+        meanY = np.bincount(codes,weights=yMasked,minlength=groupCount) / n
+        dx = np.where(mask,x - meanX[codes],0.0)
+        dy = np.where(mask,y - meanY[codes],0.0)
+        sxx = np.bincount(codes,weights=dx * dx,minlength=groupCount)
+        sxy = np.bincount(codes,weights=dx * dy,minlength=groupCount)
+        syy = np.bincount(codes,weights=dy * dy,minlength=groupCount)
+        slope = sxy / sxx
+        intercept = meanY - slope * meanX
+        residuals = np.where(mask,y - (slope[codes] * x + intercept[codes]),0.0)
+        ssResiduals = np.bincount(codes,weights=residuals * residuals,minlength=groupCount)
+    return slope,intercept,n,ssResiduals,syy,residuals
+
+@TRACER.traced("metrics",items=len)
+def computeAirfoilMetrics(allPolars: pd.DataFrame,airfoils=None) -> pd.DataFrame:
+    if airfoils is None:
+        airfoils = AIRFOILS
+    names = [candidate.upper() for candidate in airfoils]
+
+    codes,groupNames = pd.factorize(allPolars['airfoil'])
+    alpha = allPolars['alpha'].to_numpy(dtype=float)
+    order = np.lexsort((alpha,codes))
+    codes = codes[order]
+    alpha = alpha[order]
+    cl = allPolars['cl'].to_numpy(dtype=float)[order]
+    cd = allPolars['cd'].to_numpy(dtype=float)[order]
+    clCd = allPolars['cl_cd'].to_numpy(dtype=float)[order]
+    groupCount = len(groupNames)
+    starts = np.flatnonzero(np.r_[True,codes[1:] != codes[:-1]]) if len(codes) else np.empty(0,dtype=np.int64)
+
+    if groupCount == 0:
+        metrics = pd.DataFrame(index=pd.Index(names,name="airfoil"),
+                               columns=STALL_COLUMNS + SLOPE_COLUMNS + SUMMARY_COLUMNS,dtype=float)
+        metrics['rowCount'] = 0
+        return metrics
+
+    hasCl = ~np.isnan(cl)
+    hasCd = ~np.isnan(cd)
+    hasClCd = ~np.isnan(clCd)
+
+    # ===== Stall ===== #
+    alphaAtClMax,clMax = groupFirstMax(codes,alpha,cl,hasCl,starts,groupCount)
+    postStall = hasCl & (alpha > alphaAtClMax[codes])
+    clDrop = clMax - groupReduce(np.minimum,cl,postStall,starts,np.inf)
+
+    # ===== Summary ===== #
+    minCd = groupReduce(np.minimum,cd,hasCd,starts,np.inf)
+    maxClCd = groupReduce(np.maximum,clCd,hasClCd,starts,-np.inf)
+    cruise = hasClCd & (alpha >= CRUISE_BAND[0]) & (alpha <= CRUISE_BAND[1])
+    cruiseClCd = groupReduce(np.maximum,clCd,cruise,starts,-np.inf)
+
+    # ===== Lift-Curve Slope ===== #
+    valid = (cd > 0.0) & (cd < 5.0) & (np.abs(cl) < 3.5)
+    alphaStallValid,_ = groupFirstMax(codes,alpha,cl,valid,starts,groupCount)
+    alphaLimit = alphaStallValid - LINEAR_STALL_MARGIN
+    candidates = valid & (alpha >= LINEAR_ALPHA_MIN) & (alpha <= alphaLimit[codes])
+    slope,_,candidateCount,_,_,residuals = groupLeastSquares(codes,alpha,cl,candidates,groupCount)
+
+    linear = candidates & (np.abs(residuals) <= LINEAR_RESIDUAL_LIMIT)
+    linearCount = np.bincount(codes,weights=linear.astype(float),minlength=groupCount)
+    linear = np.where((linearCount < 3)[codes],candidates,linear)
+    slope,_,_,ssResiduals,ssTotal,_ = groupLeastSquares(codes,alpha,cl,linear,groupCount)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        r2 = np.where(ssTotal == 0,np.nan,1.0 - ssResiduals / ssTotal)
+
+    enoughPoints = candidateCount >= 3
+    metrics = pd.DataFrame({
+        "alphaAtClMax": alphaAtClMax,
+        "clMax": clMax,
+        "ClDropPostStall": clDrop,
+        "liftCurveSlope": np.where(enoughPoints,slope,np.nan),
+        "alphaLinearMin": np.where(enoughPoints,groupReduce(np.minimum,alpha,linear,starts,np.inf),np.nan),
+        "alphaLinearMax": np.where(enoughPoints,groupReduce(np.maximum,alpha,linear,starts,-np.inf),np.nan),
+        "linearFitR2": np.where(enoughPoints,r2,np.nan),
+        "maxCl": clMax,
         "minCd": minCd,
         "maxClCd": maxClCd,
         "maxClCd_cruiseBand": cruiseClCd,
-    })
+        "rowCount": np.diff(np.r_[starts,len(codes)]),
+    },index=pd.Index(groupNames,name="airfoil"))
 
-summaryDataframe = pd.DataFrame(summaryRows)
-summaryDataframe = summaryDataframe.set_index("airfoil")
-print(f"\n[PROGRAM] Airfoil performance summary:\n")
-print(summaryDataframe.round(4))
+    metrics = metrics.reindex(names)
+    metrics['rowCount'] = metrics['rowCount'].fillna(0).astype(int)
+    return metrics
 
 # ============================== #
 #|    MULTI-OBJECTIVE RANKINGS  |#
 # ============================== #
-combinedMetrics = (
-    summaryDataframe.join(stallDataframe,how='left').join(slopeDataframe,how='left')
-)
-
-combinedMetrics['loadMetric'] = combinedMetrics['liftCurveSlope'] * combinedMetrics['maxCl']
-
-combinedMetrics['N_alphaStall'] = normalizeSeries(combinedMetrics['alphaAtClMax'])
-combinedMetrics['N_ClDrop'] = normalizeSeries(combinedMetrics['ClDropPostStall'])
-combinedMetrics['N_maxCl'] = normalizeSeries(combinedMetrics['maxCl'])
-combinedMetrics['N_minCd'] = normalizeSeries(combinedMetrics['minCd'])
-combinedMetrics['N_maxClCdCruise'] = normalizeSeries(combinedMetrics['maxClCd_cruiseBand'])
-combinedMetrics['N_slope'] = normalizeSeries(combinedMetrics['liftCurveSlope'])
-combinedMetrics['N_loadMetric'] = normalizeSeries(combinedMetrics['loadMetric'])
-
-slopeTarget = 0.10
-combinedMetrics['slopeDeviation'] = (combinedMetrics['liftCurveSlope'] - slopeTarget).abs()
-combinedMetrics['N_slopeDeviation'] = normalizeSeries(combinedMetrics['slopeDeviation'])
-
 # ===== PROJECT-SPECIFIC NOTES ===== #
 # For a forward swept wing configuration and prioritizing stability, we want:
 # --- STABILITY --- #
@@ -450,56 +1351,182 @@ combinedMetrics['N_slopeDeviation'] = normalizeSeries(combinedMetrics['slopeDevi
 #   - a strong slope for high control authority
 #   - a high max Cl for lift capacity
 #   - but penalize very high slope * maxCl loads
+slopeTarget = 0.10
 
+# ===== SCORE WEIGHTS ===== #
+# Each score is a weighted sum of normalized metrics: (weight, column, higher is better).
+# Terms where lower is better enter the sum as (1 - N_metric).
+SCORE_WEIGHTS = {
+    # ===== SCORE STABILITY ===== #
+    "scoreStability": [(0.4,'N_alphaStall',True),(0.4,'N_ClDrop',False),(0.2,'N_slopeDeviation',False)],
+    # ===== SCORE EFFICIENCY ===== #
+    "scoreEfficiency": [(0.7,'N_maxClCdCruise',True),(0.3,'N_minCd',False)],
+    # ===== SCORE MANEUVERABILITY VS. WING TORSION ===== #
+    "scoreManeuverTorsion": [(0.4,'N_slope',True),(0.3,'N_maxCl',True),(0.3,'N_loadMetric',False)],
+}
+
+# ===== WEIGHT SENSITIVITY ===== #
+# Weight vectors are drawn from Dirichlet(concentration * baseline weights); a larger
+# concentration keeps draws closer to SCORE_WEIGHTS, None draws uniformly.
+SENSITIVITY_SAMPLES = 100000
+SENSITIVITY_CONCENTRATION = 20.0
+SENSITIVITY_MAX_RANK = 5 # Rank-probability columns P(rank 1..n) and P(top k) up to this rank
+SENSITIVITY_SEED = 0
+
+# ===== PARETO FRONTIER ===== #
+# Weight-free view of the same goals: a candidate is Pareto-optimal when no other candidate
+# is at least as good on every objective below and strictly better on one.
+PARETO_OBJECTIVES = {
+    "alphaAtClMax": "max",
+    "ClDropPostStall": "min",
+    "slopeDeviation": "min",
+    "maxClCd_cruiseBand": "max",
+    "minCd": "min",
+    "maxCl": "max",
+}
+
+def scoreCandidates(summaryDataframe: pd.DataFrame,stallDataframe: pd.DataFrame,
+                    slopeDataframe: pd.DataFrame) -> pd.DataFrame:
+    combinedMetrics = (
+        summaryDataframe.join(stallDataframe,how='left').join(slopeDataframe,how='left')
+    )
 
-# ===== SCORE STABILITY ===== #
-combinedMetrics['scoreStability'] = (
-    0.4 * combinedMetrics['N_alphaStall'] +
-    0.4 * (1.0 - combinedMetrics['N_ClDrop']) +
-    0.2 * (1.0 - combinedMetrics['N_slopeDeviation'])
-)
-rankingStability = (
-    combinedMetrics[['scoreStability']].sort_values("scoreStability",ascending=False)
-)
-
-# ===== SCORE EFFICIENCY ===== #
-combinedMetrics['scoreEfficiency'] = (
-    0.7 * combinedMetrics['N_maxClCdCruise'] +
-    0.3 * (1.0 - combinedMetrics['N_minCd'])
-)
-rankingEfficiency = (
-    combinedMetrics[['scoreEfficiency']].sort_values("scoreEfficiency",ascending=False)
-)
-
-# ===== SCORE MANEUVERABILITY VS. WING TORSION ===== #
-combinedMetrics['scoreManeuverTorsion'] = (
-    0.4 * combinedMetrics['N_slope'] +
-    0.3 * combinedMetrics['N_maxCl'] +
-    0.3 * (1.0 - combinedMetrics['N_loadMetric'])
-)
-rankingManeuverTorsion = (
-    combinedMetrics[['scoreManeuverTorsion']].sort_values(by="scoreManeuverTorsion",ascending=False)
-)
-
-# ===== PRINT RANKINGS ===== #
-print(f"[PROGRAM] RANKING - Forward-Swept / Stability-Oriented (Score A):\n")
-print(rankingStability.round(3))
-
-print(f"\n[PROGRAM] RANKING - Efficiency (Score B):\n")
-print(rankingEfficiency.round(3))
-
-print(f"\n[PROGRAM] RANKING - Maneuverability vs. Torsion (Score C):\n")
-print(rankingManeuverTorsion.round(3))
-
-topStability = ", ".join(rankingStability.index[:2]) if not rankingStability.empty else ""
-topEfficiency = ", ".join(rankingEfficiency.index[:2]) if not rankingEfficiency.empty else ""
-topManeuver = ", ".join(rankingManeuverTorsion.index[:2]) if not rankingManeuverTorsion.empty else ""
+    combinedMetrics['loadMetric'] = combinedMetrics['liftCurveSlope'] * combinedMetrics['maxCl']
+
+    combinedMetrics['N_alphaStall'] = normalizeSeries(combinedMetrics['alphaAtClMax'])
+    combinedMetrics['N_ClDrop'] = normalizeSeries(combinedMetrics['ClDropPostStall'])
+    combinedMetrics['N_maxCl'] = normalizeSeries(combinedMetrics['maxCl'])
+    combinedMetrics['N_minCd'] = normalizeSeries(combinedMetrics['minCd'])
+    combinedMetrics['N_maxClCdCruise'] = normalizeSeries(combinedMetrics['maxClCd_cruiseBand'])
+    combinedMetrics['N_slope'] = normalizeSeries(combinedMetrics['liftCurveSlope'])
+    combinedMetrics['N_loadMetric'] = normalizeSeries(combinedMetrics['loadMetric'])
+
+    combinedMetrics['slopeDeviation'] = (combinedMetrics['liftCurveSlope'] - slopeTarget).abs()
+    combinedMetrics['N_slopeDeviation'] = normalizeSeries(combinedMetrics['slopeDeviation'])
+
+    for scoreColumn,terms in SCORE_WEIGHTS.items():
+        termMatrix = scoreTermMatrix(combinedMetrics,scoreColumn)
+        combinedMetrics[scoreColumn] = sum(weight * termMatrix[column] for weight,column,_ in terms)
+    return combinedMetrics
+
+def scoreTermMatrix(combinedMetrics: pd.DataFrame,scoreColumn: str) -> pd.DataFrame:
+    terms = {}
+    for _,column,higherIsBetter in SCORE_WEIGHTS[scoreColumn]:
+        terms[column] = combinedMetrics[column] if higherIsBetter else 1.0 - combinedMetrics[column]
+    return pd.DataFrame(terms,index=combinedMetrics.index)
+
+def rankCandidates(combinedMetrics: pd.DataFrame) -> dict:
+    rankings = {
+        scoreColumn: combinedMetrics[[scoreColumn]].sort_values(scoreColumn,ascending=False)
+        for scoreColumn in ["scoreStability","scoreEfficiency","scoreManeuverTorsion"]
+    }
+
+    # ===== PRINT RANKINGS ===== #
+    print(f"[PROGRAM] RANKING - Forward-Swept / Stability-Oriented (Score A):\n")
+    print(rankings["scoreStability"].round(3))
+
+    print(f"\n[PROGRAM] RANKING - Efficiency (Score B):\n")
+    print(rankings["scoreEfficiency"].round(3))
+
+    print(f"\n[PROGRAM] RANKING - Maneuverability vs. Torsion (Score C):\n")
+    print(rankings["scoreManeuverTorsion"].round(3))
+    return rankings
+
+@TRACER.traced("uncertainty",items=len)
+def uncertaintyStage(allPolars: pd.DataFrame,airfoils=None,samples: int = None,method: str = None) -> pd.DataFrame:
+    if airfoils is None:
+        airfoils = AIRFOILS
+    if samples is None:
+        samples = UNCERTAINTY_SAMPLES
+    if method is None:
+        method = UNCERTAINTY_METHOD
+
+    from metric_uncertainty import intervalTable,metricConfidenceIntervals
+    intervals = metricConfidenceIntervals(
+        allPolars,samples=samples,method=method,confidence=UNCERTAINTY_CONFIDENCE,seed=UNCERTAINTY_SEED,
+        alphaMin=LINEAR_ALPHA_MIN,stallMargin=LINEAR_STALL_MARGIN,residualLimit=LINEAR_RESIDUAL_LIMIT,
+        clTolerance=UNCERTAINTY_CL_TOLERANCE,cdTolerance=UNCERTAINTY_CD_TOLERANCE,
+    ).reindex([candidate.upper() for candidate in airfoils])
+    intervals.to_csv(processedDirectory / "metric_uncertainty.csv")
+    print(f"\n[PROGRAM] METRIC {UNCERTAINTY_CONFIDENCE:.0%} CONFIDENCE INTERVALS ({samples} {method} resamples):\n")
+    print(intervalTable(intervals).to_string(),"\n")
+    return intervals
+
+@TRACER.traced("score",items=lambda scores: len(scores["combined"]))
+def scoreStage(allPolars: pd.DataFrame,airfoils=None) -> dict:
+    metrics = computeAirfoilMetrics(allPolars,airfoils)
+    stallDataframe = buildStallTable(metrics)
+    slopeDataframe = buildSlopeTable(metrics)
+    summaryDataframe = buildSummaryTable(metrics)
+    combinedMetrics = scoreCandidates(summaryDataframe,stallDataframe,slopeDataframe)
+    rankings = rankCandidates(combinedMetrics)
+
+    uncertainty = uncertaintyStage(allPolars,airfoils) if UNCERTAINTY_SAMPLES > 0 else None
+
+    from pareto_ranking import paretoTable
+    paretoDataframe = paretoTable(combinedMetrics,PARETO_OBJECTIVES)[
+        list(PARETO_OBJECTIVES) + ['paretoLayer']
+    ].sort_values('paretoLayer')
+    print(f"\n[PROGRAM] PARETO LAYERS (0 = non-dominated) over {', '.join(PARETO_OBJECTIVES)}:\n")
+    print(paretoDataframe.round(4))
+    return {
+        "stall": stallDataframe,
+        "slope": slopeDataframe,
+        "summary": summaryDataframe,
+        "combined": combinedMetrics,
+        "rankings": rankings,
+        "pareto": paretoDataframe,
+        "uncertainty": uncertainty,
+        "metrics": metrics,
+    }
+
+@TRACER.traced("sensitivity")
+def sensitivityStage(combinedMetrics: pd.DataFrame,samples: int = None,
+                     concentration: float = None,maxRank: int = None) -> dict:
+    if samples is None:
+        samples = SENSITIVITY_SAMPLES
+    if concentration is None:
+        concentration = SENSITIVITY_CONCENTRATION
+    if maxRank is None:
+        maxRank = SENSITIVITY_MAX_RANK
+
+    from weight_sensitivity import weightSensitivity
+    startTime = time.perf_counter()
+    tables = weightSensitivity(
+        {scoreColumn: scoreTermMatrix(combinedMetrics,scoreColumn).to_numpy() for scoreColumn in SCORE_WEIGHTS},
+        {scoreColumn: [weight for weight,_,_ in terms] for scoreColumn,terms in SCORE_WEIGHTS.items()},
+        combinedMetrics.index,
+        samples=samples,
+        concentration=concentration if concentration > 0 else None,
+        maxRank=maxRank,
+        seed=SENSITIVITY_SEED,
+    )
+    print(f"[PROGRAM] Scored {len(combinedMetrics)} candidates under {samples} weight draws per score "
+          f"in {time.perf_counter() - startTime:.2f} s.\n")
+
+    for scoreColumn,table in tables.items():
+        table.to_csv(processedDirectory / f"weight_sensitivity_{scoreColumn}.csv")
+        print(f"[PROGRAM] RANK PROBABILITIES - {scoreColumn}:\n")
+        print(table.round(3).to_string(),"\n")
+    return tables
 
 # ============================== #
 #|        RESULT PLOTTING       |#
 # ============================== #
+@functools.lru_cache(maxsize=None)
+def loadPlottingLibraries():
+    # matplotlib and seaborn dominate start-up time, so only the plotting stage imports them.
+    # Figures are only ever saved, so the headless Agg backend is used in every process.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    sns.set_theme(style='whitegrid',context='talk',palette='deep')
+    return plt,sns
+
 def buildPlot(data: pd.DataFrame,x: str,y: str,xLabel: str,yLabel: str,
-              title: str,filename: Path,hue: str='airfoil'):
+              title: str,filename: Path,hue: str='airfoil',dpi: int = FIGURE_DPI):
+    plt,sns = loadPlottingLibraries()
     fig,ax = plt.subplots(figsize=(8,6))
     
     sns.lineplot(data=data,x=x,y=y,hue=hue,marker='o',ax=ax)
@@ -523,72 +1550,343 @@ def buildPlot(data: pd.DataFrame,x: str,y: str,xLabel: str,yLabel: str,
     )
 
     fig.tight_layout()
-    fig.savefig(filename,dpi=300,bbox_inches='tight')
+    fig.savefig(filename,dpi=dpi,bbox_inches='tight')
     plt.close(fig)
 
-# ======== Cl vs. AoA ========= #
-buildPlot(data=allPolars,x='alpha',y='cl',xLabel='Angle of Attack (°)',yLabel='Lift Coefficient (Cl)',
-          title=f"Cl vs. AoA of Candidate Airfoils\nTropochief RC Plane Project | {username} | {date.today()}",
-          filename=figureDirectory / "cl_vs_aoa.png")
-
-# ======== Cd vs. AoA ========= #
-buildPlot(data=allPolars,x='alpha',y='cd',xLabel='Angle of Attack (°)',yLabel='Drag Coefficient (Cd)',
-          title=f"Cd vs. AoA of Candidate Airfoils\nTropochief RC Plane Project | {username} | {date.today()}",
-          filename=figureDirectory / "cd_vs_aoa.png")
-
-# ======= Cl/Cd vs. AoA ======= #
-buildPlot(data=allPolars,x='alpha',y='cl_cd',xLabel='Angle of Attack (°)',yLabel='Lift-to-Drag Ratio (Cl/Cd)',
-          title=f"Cl/Cd vs. AoA of Candidate Airfoils\nTropochief RC Plane Project | {username} | {date.today()}",
-          filename=figureDirectory / "clcd_vs_aoa.png")
+# ===== Render Cache ===== #
+# Each figure is a job: the name of its plotting function plus keyword arguments holding
+# only the data slice it draws. The job's hash covers that slice and every argument except
+# those listed under "volatile" (the dated title line), and figures/.render_cache.json records the hash each PNG was last drawn from, so unchanged
+# figures are skipped. Changed figures render in a process pool.
+FIGURE_RENDERERS = {
+    "polar": buildPlot,
+    "linear_region": plotLinearRegionDiagnostic,
+}
+
+def figureHash(job: dict) -> str:
+    digest = hashlib.sha256(job["renderer"].encode("utf-8"))
+    volatile = set(job.get("volatile",()))
+    for key,value in sorted(job["kwargs"].items()):
+        if key in volatile:
+            continue
+        digest.update(key.encode("utf-8"))
+        if isinstance(value,pd.DataFrame):
+            digest.update(pd.util.hash_pandas_object(value,index=False).values.tobytes())
+            digest.update(",".join(value.columns).encode("utf-8"))
+        else:
+            digest.update(repr(value).encode("utf-8"))
+    return digest.hexdigest()
+
+def renderFigure(job: dict) -> str:
+    # Top-level so ProcessPoolExecutor workers can unpickle and call it
+    FIGURE_RENDERERS[job["renderer"]](**job["kwargs"])
+    return job["output"]
+
+@TRACER.traced("renderFigures",items=lambda rendered: rendered)
+def renderFigures(jobs,outputDirectory: Path,workers: int = None) -> int:
+    if workers is None:
+        workers = PLOT_WORKERS
+    manifestPath = outputDirectory / ".render_cache.json"
+    manifest = json.loads(manifestPath.read_text(encoding="utf-8")) if manifestPath.exists() else {}
+
+    pending = []
+    for job in jobs:
+        job["hash"] = figureHash(job)
+        if manifest.get(job["output"]) == job["hash"] and Path(job["output"]).exists():
+            continue
+        pending.append(job)
+    print(f"[PROGRAM] Rendering {len(pending)} of {len(jobs)} figures "
+          f"({len(jobs) - len(pending)} unchanged).\n")
+
+    if workers <= 1 or len(pending) <= 1:
+        rendered = [renderFigure(job) for job in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers,len(pending))) as executor:
+            rendered = list(executor.map(renderFigure,pending))
 
-# ======== Cm vs. AoA ========= #
-buildPlot(data=allPolars,x='alpha',y='cm',xLabel='Angle of Attack (°)',yLabel='Pitching Moment Coefficient (Cm)',
-          title=f"Cm vs. AoA of Candidate Airfoils\nTropochief RC Plane Project | {username} | {date.today()}",
-          filename=figureDirectory / "cm_vs_aoa.png")
+    for job,output in zip(pending,rendered):
+        manifest[output] = job["hash"]
+        if VERBOSE:
+            print(f"[DEBUG] Rendered {output}.\n")
+    manifestPath.write_text(json.dumps(manifest,indent=1,sort_keys=True),encoding="utf-8")
+    return len(pending)
+
+@TRACER.traced("plot")
+def plotStage(allPolars: pd.DataFrame,airfoils=None,diagnosticPlots: bool = None,
+              preview: bool = False,workers: int = None,metrics: pd.DataFrame = None) -> None:
+    if airfoils is None:
+        airfoils = AIRFOILS
+    if diagnosticPlots is None:
+        diagnosticPlots = DIAGNOSTIC_LINEAR_PLOTS
+    outputDirectory = figureDirectory / "preview" if preview else figureDirectory
+    outputDirectory.mkdir(parents=True,exist_ok=True)
+    dpi = PREVIEW_DPI if preview else FIGURE_DPI
+
+    polarFigures = [
+        # (y column, y label, title prefix, file name)
+        ('cl','Lift Coefficient (Cl)',"Cl vs. AoA","cl_vs_aoa.png"),
+        ('cd','Drag Coefficient (Cd)',"Cd vs. AoA","cd_vs_aoa.png"),
+        ('cl_cd','Lift-to-Drag Ratio (Cl/Cd)',"Cl/Cd vs. AoA","clcd_vs_aoa.png"),
+        ('cm','Pitching Moment Coefficient (Cm)',"Cm vs. AoA","cm_vs_aoa.png"),
+    ]
+    jobs = []
+    for y,yLabel,titlePrefix,filename in polarFigures:
+        jobs.append({
+            "renderer": "polar",
+            "output": str(outputDirectory / filename),
+            "volatile": ("title",), # Carries today's date; would mark every figure stale daily
+            "kwargs": dict(
+                data=allPolars[['alpha',y,'airfoil']],x='alpha',y=y,
+                xLabel='Angle of Attack (°)',yLabel=yLabel,
+                title=f"{titlePrefix} of Candidate Airfoils\nTropochief RC Plane Project | {username} | {date.today()}",
+                filename=outputDirectory / filename,dpi=dpi,
+            ),
+        })
+
+    # ===== Linear Region Diagnostics ===== #
+    # Slopes, linear ranges and stall angles come from the grouped metrics pass; the polars
+    # are only split per airfoil once, for the data each figure draws
+    diagnosticDirectory = outputDirectory / "linear_region"
+    if diagnosticPlots:
+        if metrics is None:
+            metrics = computeAirfoilMetrics(allPolars,airfoils)
+        names = list(dict.fromkeys(candidate.upper() for candidate in airfoils))
+        fitted = metrics.reindex(names).dropna(subset=['liftCurveSlope'])
+        polars = allPolars[allPolars['airfoil'].isin(fitted.index)]
+        slopes = polars['airfoil'].map(fitted['liftCurveSlope'])
+        intercepts = (polars['cl'] - slopes * polars['alpha']).groupby(polars['airfoil']).mean()
+        framesByAirfoil = dict(tuple(polars[['airfoil','alpha','cl']].groupby('airfoil',sort=False)))
+        for airfoilName,row in fitted.iterrows():
+            jobs.append({
+                "renderer": "linear_region",
+                "output": str(diagnosticDirectory / f"{airfoilName}_linear_region.png"),
+                "kwargs": dict(
+                    airfoilName=airfoilName,dataframeAirfoil=framesByAirfoil[airfoilName][['alpha','cl']],
+                    slope=row['liftCurveSlope'],intercept=intercepts[airfoilName],
+                    alphaLinMin=row['alphaLinearMin'],alphaLinMax=row['alphaLinearMax'],
+                    alphaStall=row['alphaAtClMax'],diagnosticDirectory=diagnosticDirectory,dpi=dpi,
+                ),
+            })
+
+    renderFigures(jobs,outputDirectory,workers)
 
 # ============================== #
 #|       AUTO-PUSH TO .MD       |#
 # ============================== #
-selectionMD = pathlib.Path("airfoil_selection.md")
-
-mdLines = [
-    f"# Airfoil Selection Study\n",
-    f"This document is auto-updated by `airfoil_screening.py`.\n",
-    f"Figures are generated in `analysis/airfoil_screening/figures/`.\n",
-    f"\n## 1. Cl vs AoA\n",
-    f"![Cl vs AoA](figures/cl_vs_aoa.png)\n",
-    f"\n## 2. Cd vs AoA\n",
-    f"![Cd vs AoA](figures/cd_vs_aoa.png)\n",
-    f"\n## 3. Cl/Cd vs AoA\n",
-    f"![Cl/Cd vs AoA](figures/clcd_vs_aoa.png)\n",
-    f"\n## 4. Cm vs AoA\n",
-    f"![Cm vs AoA](figures/cm_vs_aoa.png)\n",
-    f"\n## 5. Numerical Summary\n",
-    f"\n```text\n",
-    summaryDataframe.round(4).to_string(),
-    f"\n```\n",
-    f"\n## 6. Lift-Curve Slopes\n",
-    f"\n```text\n",
-    slopeDataframe.round(4).to_string(),
-    f"\n```\n",
-     "\n## 7. Multi-Objective Rankings\n",
-    "\nTop candidates by objective:\n",
-    f"\n- Forward-swept / stability-oriented (Score A): {topStability or 'N/A'}\n",
-    f"- Efficiency, cruise-focused (Score B): {topEfficiency or 'N/A'}\n",
-    f"- Maneuverability vs torsion (Score C): {topManeuver or 'N/A'}\n",
-    "\n### 7.1 Score A – Forward-Swept / Stability-Oriented\n",
-    "\n```text\n",
-    rankingStability.round(3).to_string(),
-    "\n```\n",
-    "\n### 7.2 Score B – Efficiency\n",
-    "\n```text\n",
-    rankingEfficiency.round(3).to_string(),
-    "\n```\n",
-    "\n### 7.3 Score C – Maneuverability vs Torsion\n",
-    "\n```text\n",
-    rankingManeuverTorsion.round(3).to_string(),
-    "\n```\n",
-]
+@TRACER.traced("report")
+def reportStage(scores: dict) -> None:
+    summaryDataframe = scores["summary"]
+    slopeDataframe = scores["slope"]
+    rankingStability = scores["rankings"]["scoreStability"]
+    rankingEfficiency = scores["rankings"]["scoreEfficiency"]
+    rankingManeuverTorsion = scores["rankings"]["scoreManeuverTorsion"]
+
+    topStability = ", ".join(rankingStability.index[:2]) if not rankingStability.empty else ""
+    topEfficiency = ", ".join(rankingEfficiency.index[:2]) if not rankingEfficiency.empty else ""
+    topManeuver = ", ".join(rankingManeuverTorsion.index[:2]) if not rankingManeuverTorsion.empty else ""
+    paretoDataframe = scores["pareto"]
+    paretoFront = ", ".join(paretoDataframe.index[paretoDataframe['paretoLayer'] == 0])
+
+    mdLines = [
+        f"# Airfoil Selection Study\n",
+        f"This document is auto-updated by `airfoil_screening.py`.\n",
+        f"Figures are generated in `analysis/airfoil_screening/figures/`.\n",
+        f"\n## 1. Cl vs AoA\n",
+        f"![Cl vs AoA](figures/cl_vs_aoa.png)\n",
+        f"\n## 2. Cd vs AoA\n",
+        f"![Cd vs AoA](figures/cd_vs_aoa.png)\n",
+        f"\n## 3. Cl/Cd vs AoA\n",
+        f"![Cl/Cd vs AoA](figures/clcd_vs_aoa.png)\n",
+        f"\n## 4. Cm vs AoA\n",
+        f"![Cm vs AoA](figures/cm_vs_aoa.png)\n",
+        f"\n## 5. Numerical Summary\n",
+        f"\n```text\n",
+        summaryDataframe.round(4).to_string(),
+        f"\n```\n",
+        f"\n## 6. Lift-Curve Slopes\n",
+        f"\n```text\n",
+        slopeDataframe.round(4).to_string(),
+        f"\n```\n",
+         "\n## 7. Multi-Objective Rankings\n",
+        "\nTop candidates by objective:\n",
+        f"\n- Forward-swept / stability-oriented (Score A): {topStability or 'N/A'}\n",
+        f"- Efficiency, cruise-focused (Score B): {topEfficiency or 'N/A'}\n",
+        f"- Maneuverability vs torsion (Score C): {topManeuver or 'N/A'}\n",
+        f"- Pareto-optimal, no fixed weights (7.4): {paretoFront or 'N/A'}\n",
+        "\n### 7.1 Score A – Forward-Swept / Stability-Oriented\n",
+        "\n```text\n",
+        rankingStability.round(3).to_string(),
+        "\n```\n",
+        "\n### 7.2 Score B – Efficiency\n",
+        "\n```text\n",
+        rankingEfficiency.round(3).to_string(),
+        "\n```\n",
+        "\n### 7.3 Score C – Maneuverability vs Torsion\n",
+        "\n```text\n",
+        rankingManeuverTorsion.round(3).to_string(),
+        "\n```\n",
+        "\n### 7.4 Pareto Layers\n",
+        "\nLayer 0 is the non-dominated set; each later layer is the frontier of what remains.\n",
+        "\n```text\n",
+        paretoDataframe.round(4).to_string(),
+        "\n```\n",
+    ]
+    uncertainty = scores.get("uncertainty")
+    if uncertainty is not None:
+        from metric_uncertainty import intervalTable
+        mdLines += [
+            "\n## 8. Metric Uncertainty\n",
+            f"\nEstimate [{UNCERTAINTY_CONFIDENCE:.0%} interval] from {UNCERTAINTY_SAMPLES} "
+            f"{UNCERTAINTY_METHOD} resamples of each polar.\n",
+            "\n```text\n",
+            intervalTable(uncertainty).to_string(),
+            "\n```\n",
+        ]
+
+    selectionMD.write_text("".join(mdLines), encoding="utf-8")
+    print(f"[PROGRAM] Updated airfoil_selection.md at {selectionMD.resolve()}")
 
-selectionMD.write_text("".join(mdLines), encoding="utf-8")
-print(f"[PROGRAM] Updated airfoil_selection.md at {selectionMD.resolve()}")
\ No newline at end of file
+# ============================== #
+#|          EXECUTION           |#
+# ============================== #
+@TRACER.traced("run")
+def runStage(airfoils=None,workers: int = None) -> None:
+    if airfoils is None:
+        airfoils = AIRFOILS
+    print(f"[PROGRAM] Using Reynolds Number (Re) ≈ {RE:.0f} based on:\n",
+          f"Fluid Velocity (V) = {fluidVelocity} m/s\n",
+          f"Characteristic Length (c) = {characteristicLength} m.\n")
+    checkXfoilExecutable()
+    runXfoilSweep([(candidate,RE,AOA_RANGE) for candidate in airfoils],workers)
+    if SWEEP_REYNOLDS:
+        runSweepGrid(airfoils,buildSweepGrid(SWEEP_REYNOLDS,SWEEP_MACH,SWEEP_NCRIT),AOA_RANGE,workers)
+    writeXfoilRunLog()
+
+def writeTrace() -> pd.DataFrame:
+    tracePath = TRACER.writeChromeTrace(processedDirectory / "trace.json")
+    summary = TRACER.summary()
+    summary.to_csv(processedDirectory / "trace_summary.csv")
+    print(f"[PROGRAM] Wrote trace to {tracePath} (open in chrome://tracing or ui.perfetto.dev).\n")
+    print(summary.round(3).to_string(),"\n")
+    return summary
+
+def resolveAirfoils(args) -> list:
+    # --query selects from the geometry catalog; otherwise --airfoils, then the AIRFOILS list
+    if args.query:
+        from airfoil_catalog import queryCatalog,updateCatalog
+        catalog = updateCatalog(geometryDirectory,catalogIndexPath,verbose=VERBOSE)
+        airfoils = queryCatalog(catalog,args.query)
+        print(f"[PROGRAM] Catalog query '{args.query}' matched {len(airfoils)} airfoils.\n")
+    else:
+        airfoils = args.airfoils
+    # The panel check is cheap, so every stage re-derives the same filtered list
+    if args.prefilter or (PANEL_PREFILTER and args.command != "prefilter"):
+        airfoils = prefilterStage(airfoils)
+    return airfoils
+
+def commandCatalog(args) -> None:
+    from airfoil_catalog import updateCatalog
+    catalog = updateCatalog(geometryDirectory,catalogIndexPath,verbose=VERBOSE)
+    if args.query:
+        catalog = catalog[catalog['name'].isin(args.airfoils)]
+    columns = ["name","format","maxThickness","xMaxThickness","maxCamber","xMaxCamber","teGap"]
+    print(catalog[columns].set_index("name").round(4).to_string())
+
+def commandPrefilter(args) -> None:
+    if not args.prefilter:
+        prefilterStage(args.airfoils)
+
+def commandRun(args) -> None:
+    runStage(args.airfoils,args.workers)
+
+def commandParse(args) -> None:
+    parseStage(args.airfoils)
+
+def commandScore(args) -> None:
+    scoreStage(loadProcessedPolars(args.airfoils),args.airfoils)
+
+def commandPlot(args) -> None:
+    plotStage(loadProcessedPolars(args.airfoils),args.airfoils,diagnosticPlots=not args.no_diagnostics,
+              preview=args.preview)
+
+def commandReport(args) -> None:
+    reportStage(scoreStage(loadProcessedPolars(args.airfoils),args.airfoils))
+
+def commandSensitivity(args) -> None:
+    scores = scoreStage(loadProcessedPolars(args.airfoils),args.airfoils)
+    sensitivityStage(scores["combined"],args.samples,args.concentration,args.max_rank)
+
+def commandSurrogate(args) -> None:
+    surrogateStage(args.airfoils,args.mach,args.ncrit)
+
+def commandAll(args) -> None:
+    runStage(args.airfoils,args.workers)
+    allPolars = parseStage(args.airfoils)
+    scores = scoreStage(allPolars,args.airfoils)
+    plotStage(allPolars,args.airfoils,diagnosticPlots=not args.no_diagnostics,metrics=scores["metrics"])
+    reportStage(scores)
+
+def buildArgumentParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Tropochief airfoil screening pipeline.")
+    parser.add_argument("--airfoils",nargs="+",default=None,
+                        help="Airfoil names in geometry/ (default: the AIRFOILS list)")
+    parser.add_argument("--workers",type=int,default=None,help="Concurrent XFoil processes")
+    parser.add_argument("--verbose",action="store_true",help="Detailed XFoil logs and debug prints")
+    parser.add_argument("--trace",action="store_true",
+                        help="Record stage and XFoil timings to data_processed/trace.json (Chrome trace format)")
+    parser.add_argument("--no-diagnostics",action="store_true",help="Skip linear region diagnostic plots")
+    parser.add_argument("--query",default=None,
+                        help="Catalog query selecting airfoils, e.g. \"0.09 <= maxThickness <= 0.13\"")
+    parser.add_argument("--prefilter",action="store_true",
+                        help="Keep only airfoils passing the inviscid panel-method check")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("run",help="Run XFoil for every airfoil (and the sweep grid, if set)")
+    subparsers.add_parser("parse",help="Parse .pol files into processed CSVs")
+    subparsers.add_parser("score",help="Compute metrics and rankings from processed polars")
+    plotParser = subparsers.add_parser("plot",help="Render figures from processed polars")
+    plotParser.add_argument("--preview",action="store_true",
+                            help=f"Fast {PREVIEW_DPI}-dpi figures in figures/preview/")
+    subparsers.add_parser("report",help="Rewrite airfoil_selection.md from processed polars")
+    subparsers.add_parser("all",help="Run every stage in order (default)")
+    sensitivityParser = subparsers.add_parser("sensitivity",help="Rank probabilities under Dirichlet-sampled score weights")
+    sensitivityParser.add_argument("--samples",type=int,default=None,help="Weight draws per score")
+    sensitivityParser.add_argument("--concentration",type=float,default=None,
+                                   help="Dirichlet concentration around SCORE_WEIGHTS; 0 for uniform draws")
+    sensitivityParser.add_argument("--max-rank",type=int,default=None,help="Deepest rank tabulated")
+    surrogateParser = subparsers.add_parser("surrogate",help="Build (alpha, Re) lookup tables from processed and sweep polars")
+    surrogateParser.add_argument("--mach",type=float,default=None,help="Sweep grid Mach to include (default: first SWEEP_MACH)")
+    surrogateParser.add_argument("--ncrit",type=float,default=None,help="Sweep grid Ncrit to include (default: first SWEEP_NCRIT)")
+    subparsers.add_parser("catalog",help="Update the geometry catalog index and list its airfoils")
+    subparsers.add_parser("prefilter",help="Run the inviscid panel-method check and save its table")
+    return parser
+
+COMMANDS = {
+    "run": commandRun,
+    "parse": commandParse,
+    "score": commandScore,
+    "plot": commandPlot,
+    "report": commandReport,
+    "all": commandAll,
+    "catalog": commandCatalog,
+    "prefilter": commandPrefilter,
+    "sensitivity": commandSensitivity,
+    "surrogate": commandSurrogate,
+}
+
+def main(argv=None) -> None:
+    global VERBOSE
+    args = buildArgumentParser().parse_args(argv)
+    if args.verbose:
+        VERBOSE = True
+    if args.trace or TRACE:
+        TRACER.enable()
+    ensureDirectories()
+    try:
+        args.airfoils = resolveAirfoils(args)
+        COMMANDS[args.command or "all"](args)
+    finally:
+        if TRACER.enabled:
+            writeTrace()
+
+if __name__ == "__main__":
+    main()
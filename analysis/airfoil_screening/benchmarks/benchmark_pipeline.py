@@ -0,0 +1,203 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Screening Pipeline Benchmark
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Times every stage of airfoil_screening.py (run, parse, metrics, score, plot, report)
+# on synthetic catalogs of NACA 4-digit airfoils, with benchmarks/fake_xfoil.py standing
+# in for xfoil/xfoil.exe. Each catalog size runs in its own temporary project tree, so
+# no real geometry, XFoil install or previous output is touched. Results are written as
+# JSON (one record per size and stage) and can be compared against an earlier results
+# file with --baseline.
+#   Usage: python benchmarks/benchmark_pipeline.py --sizes 5 500 5000 --delay 0.001
+#          python benchmarks/benchmark_pipeline.py --sizes 5000 --stages run parse metrics score
+#          python benchmarks/benchmark_pipeline.py --sizes 500 --baseline results_old.json
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+sys.path.insert(0,str(BENCHMARK_DIR.parent))
+import airfoil_screening as screening
+
+STAGES = ("run","parse","metrics","score","plot","report")
+FAKE_XFOIL = BENCHMARK_DIR / "fake_xfoil.py"
+GEOMETRY_POINTS = 81 # Points per surface in the synthetic .dat files
+
+# ============================== #
+#|       SYNTHETIC CATALOG      |#
+# ============================== #
+def nacaFourDigit(maxCamber: float,camberPosition: float,thickness: float,points: int = GEOMETRY_POINTS):
+    # Selig-ordered coordinates (TE -> upper -> LE -> lower -> TE) with a closed trailing edge
+    beta = np.linspace(0.0,np.pi,points)
+    x = 0.5 * (1.0 - np.cos(beta))
+    yThickness = 5.0 * thickness * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2
+                                     + 0.2843 * x**3 - 0.1036 * x**4)
+    front = x < camberPosition
+    yCamber = np.where(front,
+                       maxCamber / camberPosition**2 * (2.0 * camberPosition * x - x**2),
+                       maxCamber / (1.0 - camberPosition)**2 * (1.0 - 2.0 * camberPosition + 2.0 * camberPosition * x - x**2))
+    slope = np.where(front,
+                     2.0 * maxCamber / camberPosition**2 * (camberPosition - x),
+                     2.0 * maxCamber / (1.0 - camberPosition)**2 * (camberPosition - x))
+    theta = np.arctan(slope)
+    xUpper,yUpper = x - yThickness * np.sin(theta),yCamber + yThickness * np.cos(theta)
+    xLower,yLower = x + yThickness * np.sin(theta),yCamber - yThickness * np.cos(theta)
+    return np.concatenate([xUpper[::-1],xLower[1:]]),np.concatenate([yUpper[::-1],yLower[1:]])
+
+def writeSyntheticCatalog(geometryDirectory: Path,count: int,seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    names = []
+    for index in range(count):
+        name = f"bench{index:05d}"
+        x,y = nacaFourDigit(rng.uniform(0.0,0.05),rng.uniform(0.3,0.5),rng.uniform(0.08,0.16))
+        lines = [name.upper()] + [f"{xi:10.6f} {yi:10.6f}" for xi,yi in zip(x,y)]
+        (geometryDirectory / f"{name}.dat").write_text("\n".join(lines) + "\n",encoding="utf-8")
+        names.append(name)
+    return names
+
+# ============================== #
+#|         PROJECT SETUP        |#
+# ============================== #
+def configureProject(rootDirectory: Path,airfoils: list) -> None:
+    # Points every path the pipeline derives from ROOT_DIR at the temporary tree
+    screening.geometryDirectory = rootDirectory / "geometry"
+    screening.rawDirectory = rootDirectory / "data_raw"
+    screening.processedDirectory = rootDirectory / "data_processed"
+    screening.figureDirectory = rootDirectory / "figures"
+    screening.scratchDirectory = screening.rawDirectory / "scratch"
+    screening.polarCacheDirectory = screening.rawDirectory / "cache"
+    screening.geometryCacheDirectory = screening.rawDirectory / "geometry_cache"
+    screening.sweepStorePath = screening.processedDirectory / "sweep_polars.sqlite"
+    screening.catalogIndexPath = screening.processedDirectory / "airfoil_catalog.sqlite"
+    screening.surrogatePath = screening.processedDirectory / "polar_surrogate.npz"
+    screening.xfoilExecutable = rootDirectory / "xfoil" / "xfoil.exe"
+    screening.selectionMD = rootDirectory / "airfoil_selection.md"
+    screening.AIRFOILS = airfoils
+    screening.SWEEP_REYNOLDS = []
+
+    screening.xfoilExecutable.parent.mkdir(parents=True,exist_ok=True)
+    # LF endings so the kernel reads the shebang as 'python3', not 'python3\r'
+    screening.xfoilExecutable.write_bytes(FAKE_XFOIL.read_bytes().replace(b"\r\n",b"\n"))
+    screening.xfoilExecutable.chmod(screening.xfoilExecutable.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    screening.ensureDirectories()
+
+def timeStage(function,quiet: bool):
+    # (result, wall seconds, CPU seconds of this process and its finished children)
+    output = io.StringIO() if quiet else None
+    startWall = time.perf_counter()
+    startCpu = time.process_time()
+    startChildren = os.times()
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        result = function()
+    endChildren = os.times()
+    cpuSeconds = (time.process_time() - startCpu
+                  + (endChildren.children_user - startChildren.children_user)
+                  + (endChildren.children_system - startChildren.children_system))
+    return result,time.perf_counter() - startWall,cpuSeconds
+
+def benchmarkSize(size: int,stages,workers: int,quiet: bool,seed: int) -> list:
+    records = []
+    with tempfile.TemporaryDirectory(prefix=f"screening_bench_{size}_") as directory:
+        rootDirectory = Path(directory)
+        (rootDirectory / "geometry").mkdir()
+        airfoils = writeSyntheticCatalog(rootDirectory / "geometry",size,seed)
+        configureProject(rootDirectory,airfoils)
+
+        def record(stage: str,function,items):
+            if stage not in stages:
+                # Later stages need earlier outputs, so a skipped stage still runs, untimed
+                with contextlib.redirect_stdout(io.StringIO()):
+                    return function()
+            result,wallSeconds,cpuSeconds = timeStage(function,quiet)
+            count = items(result) if callable(items) else items
+            records.append({
+                "size": size,
+                "stage": stage,
+                "wallSeconds": round(wallSeconds,6),
+                "cpuSeconds": round(cpuSeconds,6),
+                "items": int(count),
+                "itemsPerSecond": round(count / wallSeconds,3) if wallSeconds > 0 else None,
+            })
+            print(f"[BENCHMARK] {size:6d} airfoils  {stage:8s} {wallSeconds:10.3f} s wall "
+                  f"{cpuSeconds:10.3f} s CPU  ({count} items)")
+            return result
+
+        record("run",lambda: screening.runStage(airfoils,workers),size)
+        allPolars = record("parse",lambda: screening.parseStage(airfoils),len)
+        if "metrics" in stages:
+            record("metrics",lambda: screening.computeAirfoilMetrics(allPolars,airfoils),len)
+        if "score" in stages or "report" in stages:
+            scores = record("score",lambda: screening.scoreStage(allPolars,airfoils),size)
+        if "plot" in stages:
+            record("plot",lambda: screening.plotStage(allPolars,airfoils,workers=workers),size)
+        if "report" in stages:
+            record("report",lambda: screening.reportStage(scores),size)
+    return records
+
+# ============================== #
+#|        BASELINE COMPARE      |#
+# ============================== #
+def compareBaseline(records: list,baselinePath: Path) -> None:
+    baseline = json.loads(Path(baselinePath).read_text(encoding="utf-8"))
+    reference = {(entry["size"],entry["stage"]): entry["wallSeconds"] for entry in baseline["results"]}
+    print(f"\n[BENCHMARK] Wall time relative to {baselinePath} (<1 is faster):")
+    for entry in records:
+        previous = reference.get((entry["size"],entry["stage"]))
+        if previous:
+            print(f"  {entry['size']:6d} airfoils  {entry['stage']:8s} {entry['wallSeconds'] / previous:6.2f}x "
+                  f"({previous:.3f} s -> {entry['wallSeconds']:.3f} s)")
+
+# ============================== #
+#|           EXECUTION          |#
+# ============================== #
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the airfoil screening pipeline with a fake XFoil.")
+    parser.add_argument("--sizes",type=int,nargs="+",default=[5,500,5000],help="Catalog sizes to time")
+    parser.add_argument("--stages",nargs="+",default=list(STAGES),choices=STAGES,help="Stages to time")
+    parser.add_argument("--delay",type=float,default=0.0,help="Fake XFoil seconds per angle of attack")
+    parser.add_argument("--workers",type=int,default=None,help="XFoil and plotting workers (default: pipeline settings)")
+    parser.add_argument("--seed",type=int,default=0,help="Seed for the synthetic airfoil shapes")
+    parser.add_argument("--output",type=Path,default=BENCHMARK_DIR / "results_pipeline.json",help="Results JSON path")
+    parser.add_argument("--baseline",type=Path,default=None,help="Earlier results JSON to compare against")
+    parser.add_argument("--show-output",action="store_true",help="Keep the pipeline's own prints")
+    args = parser.parse_args()
+
+    os.environ["FAKE_XFOIL_DELAY"] = str(args.delay)
+    screening.PLOT_WORKERS = args.workers or screening.PLOT_WORKERS
+    records = []
+    for size in args.sizes:
+        records += benchmarkSize(size,set(args.stages),args.workers,not args.show_output,args.seed)
+
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": screening.pd.__version__,
+            "platform": platform.platform(),
+            "cpuCount": os.cpu_count(),
+            "xfoilWorkers": args.workers or screening.XFOIL_WORKERS,
+            "fakeXfoilDelay": args.delay,
+            "aoaPoints": len(screening.AOA_RANGE),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": records,
+    }
+    args.output.write_text(json.dumps(results,indent=2),encoding="utf-8")
+    print(f"\n[BENCHMARK] Wrote {len(records)} results to {args.output}.")
+    if args.baseline:
+        compareBaseline(records,args.baseline)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Polar Parser Benchmark
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Writes a few thousand synthetic XFoil polar files and times the original
+# line-by-line parser against polar_io.readPolarArrays (one DataFrame per file)
+# and polar_io.readPolarTable (one combined DataFrame), checking that all three
+# produce identical values.
+#   Usage: python benchmarks/benchmark_polar_parser.py --files 3000
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0,str(Path(__file__).resolve().parent.parent))
+from polar_io import POLAR_COLUMNS,formatPolarText,readPolarArrays,readPolarTable
+
+# ============================== #
+#|        SYNTHETIC POLARS      |#
+# ============================== #
+def writeSyntheticPolars(directory: Path,fileCount: int,seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    alpha = np.round(np.arange(-5.0,18.0 + 0.5,0.5),1)
+    polarFiles = []
+    for index in range(fileCount):
+        alphaStall = rng.uniform(10.0,16.0)
+        slope = rng.uniform(0.09,0.12)
+        cl0 = rng.uniform(0.0,0.4)
+        cl = np.where(alpha <= alphaStall,cl0 + slope * alpha,cl0 + slope * alphaStall - 0.08 * (alpha - alphaStall))
+        cd = 0.006 + 0.0001 * (alpha - 1.0) ** 2 + rng.uniform(0.0,0.001)
+        rows = [
+            {"alpha": a,"cl": l,"cd": d,"cdp": 0.4 * d,"cm": -0.05,"top_xtr": 0.6,"bot_xtr": 0.9}
+            for a,l,d in zip(alpha,cl,cd)
+        ]
+        polarFile = directory / f"synthetic{index:05d}_Re400000.pol"
+        polarFile.write_text(formatPolarText(f"SYNTH{index}",rng.uniform(1e5,1e6),rows),encoding="utf-8")
+        polarFiles.append(polarFile)
+    return polarFiles
+
+# ============================== #
+#|            PARSERS           |#
+# ============================== #
+def parsePolarLegacy(polarFile: Path) -> pd.DataFrame:
+    # The original airfoil_screening.parsePolar loop, minus the CSV write
+    rows = []
+    with polarFile.open() as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("#") or line.startswith("-----"):
+                continue
+            parts = line.split()
+            if len(parts) != 7:
+                continue
+            try:
+                rows.append(dict(zip(POLAR_COLUMNS,(float(part) for part in parts))))
+            except ValueError:
+                continue
+    return pd.DataFrame(rows)
+
+def parsePolarVectorized(polarFile: Path) -> pd.DataFrame:
+    _,columns = readPolarArrays(polarFile)
+    return pd.DataFrame(columns)
+
+def parseAllLegacy(polarFiles) -> pd.DataFrame:
+    return pd.concat([parsePolarLegacy(polarFile) for polarFile in polarFiles],ignore_index=True)
+
+def parseAllVectorized(polarFiles) -> pd.DataFrame:
+    return pd.concat([parsePolarVectorized(polarFile) for polarFile in polarFiles],ignore_index=True)
+
+def parseAllTable(polarFiles) -> pd.DataFrame:
+    return readPolarTable(polarFiles)[POLAR_COLUMNS]
+
+def timeParser(parser,polarFiles,repeats: int) -> tuple:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        table = parser(polarFiles)
+        times.append(time.perf_counter() - start)
+    return min(times),table
+
+# ============================== #
+#|           EXECUTION          |#
+# ============================== #
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark XFoil polar parsers.")
+    parser.add_argument("--files",type=int,default=3000,help="Number of synthetic polar files")
+    parser.add_argument("--repeats",type=int,default=3,help="Timed repeats; the best is reported")
+    args = parser.parse_args()
+
+    parsers = [
+        ("legacy line-by-line parser",parseAllLegacy),
+        ("readPolarArrays per file",parseAllVectorized),
+        ("readPolarTable combined",parseAllTable),
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        polarFiles = writeSyntheticPolars(Path(directory),args.files)
+        results = [(label,*timeParser(function,polarFiles,args.repeats)) for label,function in parsers]
+
+    _,legacyBest,legacyTable = results[0]
+    print(f"[BENCHMARK] {args.files} polar files, best of {args.repeats}:")
+    for label,best,table in results:
+        pd.testing.assert_frame_equal(legacyTable,table)
+        print(f"  {label:28s} {best:8.3f} s ({args.files / best:9.0f} files/s, {legacyBest / best:5.1f}x)")
+
+if __name__ == "__main__":
+    main()
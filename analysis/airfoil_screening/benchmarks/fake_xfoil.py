@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+#Tropochief RC Plane Project
+#Airfoil Selection: Fake XFoil Executable
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Stand-in for xfoil/xfoil.exe that understands the subset of XFoil commands the
+# screening pipeline sends (LOAD, PANE, PLOP, OPER with VISC/RE/MACH/ITER/VPAR/PACC/
+# INIT/ASEQ/ALFA/PLIS/PDEL, QUIT) over stdin, both as a one-shot script and as a
+# persistent session. Polars follow a smooth lift curve with a stall whose angle, slope
+# and Cm are seeded from a CRC of the geometry file, so every airfoil gets a different
+# but reproducible polar written in XFoil's own PACC layout.
+#
+# Behaviour is set through environment variables so the pipeline needs no changes:
+#   FAKE_XFOIL_DELAY        Seconds spent per angle of attack (default 0)
+#   FAKE_XFOIL_STARTUP      Seconds spent before the first prompt (default 0)
+#   FAKE_XFOIL_FAIL_ALPHAS  Comma-separated angles that fail to converge below
+#                           FAKE_XFOIL_FAIL_ITER iterations (default 400)
+#   FAKE_XFOIL_HANG         Airfoil name prefix that hangs past 10 degrees (watchdog tests)
+
+import os
+import sys
+import time
+import zlib
+
+DELAY = float(os.environ.get("FAKE_XFOIL_DELAY","0") or 0.0)
+STARTUP = float(os.environ.get("FAKE_XFOIL_STARTUP","0") or 0.0)
+FAIL_ALPHAS = {round(float(a),4) for a in os.environ.get("FAKE_XFOIL_FAIL_ALPHAS","").split(",") if a.strip()}
+FAIL_ITER = int(os.environ.get("FAKE_XFOIL_FAIL_ITER","400"))
+HANG_PREFIX = os.environ.get("FAKE_XFOIL_HANG","").upper()
+
+# ============================== #
+#|          SYNTHETIC POLAR     |#
+# ============================== #
+def polarRow(alpha: float,re: float,seed: int) -> tuple:
+    variation = (seed % 1000) / 1000.0
+    alphaStall = 11.0 + 4.0 * variation
+    cl0 = 0.1 + 0.3 * variation
+    slope = 0.105 + 0.01 * variation
+    if alpha <= alphaStall:
+        cl = cl0 + slope * alpha - 0.002 * max(0.0,alpha - alphaStall + 4.0) ** 2
+    else:
+        clMax = cl0 + slope * alphaStall - 0.032
+        cl = clMax - 0.07 * (alpha - alphaStall) ** 1.2
+    cd = 0.0055 + 0.00009 * (alpha - 1.0) ** 2 + (0.004 * (alpha - alphaStall) ** 2 if alpha > alphaStall else 0.0)
+    cd *= (4e5 / max(re,1.0)) ** 0.2
+    cm = -0.02 - 0.05 * variation + (0.01 * (alpha - alphaStall) if alpha > alphaStall else 0.0)
+    topXtr = max(0.02,min(1.0,0.6 - 0.05 * alpha))
+    botXtr = max(0.02,min(1.0,0.6 + 0.05 * alpha))
+    return (alpha,cl,cd,0.4 * cd,cm,topXtr,botXtr)
+
+def formatRow(row: tuple) -> str:
+    return "%8.3f %8.4f %9.5f %9.5f %8.4f %8.4f %8.4f" % row
+
+def polarHeader(name: str,re: float,mach: float,ncrit: float) -> str:
+    return (" \n       XFOIL         Version 6.99\n \n Calculated polar for: %s\n \n"
+            " 1 1 Reynolds number fixed          Mach number fixed\n \n"
+            " xtrf =   1.000 (top)        1.000 (bottom)\n"
+            " Mach = %7.3f     Re = %9.3f e 6     Ncrit = %7.3f\n \n"
+            "   alpha    CL        CD       CDp       CM     Top_Xtr  Bot_Xtr\n"
+            "  ------ -------- --------- --------- -------- -------- --------\n") % (name,mach,re / 1e6,ncrit)
+
+# ============================== #
+#|        COMMAND HANDLING      |#
+# ============================== #
+class FakeXfoil:
+    def __init__(self,stdin,stdout):
+        self.stdin = stdin
+        self.stdout = stdout
+        self.name = "FAKE"
+        self.seed = 0
+        self.re = 0.0
+        self.viscous = False
+        self.mach = 0.0
+        self.ncrit = 9.0
+        self.iterations = 20
+        self.accumulating = False
+        self.polarFile = None
+        self.rows = []
+
+    def write(self,text: str = "") -> None:
+        self.stdout.write(text + "\n")
+        self.stdout.flush()
+
+    def readLine(self) -> str:
+        line = self.stdin.readline()
+        if not line:
+            sys.exit(0)
+        return line.strip()
+
+    def sweep(self,alphas) -> None:
+        for alpha in alphas:
+            if HANG_PREFIX and self.name.upper().startswith(HANG_PREFIX) and alpha > 10.0:
+                time.sleep(3600.0)
+            if DELAY:
+                time.sleep(DELAY)
+            if alpha in FAIL_ALPHAS and self.iterations < FAIL_ITER:
+                self.write(" VISCAL:  Convergence failed")
+                continue
+            row = polarRow(alpha,self.re,self.seed)
+            self.write(" a = %7.3f      CL = %7.4f" % (alpha,row[1]))
+            if self.accumulating:
+                self.rows.append(row)
+                if self.polarFile:
+                    with open(self.polarFile,"a") as file:
+                        file.write(formatRow(row) + "\n")
+
+    def oper(self) -> None:
+        while True:
+            self.write(".OPERv   c>")
+            command = self.readLine()
+            if not command:
+                return
+            parts = command.split()
+            keyword = parts[0].upper()
+            if keyword == "VISC":
+                self.viscous = not self.viscous
+                if len(parts) > 1:
+                    self.re = float(parts[1])
+            elif keyword == "RE":
+                self.re = float(parts[1])
+            elif keyword == "MACH":
+                self.mach = float(parts[1])
+            elif keyword == "ITER":
+                self.iterations = int(parts[1])
+            elif keyword == "VPAR":
+                while True:
+                    setting = self.readLine()
+                    if not setting:
+                        break
+                    if setting.split()[0].upper() == "N":
+                        self.ncrit = float(setting.split()[1])
+            elif keyword == "INIT":
+                pass
+            elif keyword == "PACC":
+                if self.accumulating:
+                    self.accumulating = False
+                    self.write(" Polar accumulation disabled")
+                else:
+                    polarFile = self.readLine()
+                    self.readLine() # Dump file, never written
+                    self.accumulating = True
+                    self.polarFile = polarFile or None
+                    self.rows = []
+                    if polarFile and not os.path.exists(polarFile):
+                        with open(polarFile,"w") as file:
+                            file.write(polarHeader(self.name,self.re,self.mach,self.ncrit))
+            elif keyword in ("ASEQ","ALFA"):
+                values = [float(value) for value in parts[1:]]
+                if keyword == "ALFA":
+                    values = [values[0],values[0],1.0]
+                aStart,aEnd,aStep = values
+                count = int(round((aEnd - aStart) / aStep)) if aStep else 0
+                self.sweep([round(aStart + k * aStep,4) for k in range(count + 1)])
+            elif keyword == "PLIS":
+                self.stdout.write(polarHeader(self.name,self.re,self.mach,self.ncrit))
+                for row in self.rows:
+                    self.write(formatRow(row))
+            elif keyword == "PDEL":
+                self.rows = []
+            else:
+                self.write(f" {keyword[:4]} command not recognized.")
+
+    def run(self) -> None:
+        if STARTUP:
+            time.sleep(STARTUP)
+        while True:
+            self.write(" XFOIL   c>")
+            command = self.readLine()
+            if not command:
+                continue
+            parts = command.split()
+            keyword = parts[0].upper()
+            if keyword == "LOAD":
+                with open(parts[1],"rb") as file:
+                    data = file.read()
+                self.name = data.splitlines()[0].decode(errors="replace").strip()
+                self.seed = zlib.crc32(data)
+            elif keyword == "PANE":
+                pass
+            elif keyword == "PLOP":
+                while self.readLine():
+                    pass
+            elif keyword == "OPER":
+                self.oper()
+            elif keyword == "QUIT":
+                sys.exit(0)
+            else:
+                self.write(f" {keyword[:4]} command not recognized.  Type a \"?\" for list")
+
+if __name__ == "__main__":
+    FakeXfoil(sys.stdin,sys.stdout).run()
@@ -0,0 +1,189 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Metric Uncertainty
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Confidence intervals for the stall and lift-curve metrics of every airfoil. Each polar
+# is resampled many times, either by bootstrapping its (alpha, Cl, Cd) points or by
+# jittering Cl and Cd within the solver's convergence tolerance, and the metrics are
+# recomputed for every resample at once. Polars are packed into a padded
+# (resample, airfoil, point) array with a validity mask, so stall detection is one masked
+# maximum and each lift-curve fit is one closed-form masked least-squares solve over the
+# last axis; there is no per-airfoil or per-resample Python loop.
+#
+# The fit rules mirror airfoil_screening.computeAirfoilMetrics: a first line over the
+# points from alphaMin to stall - stallMargin, then a refit without points whose
+# residual exceeds residualLimit.
+
+import numpy as np
+import pandas as pd
+
+UNCERTAINTY_METRICS = ["alphaAtClMax","clMax","ClDropPostStall","liftCurveSlope","linearFitR2"]
+UNCERTAINTY_METHODS = ("bootstrap","jitter")
+UNCERTAINTY_CHUNK_VALUES = 4_000_000 # Resample x airfoil x point values held at once per array
+
+# ============================== #
+#|          POLAR PACKING       |#
+# ============================== #
+def packPolars(allPolars: pd.DataFrame):
+    # (names, alpha, cl, cd, mask) with arrays of shape (airfoils, maxPoints), alpha-sorted rows
+    codes,names = pd.factorize(allPolars['airfoil'])
+    alpha = allPolars['alpha'].to_numpy(dtype=float)
+    order = np.lexsort((alpha,codes))
+    codes = codes[order]
+    counts = np.bincount(codes,minlength=len(names))
+    starts = np.concatenate([[0],np.cumsum(counts)[:-1]])
+    positions = np.arange(len(codes)) - starts[codes]
+
+    shape = (len(names),int(counts.max()) if len(counts) else 0)
+    packed = []
+    for column in ('alpha','cl','cd'):
+        values = np.full(shape,np.nan)
+        values[codes,positions] = allPolars[column].to_numpy(dtype=float)[order]
+        packed.append(values)
+    mask = np.zeros(shape,dtype=bool)
+    mask[codes,positions] = True
+    return list(names),packed[0],packed[1],packed[2],mask
+
+# ============================== #
+#|        BATCHED METRICS       |#
+# ============================== #
+def maskedLineFit(x: np.ndarray,y: np.ndarray,mask: np.ndarray):
+    # Least-squares line over the masked entries of the last axis, for any leading shape, from
+    # the raw moment sums. Returns (slope, intercept, ssResiduals, ssTotal, count).
+    xMasked = np.where(mask,x,0.0)
+    yMasked = np.where(mask,y,0.0)
+    count = np.count_nonzero(mask,axis=-1)
+    sumX = xMasked.sum(axis=-1)
+    sumY = yMasked.sum(axis=-1)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        sxx = np.einsum('...i,...i->...',xMasked,xMasked) - sumX * sumX / count
+        sxy = np.einsum('...i,...i->...',xMasked,yMasked) - sumX * sumY / count
+        syy = np.einsum('...i,...i->...',yMasked,yMasked) - sumY * sumY / count
+        slope = sxy / sxx
+        intercept = (sumY - slope * sumX) / count
+    return slope,intercept,np.maximum(syy - slope * sxy,0.0),syy,count
+
+def firstMax(alpha: np.ndarray,values: np.ndarray,mask: np.ndarray):
+    # (alpha at the maximum, maximum) over the masked last axis; ties go to the lowest alpha
+    masked = np.where(mask,values,-np.inf)
+    peak = masked.max(axis=-1,keepdims=True)
+    atPeak = mask & (masked == peak)
+    alphaAtPeak = np.where(atPeak,alpha,np.inf).min(axis=-1)
+    found = np.isfinite(peak[...,0])
+    return np.where(found,alphaAtPeak,np.nan),np.where(found,peak[...,0],np.nan)
+
+def batchedMetrics(alpha,cl,cd,mask,alphaMin: float,stallMargin: float,residualLimit: float) -> dict:
+    # Stall and lift-curve metrics over the last axis of (..., points) arrays
+    hasCl = mask & ~np.isnan(cl)
+    alphaAtClMax,clMax = firstMax(alpha,cl,hasCl)
+    postStall = hasCl & (alpha > alphaAtClMax[...,None])
+    clMinPost = np.where(postStall,cl,np.inf).min(axis=-1)
+    clDrop = np.where(postStall.any(axis=-1),clMax - clMinPost,np.nan)
+
+    with np.errstate(invalid='ignore'):
+        valid = hasCl & (cd > 0.0) & (cd < 5.0) & (np.abs(cl) < 3.5)
+        alphaStallValid,_ = firstMax(alpha,cl,valid)
+        candidates = valid & (alpha >= alphaMin) & (alpha <= (alphaStallValid - stallMargin)[...,None])
+    slope,intercept,_,_,candidateCount = maskedLineFit(alpha,cl,candidates)
+
+    with np.errstate(invalid='ignore'):
+        residuals = cl - (slope[...,None] * alpha + intercept[...,None])
+        linear = candidates & (np.abs(residuals) <= residualLimit)
+    linear = np.where((np.count_nonzero(linear,axis=-1) < 3)[...,None],candidates,linear)
+    slope,_,ssResiduals,ssTotal,_ = maskedLineFit(alpha,cl,linear)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        r2 = np.where(ssTotal == 0,np.nan,1.0 - ssResiduals / ssTotal)
+
+    enoughPoints = candidateCount >= 3
+    return {
+        "alphaAtClMax": alphaAtClMax,
+        "clMax": clMax,
+        "ClDropPostStall": clDrop,
+        "liftCurveSlope": np.where(enoughPoints,slope,np.nan),
+        "linearFitR2": np.where(enoughPoints,r2,np.nan),
+    }
+
+# ============================== #
+#|          RESAMPLING          |#
+# ============================== #
+def resamplePolars(alpha,cl,cd,mask,samples: int,method: str,rng: np.random.Generator,
+                   clTolerance: float,cdTolerance: float):
+    # (samples, airfoils, points) resampled arrays and mask
+    if method == "bootstrap":
+        # Draw each polar's own point count with replacement; padding stays masked out
+        counts = mask.sum(axis=-1)
+        picks = np.floor(rng.random((samples,) + alpha.shape) * counts[None,:,None]).astype(np.int64)
+        picks = np.minimum(picks,np.maximum(counts - 1,0)[None,:,None])
+        take = lambda values: np.take_along_axis(np.broadcast_to(values,picks.shape),picks,axis=-1)
+        return take(alpha),take(cl),take(cd),np.broadcast_to(mask,picks.shape)
+    if method == "jitter":
+        shape = (samples,) + alpha.shape
+        clJitter = cl + rng.normal(0.0,clTolerance,shape)
+        cdJitter = cd * (1.0 + rng.normal(0.0,cdTolerance,shape))
+        return np.broadcast_to(alpha,shape),clJitter,cdJitter,np.broadcast_to(mask,shape)
+    raise ValueError(f"Unknown resampling method {method!r}; use one of {UNCERTAINTY_METHODS}.")
+
+def percentileBounds(values: np.ndarray,tail: float):
+    # (tail, 1 - tail) linear-interpolated percentiles and std over axis 0, ignoring NaNs. One
+    # sort of the whole block instead of np.nanquantile's per-column loop.
+    ordered = np.sort(values,axis=0) # NaNs sort last
+    finiteCount = np.count_nonzero(~np.isnan(values),axis=0)
+    bounds = []
+    for fraction in (tail,1.0 - tail):
+        position = fraction * np.maximum(finiteCount - 1,0)
+        below = np.floor(position).astype(np.int64)
+        above = np.minimum(below + 1,np.maximum(finiteCount - 1,0))
+        lowValue = np.take_along_axis(ordered,below[None],axis=0)[0]
+        highValue = np.take_along_axis(ordered,above[None],axis=0)[0]
+        bounds.append(np.where(finiteCount > 0,lowValue + (position - below) * (highValue - lowValue),np.nan))
+    with np.errstate(invalid='ignore',divide='ignore'):
+        mean = np.nansum(values,axis=0) / finiteCount
+        spread = np.sqrt(np.nansum((values - mean) ** 2,axis=0) / finiteCount)
+    return bounds[0],bounds[1],spread
+
+def metricConfidenceIntervals(allPolars: pd.DataFrame,samples: int = 1000,method: str = "bootstrap",
+                              confidence: float = 0.95,seed: int = None,alphaMin: float = -4.0,
+                              stallMargin: float = 2.0,residualLimit: float = 0.8,
+                              clTolerance: float = 0.005,cdTolerance: float = 0.02) -> pd.DataFrame:
+    # Per airfoil: each metric's point estimate plus <metric>_ciLow / _ciHigh percentile bounds
+    # and <metric>_std over the resamples. clTolerance is absolute, cdTolerance relative
+    # (jitter method only).
+    rng = np.random.default_rng(seed)
+    names,alpha,cl,cd,mask = packPolars(allPolars)
+    fitSettings = dict(alphaMin=alphaMin,stallMargin=stallMargin,residualLimit=residualLimit)
+    estimates = batchedMetrics(alpha,cl,cd,mask,**fitSettings)
+
+    # Airfoils are processed in chunks so samples x chunk x points stays bounded
+    pointCount = max(alpha.shape[1],1)
+    chunk = max(1,UNCERTAINTY_CHUNK_VALUES // (max(samples,1) * pointCount))
+    tail = (1.0 - confidence) / 2.0
+    columns = {}
+    for metric in UNCERTAINTY_METRICS:
+        columns[metric] = estimates[metric]
+        for suffix in ("ciLow","ciHigh","std"):
+            columns[f"{metric}_{suffix}"] = np.full(len(names),np.nan)
+
+    for start in range(0,len(names),chunk):
+        block = slice(start,start + chunk)
+        resampled = resamplePolars(alpha[block],cl[block],cd[block],mask[block],samples,method,rng,
+                                   clTolerance,cdTolerance)
+        distributions = batchedMetrics(*resampled,**fitSettings)
+        for metric,values in distributions.items():
+            low,high,spread = percentileBounds(values,tail)
+            columns[f"{metric}_ciLow"][block] = low
+            columns[f"{metric}_ciHigh"][block] = high
+            columns[f"{metric}_std"][block] = spread
+
+    return pd.DataFrame(columns,index=pd.Index(names,name="airfoil"))
+
+def intervalTable(intervals: pd.DataFrame,metrics=UNCERTAINTY_METRICS,digits: int = 4) -> pd.DataFrame:
+    # "estimate [low, high]" strings per metric, for printing and the markdown report
+    table = pd.DataFrame(index=intervals.index)
+    for metric in metrics:
+        table[metric] = [
+            f"{estimate:.{digits}f} [{low:.{digits}f}, {high:.{digits}f}]"
+            for estimate,low,high in zip(intervals[metric],intervals[f"{metric}_ciLow"],intervals[f"{metric}_ciHigh"])
+        ]
+    return table
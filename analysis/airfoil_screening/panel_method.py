@@ -0,0 +1,175 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Inviscid Panel Method Pre-Filter
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Linear-strength vortex panel method (Kuethe & Chow formulation) written entirely in
+# NumPy. Each airfoil is repaneled onto the same number of cosine-spaced panels so a
+# batch of geometries can be stacked into one (batch, N+1, N+1) influence system. The
+# system is factored once per geometry and every angle of attack is solved as one
+# column of a batched right-hand side, giving inviscid Cl, Cm(c/4) and Cp.
+#
+# airfoil_screening.py uses the results as a cheap first stage: airfoils whose inviscid
+# zero-lift angle or pitching moment fall outside the configured bands never reach XFoil.
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from airfoil_geometry import loadAirfoilGeometry
+
+PANEL_COUNT = 160 # Panels per airfoil after repaneling
+PANEL_BATCH_SIZE = 64 # Geometries solved per stacked system; bounds memory at ~N^2 * batch floats
+PANEL_ALPHAS = np.arange(-4.0,8.0 + 1.0,1.0) # Inviscid sweep, degrees; kept in the attached-flow range
+
+# ============================== #
+#|           GEOMETRY           |#
+# ============================== #
+def loadPaneledAirfoil(datPath: Path,panels: int = PANEL_COUNT,cacheDirectory: Path = None):
+    # Cosine-repaneled nodes in Selig order from the shared (optionally cached) geometry
+    geometry = loadAirfoilGeometry(datPath,panels,cacheDirectory)
+    return geometry["x"],geometry["y"]
+
+# ============================== #
+#|       INFLUENCE SYSTEM       |#
+# ============================== #
+def influenceMatrices(xNodes: np.ndarray,yNodes: np.ndarray):
+    # xNodes, yNodes: (batch, N+1) boundary points ordered clockwise (TE -> lower -> LE -> upper).
+    # Returns the normal-velocity system (batch, N+1, N+1) with the Kutta row last, the
+    # tangential-velocity matrix (batch, N, N+1) and the panel geometry.
+    dx = np.diff(xNodes,axis=-1)
+    dy = np.diff(yNodes,axis=-1)
+    length = np.hypot(dx,dy)
+    theta = np.arctan2(dy,dx)
+    xControl = 0.5 * (xNodes[...,:-1] + xNodes[...,1:])
+    yControl = 0.5 * (yNodes[...,:-1] + yNodes[...,1:])
+
+    # Index [..., i, j]: control point i, panel j. Angle differences are expanded with the
+    # sum/difference identities so only per-panel sines and cosines are ever evaluated.
+    rx = xControl[...,:,None] - xNodes[...,None,:-1]
+    ry = yControl[...,:,None] - yNodes[...,None,:-1]
+    cosI,sinI = np.cos(theta)[...,:,None],np.sin(theta)[...,:,None]
+    cosJ,sinJ = np.cos(theta)[...,None,:],np.sin(theta)[...,None,:]
+    cos2J,sin2J = np.cos(2.0 * theta)[...,None,:],np.sin(2.0 * theta)[...,None,:]
+    lengthJ = length[...,None,:]
+
+    A = -rx * cosJ - ry * sinJ
+    B = rx**2 + ry**2
+    C = sinI * cosJ - cosI * sinJ # sin(theta_i - theta_j)
+    D = cosI * cosJ + sinI * sinJ # cos(theta_i - theta_j)
+    E = rx * sinJ - ry * cosJ
+    cosI2J = cosI * cos2J + sinI * sin2J # cos(theta_i - 2 theta_j)
+    sinI2J = sinI * cos2J - cosI * sin2J # sin(theta_i - 2 theta_j)
+    P = rx * sinI2J + ry * cosI2J
+    Q = rx * cosI2J - ry * sinI2J
+
+    diagonal = np.arange(theta.shape[-1])
+    B[...,diagonal,diagonal] = 1.0 # Self-influence is set analytically below
+    F = np.log1p(lengthJ * (lengthJ + 2.0 * A) / B)
+    G = np.arctan2(E * lengthJ,B + A * lengthJ)
+
+    cn2 = D + (0.5 * Q * F - (A * C + D * E) * G) / lengthJ
+    cn1 = 0.5 * D * F + C * G - cn2
+    ct2 = C + (0.5 * P * F + (A * D - C * E) * G) / lengthJ
+    ct1 = 0.5 * C * F - D * G - ct2
+    cn1[...,diagonal,diagonal] = -1.0
+    cn2[...,diagonal,diagonal] = 1.0
+    ct1[...,diagonal,diagonal] = 0.5 * np.pi
+    ct2[...,diagonal,diagonal] = 0.5 * np.pi
+
+    # Node j collects the end of panel j-1 and the start of panel j
+    batchShape = theta.shape[:-1]
+    panelCount = theta.shape[-1]
+    normalSystem = np.zeros(batchShape + (panelCount + 1,panelCount + 1))
+    normalSystem[...,:-1,:-1] += cn1
+    normalSystem[...,:-1,1:] += cn2
+    normalSystem[...,-1,0] = 1.0 # Kutta condition: gamma_TE,lower + gamma_TE,upper = 0
+    normalSystem[...,-1,-1] = 1.0
+    tangentSystem = np.zeros(batchShape + (panelCount,panelCount + 1))
+    tangentSystem[...,:,:-1] += ct1
+    tangentSystem[...,:,1:] += ct2
+
+    return normalSystem,tangentSystem,theta,length,xControl,yControl
+
+def solvePanelBatch(xNodes: np.ndarray,yNodes: np.ndarray,alphas) -> dict:
+    # xNodes, yNodes: (batch, N+1) in Selig order from airfoil_geometry.repanelAirfoil. Solves every alpha for
+    # every geometry with one factorization per geometry (np.linalg.solve on a multi-column RHS).
+    xNodes = np.atleast_2d(xNodes)[...,::-1]
+    yNodes = np.atleast_2d(yNodes)[...,::-1]
+    alphaRadians = np.radians(np.asarray(alphas,dtype=float))
+
+    normalSystem,tangentSystem,theta,length,xControl,yControl = influenceMatrices(xNodes,yNodes)
+
+    # (batch, N+1, nAlpha): one column per angle of attack, Kutta row zero
+    rhs = np.zeros(theta.shape[:-1] + (theta.shape[-1] + 1,alphaRadians.size))
+    rhs[...,:-1,:] = np.sin(theta[...,:,None] - alphaRadians)
+    gamma = np.linalg.solve(normalSystem,rhs)
+
+    velocity = np.cos(theta[...,:,None] - alphaRadians) + tangentSystem @ gamma
+    cp = 1.0 - velocity**2 # (batch, N, nAlpha)
+
+    # Pressure forces on each panel; outward normal of a clockwise contour is (-sin, cos)
+    normalX = -np.sin(theta)[...,:,None]
+    normalY = np.cos(theta)[...,:,None]
+    panelLength = length[...,:,None]
+    forceX = -np.sum(cp * normalX * panelLength,axis=-2)
+    forceY = -np.sum(cp * normalY * panelLength,axis=-2)
+    cl = forceY * np.cos(alphaRadians) - forceX * np.sin(alphaRadians)
+    cm = np.sum(cp * panelLength * ((xControl[...,:,None] - 0.25) * normalY
+                                    - yControl[...,:,None] * normalX),axis=-2)
+
+    # Back to Selig order so Cp lines up with the nodes returned by loadPaneledAirfoil
+    return {
+        "alpha": np.degrees(alphaRadians),
+        "cl": cl,
+        "cm": cm,
+        "cp": cp[...,::-1,:],
+        "xControl": xControl[...,::-1],
+        "yControl": yControl[...,::-1],
+    }
+
+# ============================== #
+#|           PRE-FILTER         |#
+# ============================== #
+def summarizeInviscid(solution: dict) -> dict:
+    # Least-squares Cl(alpha) line per geometry gives the inviscid lift slope and zero-lift angle
+    alpha = solution["alpha"]
+    cl = solution["cl"]
+    alphaCentered = alpha - alpha.mean()
+    slope = (cl - cl.mean(axis=-1,keepdims=True)) @ alphaCentered / np.sum(alphaCentered**2)
+    intercept = cl.mean(axis=-1) - slope * alpha.mean()
+    zeroIndex = int(np.argmin(np.abs(alpha)))
+    return {
+        "inviscidLiftSlope": slope,
+        "alphaZeroLift": -intercept / slope,
+        "clAlpha0": cl[...,zeroIndex],
+        "cmQuarterChord": solution["cm"].mean(axis=-1),
+        "cmSpread": np.ptp(solution["cm"],axis=-1),
+    }
+
+def panelScreen(airfoils,geometryDirectory: Path,alphas=PANEL_ALPHAS,panels: int = PANEL_COUNT,
+                batchSize: int = PANEL_BATCH_SIZE,cacheDirectory: Path = None) -> pd.DataFrame:
+    # Inviscid summary per airfoil, indexed by name; unreadable geometries are reported and skipped
+    names,xRows,yRows = [],[],[]
+    for airfoilName in airfoils:
+        try:
+            xNodes,yNodes = loadPaneledAirfoil(Path(geometryDirectory) / f"{airfoilName}.dat",panels,cacheDirectory)
+        except (ValueError,IndexError,OSError) as error:
+            print(f"[WARNING] Panel pre-filter could not read {airfoilName}: {error}\n")
+            continue
+        names.append(airfoilName)
+        xRows.append(xNodes)
+        yRows.append(yNodes)
+
+    summaries = []
+    for start in range(0,len(names),batchSize):
+        solution = solvePanelBatch(np.array(xRows[start:start + batchSize]),
+                                   np.array(yRows[start:start + batchSize]),alphas)
+        summaries.append(pd.DataFrame(summarizeInviscid(solution)))
+
+    if not summaries:
+        return pd.DataFrame(columns=["inviscidLiftSlope","alphaZeroLift","clAlpha0",
+                                     "cmQuarterChord","cmSpread"])
+    summary = pd.concat(summaries,ignore_index=True)
+    summary.index = pd.Index(names,name="airfoil")
+    return summary
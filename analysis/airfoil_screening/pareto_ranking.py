@@ -0,0 +1,182 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Pareto Ranking
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Multi-objective ranking that does not depend on hand-picked weights. Finds the
+# non-dominated (Pareto) set over any metric columns, peels successive Pareto layers,
+# and keeps an incrementally updated frontier and top-k list for candidate sets that
+# arrive in batches (e.g. a catalog screened a few hundred airfoils at a time).
+#
+# Objectives are given as {column: "max" | "min"} and are turned into a cost matrix where
+# every column is minimized; NaN metrics count as the worst possible value.
+
+import heapq
+import itertools
+import numpy as np
+import pandas as pd
+
+BRUTE_FORCE_SIZE = 64 # Below this many points the dominance check is one vectorized comparison
+
+# ============================== #
+#|          COST MATRIX         |#
+# ============================== #
+def objectiveCosts(metrics: pd.DataFrame,objectives: dict) -> np.ndarray:
+    costs = np.empty((len(metrics),len(objectives)))
+    for column,(name,sense) in enumerate(objectives.items()):
+        if sense not in ("max","min"):
+            raise ValueError(f"Objective sense for {name} must be 'max' or 'min', not {sense!r}.")
+        values = metrics[name].to_numpy(dtype=float)
+        costs[:,column] = -values if sense == "max" else values
+    return np.where(np.isnan(costs),np.inf,costs)
+
+# ============================== #
+#|        NON-DOMINATED SET     |#
+# ============================== #
+def bruteForceFront(costs: np.ndarray) -> np.ndarray:
+    # costs rows are unique; row i is dominated if some other row is <= in every column
+    weaklyBetter = np.all(costs[:,None,:] <= costs[None,:,:],axis=-1)
+    np.fill_diagonal(weaklyBetter,False)
+    return ~weaklyBetter.any(axis=0)
+
+def kungFront(costs: np.ndarray) -> np.ndarray:
+    # Kung's divide and conquer on rows sorted lexicographically: the front of the better
+    # half is final, and a row of the worse half survives only if no row of that front
+    # dominates it. Returns the surviving row positions.
+    if len(costs) <= BRUTE_FORCE_SIZE:
+        return np.flatnonzero(bruteForceFront(costs))
+    middle = len(costs) // 2
+    topFront = kungFront(costs[:middle])
+    bottomFront = kungFront(costs[middle:]) + middle
+    top,bottom = costs[topFront],costs[bottomFront]
+    dominated = np.zeros(len(bottomFront),dtype=bool)
+    for start in range(0,len(topFront),BRUTE_FORCE_SIZE):
+        block = top[start:start + BRUTE_FORCE_SIZE]
+        dominated |= np.all(block[:,None,:] <= bottom[None,:,:],axis=-1).any(axis=0)
+    return np.concatenate([topFront,bottomFront[~dominated]])
+
+def paretoFrontMask(costs: np.ndarray) -> np.ndarray:
+    # True for every non-dominated row of a minimization cost matrix. Identical rows do not
+    # dominate each other, so duplicates of a frontier point are all kept. Two objectives use
+    # an O(N log N) sort-and-sweep; more use Kung's divide and conquer.
+    costs = np.asarray(costs,dtype=float)
+    if costs.ndim != 2 or len(costs) == 0:
+        return np.zeros(len(costs),dtype=bool)
+
+    uniqueCosts,inverse = np.unique(costs,axis=0,return_inverse=True) # Lexicographically sorted
+    inverse = inverse.reshape(-1)
+    if uniqueCosts.shape[1] == 1:
+        uniqueFront = np.arange(len(uniqueCosts)) == 0
+    elif uniqueCosts.shape[1] == 2:
+        # After the sort, a row is dominated exactly when an earlier row has a second cost <= its own
+        previousBest = np.minimum.accumulate(np.concatenate([[np.inf],uniqueCosts[:-1,1]]))
+        uniqueFront = uniqueCosts[:,1] < previousBest
+    else:
+        uniqueFront = np.zeros(len(uniqueCosts),dtype=bool)
+        uniqueFront[kungFront(uniqueCosts)] = True
+    return uniqueFront[inverse]
+
+def paretoLayers(costs: np.ndarray,maxLayers: int = None) -> np.ndarray:
+    # Non-dominated sorting: layer 0 is the Pareto front, layer 1 the front of what remains,
+    # and so on. Rows beyond maxLayers are left at -1.
+    costs = np.asarray(costs,dtype=float)
+    layers = np.full(len(costs),-1,dtype=int)
+    remaining = np.arange(len(costs))
+    for layer in itertools.count():
+        if remaining.size == 0 or (maxLayers is not None and layer >= maxLayers):
+            break
+        front = paretoFrontMask(costs[remaining])
+        layers[remaining[front]] = layer
+        remaining = remaining[~front]
+    return layers
+
+def paretoTable(metrics: pd.DataFrame,objectives: dict,maxLayers: int = None) -> pd.DataFrame:
+    # metrics with 'paretoLayer' (0 = frontier) and 'paretoOptimal' columns added
+    ranked = metrics.copy()
+    ranked['paretoLayer'] = paretoLayers(objectiveCosts(metrics,objectives),maxLayers)
+    ranked['paretoOptimal'] = ranked['paretoLayer'] == 0
+    return ranked
+
+# ============================== #
+#|       STREAMING FRONTIER     |#
+# ============================== #
+class ParetoArchive:
+    # Frontier of every candidate added so far. A batch is reduced to its own front first, so
+    # each update compares only frontier against frontier instead of re-ranking the whole set.
+    def __init__(self,objectives: dict):
+        self.objectives = dict(objectives)
+        self.names = np.empty(0,dtype=object)
+        self.costs = np.empty((0,len(self.objectives)))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def addMetrics(self,metrics: pd.DataFrame) -> int:
+        # metrics is indexed by airfoil name; returns how many of its rows joined the frontier
+        return self.add(metrics.index.to_numpy(dtype=object),objectiveCosts(metrics,self.objectives))
+
+    def add(self,names,costs: np.ndarray) -> int:
+        names = np.asarray(names,dtype=object)
+        costs = np.atleast_2d(np.asarray(costs,dtype=float))
+        batchFront = paretoFrontMask(costs)
+        names,costs = names[batchFront],costs[batchFront]
+
+        allNames = np.concatenate([self.names,names])
+        allCosts = np.vstack([self.costs,costs])
+        keep = paretoFrontMask(allCosts)
+        self.names,self.costs = allNames[keep],allCosts[keep]
+        return int(keep[len(keep) - len(names):].sum())
+
+    def frontier(self) -> pd.DataFrame:
+        # Costs are reported back in the metrics' own sign convention
+        values = self.costs.copy()
+        for column,sense in enumerate(self.objectives.values()):
+            if sense == "max":
+                values[:,column] = -values[:,column]
+        values[np.isinf(values)] = np.nan
+        return pd.DataFrame(values,index=pd.Index(self.names,name="airfoil"),columns=list(self.objectives))
+
+class StreamingTopK:
+    # Best k candidates by a weighted sum of objectives normalized with fixed bounds, so a new
+    # batch never forces earlier candidates to be re-normalized or re-sorted. Each batch costs
+    # one vectorized score plus O(b log k) heap updates.
+    def __init__(self,k: int,weights: dict,bounds: dict):
+        # weights: {column: weight} with negative weights for lower-is-better columns;
+        # bounds: {column: (low, high)} used to scale each column to roughly [0, 1]
+        self.k = k
+        self.columns = list(weights)
+        self.weights = np.array([weights[column] for column in self.columns],dtype=float)
+        self.low = np.array([bounds[column][0] for column in self.columns],dtype=float)
+        self.span = np.array([bounds[column][1] - bounds[column][0] for column in self.columns],dtype=float)
+        self.span[self.span == 0.0] = 1.0
+        self.heap = [] # (score, order, name); the worst kept candidate sits at heap[0]
+        self.counter = itertools.count()
+
+    def score(self,metrics: pd.DataFrame) -> np.ndarray:
+        values = (metrics[self.columns].to_numpy(dtype=float) - self.low) / self.span
+        return np.nan_to_num(values,nan=0.0) @ self.weights
+
+    def push(self,metrics: pd.DataFrame) -> None:
+        scores = self.score(metrics)
+        if len(scores) > self.k:
+            # Only the batch's own top k can enter the overall top k
+            best = np.argpartition(-scores,self.k - 1)[:self.k]
+        else:
+            best = np.arange(len(scores))
+        names = metrics.index.to_numpy(dtype=object)
+        for index in best:
+            entry = (float(scores[index]),next(self.counter),names[index])
+            if len(self.heap) < self.k:
+                heapq.heappush(self.heap,entry)
+            elif entry[0] > self.heap[0][0]:
+                heapq.heapreplace(self.heap,entry)
+
+    def top(self) -> pd.Series:
+        ordered = sorted(self.heap,key=lambda entry: (-entry[0],entry[1]))
+        return pd.Series([entry[0] for entry in ordered],
+                         index=pd.Index([entry[2] for entry in ordered],name="airfoil"),name="score")
+
+def objectiveBounds(metrics: pd.DataFrame,columns) -> dict:
+    # Reference (low, high) bounds for StreamingTopK, e.g. from a first batch or a past run
+    return {column: (float(metrics[column].min()),float(metrics[column].max())) for column in columns}
@@ -0,0 +1,195 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Pipeline Tracing
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Lightweight spans around pipeline stages and individual XFoil runs. Each span records
+# wall time, CPU time (of its own thread and of the whole process), the process's peak
+# resident memory when it closed, and an optional item count. Spans can be exported as
+# a Chrome trace (chrome://tracing or https://ui.perfetto.dev) and summarized per name.
+#
+# Tracing is off until TRACER.enable() is called; a disabled span is one shared no-op
+# object and a disabled traced() function is one attribute check, so the hooks can stay
+# in place permanently.
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import resource # Unix only; peak RSS is left empty elsewhere
+except ImportError:
+    resource = None
+
+def peakRssMB() -> float:
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+# ============================== #
+#|             SPANS            |#
+# ============================== #
+class NullSpan:
+    # Stand-in returned while tracing is disabled; accepts and drops everything
+    items = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        return False
+
+    def __setattr__(self,name,value):
+        pass
+
+NULL_SPAN = NullSpan()
+
+class Span:
+    __slots__ = ("tracer","name","category","details","items","startNs","threadCpuStart","processCpuStart")
+
+    def __init__(self,tracer,name: str,category: str,details: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.details = details
+        self.items = None
+
+    def __enter__(self):
+        self.threadCpuStart = time.thread_time()
+        self.processCpuStart = time.process_time()
+        self.startNs = time.perf_counter_ns()
+        return self
+
+    def __exit__(self,excType,exc,traceback):
+        endNs = time.perf_counter_ns()
+        self.tracer.record({
+            "name": self.name,
+            "category": self.category,
+            "thread": threading.get_ident(),
+            "startNs": self.startNs,
+            "wallSeconds": (endNs - self.startNs) * 1e-9,
+            "threadCpuSeconds": time.thread_time() - self.threadCpuStart,
+            "processCpuSeconds": time.process_time() - self.processCpuStart,
+            "peakRssMB": peakRssMB(),
+            "items": self.items,
+            "failed": excType is not None,
+            "details": self.details,
+        })
+        return False
+
+# ============================== #
+#|            TRACER            |#
+# ============================== #
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.lock = threading.Lock()
+        self.originNs = time.perf_counter_ns()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def reset(self) -> None:
+        with self.lock:
+            self.events = []
+        self.originNs = time.perf_counter_ns()
+
+    def record(self,event: dict) -> None:
+        with self.lock:
+            self.events.append(event)
+
+    def span(self,name: str,category: str = "stage",**details):
+        # with TRACER.span("parse",airfoils=5) as span: ...; span.items = rowCount
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self,name,category,details)
+
+    def traced(self,name: str = None,category: str = "stage",items=None,details=None):
+        # Decorator form of span(). items(result) gives the item count and details(*args,
+        # **kwargs) the arguments worth keeping; both are only called while tracing.
+        def decorate(function):
+            spanName = name or function.__name__
+
+            @functools.wraps(function)
+            def wrapper(*args,**kwargs):
+                if not self.enabled:
+                    return function(*args,**kwargs)
+                with Span(self,spanName,category,details(*args,**kwargs) if details else {}) as span:
+                    result = function(*args,**kwargs)
+                    if items is not None:
+                        span.items = items(result)
+                    return result
+            return wrapper
+        return decorate
+
+    # ===== Export ===== #
+    def chromeTrace(self) -> dict:
+        # Complete ("X") events in microseconds; each Python thread becomes one track
+        with self.lock:
+            events = list(self.events)
+        threadIds = {}
+        traceEvents = [{"name": "process_name","ph": "M","pid": os.getpid(),"args": {"name": "airfoil_screening"}}]
+        for event in events:
+            tid = threadIds.setdefault(event["thread"],len(threadIds))
+            arguments = dict(event["details"])
+            arguments.update({
+                "threadCpuSeconds": round(event["threadCpuSeconds"],6),
+                "processCpuSeconds": round(event["processCpuSeconds"],6),
+                "peakRssMB": round(event["peakRssMB"],1),
+            })
+            if event["items"] is not None:
+                arguments["items"] = event["items"]
+            if event["failed"]:
+                arguments["failed"] = True
+            traceEvents.append({
+                "name": event["name"],
+                "cat": event["category"],
+                "ph": "X",
+                "ts": (event["startNs"] - self.originNs) / 1000.0,
+                "dur": event["wallSeconds"] * 1e6,
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": arguments,
+            })
+        return {"traceEvents": traceEvents,"displayTimeUnit": "ms"}
+
+    def writeChromeTrace(self,path: Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.chromeTrace(),default=str),encoding="utf-8")
+        return path
+
+    def summary(self) -> "pd.DataFrame":
+        import pandas as pd # Only needed for the summary table; keeps TRACER cheap to import
+        # One row per span name: calls, wall/CPU totals, the slowest call and the peak RSS seen
+        with self.lock:
+            events = list(self.events)
+        columns = ["category","calls","wallSeconds","meanWallSeconds","maxWallSeconds",
+                   "threadCpuSeconds","processCpuSeconds","items","peakRssMB","failures"]
+        if not events:
+            return pd.DataFrame(columns=columns)
+        table = pd.DataFrame(events)
+        table["items"] = pd.to_numeric(table["items"],errors="coerce")
+        grouped = table.groupby("name",sort=False)
+        summary = pd.DataFrame({
+            "category": grouped["category"].first(),
+            "calls": grouped.size(),
+            "wallSeconds": grouped["wallSeconds"].sum(),
+            "meanWallSeconds": grouped["wallSeconds"].mean(),
+            "maxWallSeconds": grouped["wallSeconds"].max(),
+            "threadCpuSeconds": grouped["threadCpuSeconds"].sum(),
+            "processCpuSeconds": grouped["processCpuSeconds"].sum(),
+            "items": grouped["items"].sum(min_count=1),
+            "peakRssMB": grouped["peakRssMB"].max(),
+            "failures": grouped["failed"].sum(),
+        })
+        return summary[columns]
+
+TRACER = Tracer() # Shared by every module of the pipeline
@@ -0,0 +1,192 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: XFoil Polar Reading and Writing
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Reads XFoil polar save files straight into NumPy columns, including the header
+# metadata (Re, Mach, Ncrit, xtrf), and writes polars back out in XFoil's layout or
+# in a compact columnar format (.npz, or .parquet when pyarrow is installed). pandas is
+# only imported by the functions that build DataFrames, so the XFoil runners stay quick
+# to import.
+
+import re as regex
+from pathlib import Path
+import numpy as np
+
+POLAR_COLUMNS = ["alpha","cl","cd","cdp","cm","top_xtr","bot_xtr"]
+
+HEADER_NAME = regex.compile(r"Calculated polar for:\s*(.*?)\s*$",regex.MULTILINE)
+HEADER_XTRF = regex.compile(r"xtrf\s*=\s*([-\d.]+)\s*\(top\)\s*([-\d.]+)\s*\(bottom\)")
+HEADER_FLOW = regex.compile(
+    r"Mach\s*=\s*([-\d.]+)\s+Re\s*=\s*([-\d.]+)\s*e\s*([-\d]+)\s+Ncrit\s*=\s*([-\d.]+)"
+)
+
+# ============================== #
+#|          POLAR READING       |#
+# ============================== #
+def parsePolarRows(lines) -> list:
+    rows = []
+    for line in lines:
+        parts = line.split()
+        if len(parts) != 7:
+            continue
+        try:
+            values = [float(part) for part in parts]
+        except ValueError:
+            continue
+        rows.append(dict(zip(POLAR_COLUMNS,values)))
+    return rows
+
+def parsePolarHeader(headerText: str) -> dict:
+    metadata = {"name": None,"re": np.nan,"mach": np.nan,"ncrit": np.nan,
+                "xtrf_top": np.nan,"xtrf_bottom": np.nan}
+
+    nameMatch = HEADER_NAME.search(headerText)
+    if nameMatch:
+        metadata["name"] = nameMatch.group(1)
+
+    xtrfMatch = HEADER_XTRF.search(headerText)
+    if xtrfMatch:
+        metadata["xtrf_top"] = float(xtrfMatch.group(1))
+        metadata["xtrf_bottom"] = float(xtrfMatch.group(2))
+
+    flowMatch = HEADER_FLOW.search(headerText)
+    if flowMatch:
+        metadata["mach"] = float(flowMatch.group(1))
+        metadata["re"] = float(flowMatch.group(2)) * 10.0 ** int(flowMatch.group(3))
+        metadata["ncrit"] = float(flowMatch.group(4))
+
+    return metadata
+
+def fixedWidthSpans(dashLine: str) -> list:
+    # The dashed rule under the column titles marks each column's extent; a row field
+    # runs from the end of the previous rule to the end of its own.
+    spans = []
+    start = 0
+    for match in regex.finditer(r"-+",dashLine):
+        spans.append((start,match.end()))
+        start = match.end()
+    return spans
+
+def parseFixedWidthRows(lines,spans) -> np.ndarray:
+    # Slow path for rows whitespace splitting cannot handle, e.g. run-together fields
+    values = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = [float(line[start:end]) for start,end in spans]
+        except ValueError:
+            continue
+        if len(row) == len(POLAR_COLUMNS):
+            values.append(row)
+    return np.array(values,dtype=float).reshape(-1,len(POLAR_COLUMNS))
+
+def readPolarArrays(polarFile: Path):
+    # Returns (metadata, {column: ndarray}) for one XFoil polar save file
+    text = Path(polarFile).read_text(encoding="utf-8",errors="replace")
+
+    dashMatch = regex.search(r"^[ \t]*-{4,}[ -]*$",text,regex.MULTILINE)
+    if dashMatch is None:
+        metadata = parsePolarHeader(text)
+        return metadata,{column: np.empty(0) for column in POLAR_COLUMNS}
+
+    metadata = parsePolarHeader(text[:dashMatch.start()])
+    body = text[dashMatch.end():]
+
+    # Fast path: every table cell is a whitespace-separated float
+    tokens = body.split()
+    values = None
+    if len(tokens) % len(POLAR_COLUMNS) == 0:
+        try:
+            values = np.array(tokens,dtype=float).reshape(-1,len(POLAR_COLUMNS))
+        except ValueError:
+            values = None
+    if values is None:
+        values = parseFixedWidthRows(body.splitlines(),fixedWidthSpans(dashMatch.group(0)))
+
+    return metadata,{column: values[:,index] for index,column in enumerate(POLAR_COLUMNS)}
+
+def readPolarTable(polarFiles,labels=None) -> "pd.DataFrame":
+    # Reads many polar files into one long table with a single DataFrame construction.
+    # Each row carries its polar's label (default: file stem) and header Re/Mach/Ncrit.
+    import pandas as pd
+    polarFiles = [Path(polarFile) for polarFile in polarFiles]
+    if labels is None:
+        labels = [polarFile.stem for polarFile in polarFiles]
+
+    columnParts = {column: [] for column in POLAR_COLUMNS}
+    counts,reValues,machValues,ncritValues = [],[],[],[]
+    for polarFile in polarFiles:
+        metadata,columns = readPolarArrays(polarFile)
+        for column in POLAR_COLUMNS:
+            columnParts[column].append(columns[column])
+        counts.append(len(columns["alpha"]))
+        reValues.append(metadata["re"])
+        machValues.append(metadata["mach"])
+        ncritValues.append(metadata["ncrit"])
+
+    table = {"polar": np.repeat(np.asarray(labels,dtype=object),counts)}
+    table["re"] = np.repeat(np.asarray(reValues,dtype=float),counts)
+    table["mach"] = np.repeat(np.asarray(machValues,dtype=float),counts)
+    table["ncrit"] = np.repeat(np.asarray(ncritValues,dtype=float),counts)
+    for column in POLAR_COLUMNS:
+        table[column] = np.concatenate(columnParts[column]) if polarFiles else np.empty(0)
+    return pd.DataFrame(table)
+
+# ============================== #
+#|          POLAR WRITING       |#
+# ============================== #
+def formatPolarText(airfoilName: str,re: float,rows,mach: float = 0.0,ncrit: float = 9.0) -> str:
+    # Mirrors the layout of an XFoil PACC save file so parsePolar reads it unchanged
+    lines = [
+        " ",
+        "       XFOIL         Version 6.99",
+        " ",
+        f" Calculated polar for: {airfoilName}",
+        " ",
+        " 1 1 Reynolds number fixed          Mach number fixed",
+        " ",
+        " xtrf =   1.000 (top)        1.000 (bottom)",
+        f" Mach = {mach:7.3f}     Re = {re / 1.0e6:9.3f} e 6     Ncrit = {ncrit:7.3f}",
+        " ",
+        "   alpha    CL        CD       CDp       CM     Top_Xtr  Bot_Xtr",
+        "  ------ -------- --------- --------- -------- -------- --------",
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['alpha']:8.3f} {row['cl']:8.4f} {row['cd']:9.5f} {row['cdp']:9.5f} "
+            f"{row['cm']:8.4f} {row['top_xtr']:8.4f} {row['bot_xtr']:8.4f}"
+        )
+    return "\n".join(lines) + "\n"
+
+def writeColumnarPolar(outPath: Path,columns: dict,metadata: dict = None,fileFormat: str = "npz") -> Path:
+    outPath = Path(outPath)
+    metadata = metadata or {}
+    if fileFormat == "parquet":
+        # pyarrow (or fastparquet) must be installed for parquet output
+        import pandas as pd
+        dataframe = pd.DataFrame(columns)
+        dataframe.attrs.update({key: value for key,value in metadata.items() if value is not None})
+        outPath = outPath.with_suffix(".parquet")
+        dataframe.to_parquet(outPath,index=False)
+    elif fileFormat == "npz":
+        outPath = outPath.with_suffix(".npz")
+        numericMetadata = {
+            f"meta_{key}": np.float64(value) for key,value in metadata.items()
+            if isinstance(value,(int,float))
+        }
+        np.savez(outPath,**columns,**numericMetadata)
+    else:
+        raise ValueError(f"Unsupported columnar polar format: {fileFormat}")
+    return outPath
+
+def readColumnarPolar(path: Path) -> "pd.DataFrame":
+    # Inverse of writeColumnarPolar; the meta_* entries of an .npz are left out
+    import pandas as pd
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    with np.load(path) as archive:
+        return pd.DataFrame({key: archive[key] for key in archive.files if not key.startswith("meta_")})
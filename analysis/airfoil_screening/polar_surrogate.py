@@ -0,0 +1,233 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Polar Lookup-Table Surrogate
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Turns parsed polars into per-airfoil lookup tables on a rectilinear (alpha, Re) grid so
+# downstream tools can ask for Cl, Cd and Cm at arbitrary (alpha, Re) without touching
+# the CSVs. Queries are vectorized: linear interpolation in both directions, or a
+# monotone cubic (PCHIP) in alpha with linear blending in Re. Inverse queries (alpha for
+# a target Cl) use the rising branch of each Cl(alpha) row up to Cl max, found once at
+# build time. The whole surrogate is saved as one uncompressed .npz of packed arrays.
+#
+# Queries outside an airfoil's alpha or Re range return NaN; an airfoil with polars at a
+# single Re ignores the requested Re.
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+SURROGATE_COEFFICIENTS = ("cl","cd","cm")
+INTERPOLATION_METHODS = ("linear","pchip")
+
+# ============================== #
+#|         TABLE BUILDING       |#
+# ============================== #
+def fillRowGaps(values: np.ndarray) -> np.ndarray:
+    # Linear fill of interior NaNs (non-converged angles) along alpha; edges stay NaN
+    filled = values.copy()
+    columns = np.arange(values.shape[1])
+    for row in filled:
+        valid = ~np.isnan(row)
+        if valid.sum() >= 2:
+            first,last = np.flatnonzero(valid)[[0,-1]]
+            inside = (columns >= first) & (columns <= last) & ~valid
+            row[inside] = np.interp(columns[inside],columns[valid],row[valid])
+    return filled
+
+def pchipSlopes(x: np.ndarray,values: np.ndarray) -> np.ndarray:
+    # Fritsch-Carlson derivatives along the last axis; flat or sign-changing secants give
+    # zero slope, which keeps each interval monotone
+    h = np.diff(x)
+    secants = np.diff(values,axis=-1) / h
+    slopes = np.zeros_like(values)
+    if values.shape[-1] < 2:
+        return slopes
+    if values.shape[-1] == 2:
+        slopes[...,:] = secants
+        return np.nan_to_num(slopes)
+
+    left,right = secants[...,:-1],secants[...,1:]
+    weightLeft = 2.0 * h[1:] + h[:-1]
+    weightRight = h[1:] + 2.0 * h[:-1]
+    with np.errstate(divide="ignore",invalid="ignore"):
+        harmonic = (weightLeft + weightRight) / (weightLeft / left + weightRight / right)
+    sameSign = (np.sign(left) * np.sign(right)) > 0
+    slopes[...,1:-1] = np.where(sameSign,harmonic,0.0)
+
+    # One-sided three-point ends, limited so they never overshoot
+    for end,(d0,d1,h0,h1) in (
+        (0,(secants[...,0],secants[...,1],h[0],h[1])),
+        (-1,(secants[...,-1],secants[...,-2],h[-1],h[-2])),
+    ):
+        slope = ((2.0 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        slope = np.where(np.sign(slope) != np.sign(d0),0.0,slope)
+        slope = np.where((np.sign(d0) != np.sign(d1)) & (np.abs(slope) > 3.0 * np.abs(d0)),3.0 * d0,slope)
+        slopes[...,end] = slope
+    return np.nan_to_num(slopes)
+
+def risingBranch(cl: np.ndarray):
+    # (start, end) column indices of the strictly rising Cl run that ends at Cl max
+    if np.all(np.isnan(cl)):
+        return -1,-1
+    peak = int(np.nanargmax(cl))
+    start = peak
+    while start > 0 and not np.isnan(cl[start - 1]) and cl[start - 1] < cl[start]:
+        start -= 1
+    return start,peak
+
+# ============================== #
+#|           SURROGATE          |#
+# ============================== #
+class PolarSurrogate:
+    def __init__(self,airfoils: dict):
+        # airfoils: {name: {"alpha": (nAlpha,), "re": (nRe,), coefficient: (nRe, nAlpha),
+        #                    f"{coefficient}_slope": (nRe, nAlpha), "branch": (nRe, 2)}}
+        self.airfoils = airfoils
+
+    @classmethod
+    def fromPolars(cls,polars: pd.DataFrame,coefficients=SURROGATE_COEFFICIENTS):
+        # polars: long table with airfoil, re, alpha and coefficient columns (one Mach/Ncrit)
+        airfoils = {}
+        for name,group in polars.groupby('airfoil',sort=True):
+            alphaGrid = np.unique(np.round(group['alpha'].to_numpy(dtype=float),4))
+            reGrid = np.unique(group['re'].to_numpy(dtype=float))
+            rows = np.searchsorted(reGrid,group['re'].to_numpy(dtype=float))
+            columns = np.searchsorted(alphaGrid,np.round(group['alpha'].to_numpy(dtype=float),4))
+
+            entry = {"alpha": alphaGrid,"re": reGrid}
+            for coefficient in coefficients:
+                table = np.full((len(reGrid),len(alphaGrid)),np.nan)
+                table[rows,columns] = group[coefficient].to_numpy(dtype=float)
+                table = fillRowGaps(table)
+                entry[coefficient] = table
+                entry[f"{coefficient}_slope"] = pchipSlopes(alphaGrid,table)
+            if "cl" in entry:
+                entry["branch"] = np.array([risingBranch(row) for row in entry["cl"]],dtype=np.int64)
+            airfoils[str(name)] = entry
+        return cls(airfoils)
+
+    def names(self) -> list:
+        return list(self.airfoils)
+
+    # ===== Forward Queries ===== #
+    @staticmethod
+    def _alphaInterpolate(entry: dict,coefficient: str,rowIndex: np.ndarray,alpha: np.ndarray,
+                          method: str) -> np.ndarray:
+        alphaGrid = entry["alpha"]
+        table = entry[coefficient]
+        if len(alphaGrid) == 1:
+            return np.where(alpha == alphaGrid[0],table[rowIndex,0],np.nan)
+
+        column = np.clip(np.searchsorted(alphaGrid,alpha,side="right") - 1,0,len(alphaGrid) - 2)
+        h = alphaGrid[column + 1] - alphaGrid[column]
+        t = (alpha - alphaGrid[column]) / h
+        y0,y1 = table[rowIndex,column],table[rowIndex,column + 1]
+        if method == "linear":
+            values = y0 + t * (y1 - y0)
+        else:
+            slopes = entry[f"{coefficient}_slope"]
+            m0,m1 = slopes[rowIndex,column] * h,slopes[rowIndex,column + 1] * h
+            t2,t3 = t * t,t * t * t
+            values = ((2.0 * t3 - 3.0 * t2 + 1.0) * y0 + (t3 - 2.0 * t2 + t) * m0
+                      + (-2.0 * t3 + 3.0 * t2) * y1 + (t3 - t2) * m1)
+        outside = (alpha < alphaGrid[0]) | (alpha > alphaGrid[-1])
+        return np.where(outside,np.nan,values)
+
+    def _reBracket(self,entry: dict,re: np.ndarray):
+        # Lower row, upper row and blend weight for each query Re
+        reGrid = entry["re"]
+        if len(reGrid) == 1:
+            zeros = np.zeros(re.shape,dtype=np.int64)
+            return zeros,zeros,np.zeros(re.shape),np.zeros(re.shape,dtype=bool)
+        row = np.clip(np.searchsorted(reGrid,re,side="right") - 1,0,len(reGrid) - 2)
+        weight = (re - reGrid[row]) / (reGrid[row + 1] - reGrid[row])
+        outside = (re < reGrid[0]) | (re > reGrid[-1])
+        return row,row + 1,weight,outside
+
+    def evaluate(self,airfoil: str,coefficient: str,alpha,re=None,method: str = "linear") -> np.ndarray:
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError(f"Unknown interpolation method {method!r}; use one of {INTERPOLATION_METHODS}.")
+        entry = self.airfoils[airfoil]
+        alpha = np.asarray(alpha,dtype=float)
+        re = np.broadcast_to(np.asarray(entry["re"][0] if re is None else re,dtype=float),alpha.shape)
+
+        lowerRow,upperRow,weight,outside = self._reBracket(entry,re)
+        lower = self._alphaInterpolate(entry,coefficient,lowerRow,alpha,method)
+        if len(entry["re"]) == 1:
+            return lower
+        upper = self._alphaInterpolate(entry,coefficient,upperRow,alpha,method)
+        return np.where(outside,np.nan,lower + weight * (upper - lower))
+
+    def coefficients(self,airfoil: str,alpha,re=None,method: str = "linear") -> dict:
+        return {coefficient: self.evaluate(airfoil,coefficient,alpha,re,method)
+                for coefficient in SURROGATE_COEFFICIENTS if coefficient in self.airfoils[airfoil]}
+
+    # ===== Inverse Queries ===== #
+    def alphaForCl(self,airfoil: str,cl,re=None) -> np.ndarray:
+        # alpha reaching the target Cl on the rising branch below stall (NaN when it cannot)
+        entry = self.airfoils[airfoil]
+        cl = np.asarray(cl,dtype=float)
+        re = np.broadcast_to(np.asarray(entry["re"][0] if re is None else re,dtype=float),cl.shape)
+        lowerRow,upperRow,weight,outside = self._reBracket(entry,re)
+
+        alphaByRow = np.full((len(entry["re"]),) + cl.shape,np.nan)
+        for row,(start,end) in enumerate(entry["branch"]):
+            if start < 0 or end <= start:
+                continue
+            branchCl = entry["cl"][row,start:end + 1]
+            branchAlpha = entry["alpha"][start:end + 1]
+            alphaByRow[row] = np.interp(cl,branchCl,branchAlpha,left=np.nan,right=np.nan)
+
+        lower = np.take_along_axis(alphaByRow,lowerRow[None,...],axis=0)[0]
+        upper = np.take_along_axis(alphaByRow,upperRow[None,...],axis=0)[0]
+        return np.where(outside,np.nan,lower + weight * (upper - lower))
+
+    # ===== Serialization ===== #
+    def save(self,path: Path) -> Path:
+        # Every airfoil's arrays are concatenated into a few flat arrays plus offsets, so
+        # loading is a handful of contiguous reads regardless of the airfoil count.
+        path = Path(path).with_suffix(".npz")
+        names = self.names()
+        coefficients = [c for c in SURROGATE_COEFFICIENTS if names and c in self.airfoils[names[0]]]
+        alphaCounts = np.array([len(self.airfoils[name]["alpha"]) for name in names],dtype=np.int64)
+        reCounts = np.array([len(self.airfoils[name]["re"]) for name in names],dtype=np.int64)
+        packed = {
+            "names": np.array(names,dtype=np.str_),
+            "coefficients": np.array(coefficients,dtype=np.str_),
+            "alphaCounts": alphaCounts,
+            "reCounts": reCounts,
+            "alpha": np.concatenate([self.airfoils[name]["alpha"] for name in names]) if names else np.empty(0),
+            "re": np.concatenate([self.airfoils[name]["re"] for name in names]) if names else np.empty(0),
+            "branch": (np.concatenate([self.airfoils[name]["branch"] for name in names])
+                       if names and "cl" in coefficients else np.empty((0,2),dtype=np.int64)),
+        }
+        for key in coefficients + [f"{c}_slope" for c in coefficients]:
+            packed[key] = (np.concatenate([self.airfoils[name][key].ravel() for name in names]).astype(np.float32)
+                           if names else np.empty(0,dtype=np.float32))
+        np.savez(path,**packed)
+        return path
+
+    @classmethod
+    def load(cls,path: Path):
+        with np.load(Path(path).with_suffix(".npz")) as packed:
+            arrays = {key: packed[key] for key in packed.files}
+        coefficients = [str(c) for c in arrays["coefficients"]]
+        alphaOffsets = np.concatenate([[0],np.cumsum(arrays["alphaCounts"])])
+        reOffsets = np.concatenate([[0],np.cumsum(arrays["reCounts"])])
+        tableOffsets = np.concatenate([[0],np.cumsum(arrays["alphaCounts"] * arrays["reCounts"])])
+
+        airfoils = {}
+        for index,name in enumerate(arrays["names"]):
+            nAlpha,nRe = int(arrays["alphaCounts"][index]),int(arrays["reCounts"][index])
+            entry = {
+                "alpha": arrays["alpha"][alphaOffsets[index]:alphaOffsets[index + 1]],
+                "re": arrays["re"][reOffsets[index]:reOffsets[index + 1]],
+            }
+            if "cl" in coefficients:
+                entry["branch"] = arrays["branch"][reOffsets[index]:reOffsets[index + 1]]
+            for key in coefficients + [f"{c}_slope" for c in coefficients]:
+                entry[key] = arrays[key][tableOffsets[index]:tableOffsets[index + 1]].astype(float).reshape(nRe,nAlpha)
+            airfoils[str(name)] = entry
+        return cls(airfoils)
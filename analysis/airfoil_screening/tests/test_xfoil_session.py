@@ -0,0 +1,77 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: XFoil Session Tests
+#   Usage: python -m pytest analysis/airfoil_screening/tests
+# Drives XfoilSession and XfoilSessionPool against benchmarks/fake_xfoil.py.
+
+import stat
+import sys
+from pathlib import Path
+import pytest
+
+SCREENING_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0,str(SCREENING_DIR))
+from xfoil_session import SYNC_COMMAND,XfoilSession,XfoilSessionPool
+
+FAKE_XFOIL = SCREENING_DIR / "benchmarks" / "fake_xfoil.py"
+
+@pytest.fixture
+def fakeXfoil(tmp_path) -> Path:
+    # LF endings so the kernel reads the shebang as 'python3', not 'python3\r'
+    executable = tmp_path / "xfoil"
+    executable.write_bytes(FAKE_XFOIL.read_bytes().replace(b"\r\n",b"\n"))
+    executable.chmod(executable.stat().st_mode | stat.S_IXUSR)
+    return executable
+
+def writeAirfoil(directory: Path,name: str,content: str = None) -> Path:
+    path = directory / f"{name}.dat"
+    path.write_text(f"{name}\n1.0 0.0\n0.5 0.06\n0.0 0.0\n0.5 -0.06\n1.0 0.0\n" if content is None else content)
+    return path
+
+def test_marker_separates_consecutive_cases(tmp_path,fakeXfoil):
+    airfoil = writeAirfoil(tmp_path,"NACA2412")
+    session = XfoilSession(fakeXfoil,tmp_path / "session",timeout=30.0)
+    sent = []
+    send = session._send
+    session._send = lambda cmdLines: (sent.append(list(cmdLines)),send(cmdLines))
+    try:
+        first = session.runCase(airfoil,2e5,range(-2,6),ncrit=5.0)
+        second = session.runCase(airfoil,4e5,range(0,3))
+    finally:
+        session.close()
+
+    assert [row['alpha'] for row in first] == list(range(-2,6))
+    assert [row['alpha'] for row in second] == [0,1,2] # Nothing of the first case leaks through
+    assert first[2]['cd'] != second[0]['cd'] # alpha 0 at two different Re
+    assert sum(cmdLines == [SYNC_COMMAND] for cmdLines in sent) == 3 # Start plus one per case
+    # A case without an Ncrit is sent the default, not the 5.0 left over from the first case
+    secondCase = next(cmdLines for cmdLines in sent if "RE 400000" in cmdLines)
+    assert "N 9.0" in secondCase and "LOAD airfoil.dat" not in secondCase
+
+def test_non_converged_angles_are_left_out(tmp_path,fakeXfoil,monkeypatch):
+    monkeypatch.setenv("FAKE_XFOIL_FAIL_ALPHAS","2,3")
+    airfoil = writeAirfoil(tmp_path,"NACA2412")
+    session = XfoilSession(fakeXfoil,tmp_path / "session",iterations=100,timeout=30.0)
+    try:
+        rows = session.runCase(airfoil,2e5,range(0,6))
+    finally:
+        session.close()
+    assert [row['alpha'] for row in rows] == [0,1,4,5]
+
+def test_crashed_session_is_restarted(tmp_path,fakeXfoil):
+    # An empty geometry file makes the fake exit while loading it
+    good = writeAirfoil(tmp_path,"NACA2412")
+    broken = writeAirfoil(tmp_path,"BROKEN",content="")
+    other = writeAirfoil(tmp_path,"E168")
+    with XfoilSessionPool(fakeXfoil,1,tmp_path / "scratch",iterations=100,timeout=30.0) as pool:
+        session = pool.sessions[0]
+        results = pool.runCases([(good,2e5,range(0,4)),(broken,2e5,range(0,4)),(other,2e5,range(0,4))])
+        assert session.isAlive() and session.loadedGeometry == other
+    assert [len(rows) for rows in results] == [4,0,4]
+
+def test_hung_session_times_out(tmp_path,fakeXfoil,monkeypatch):
+    monkeypatch.setenv("FAKE_XFOIL_HANG","HANG")
+    hung = writeAirfoil(tmp_path,"HANG0012")
+    session = XfoilSession(fakeXfoil,tmp_path / "session",timeout=1.0)
+    with pytest.raises(TimeoutError):
+        session.runCase(hung,2e5,range(8,14))
+    assert not session.isAlive()
@@ -0,0 +1,86 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Score Weight Sensitivity
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Monte Carlo check of how much the screening rankings depend on the hand-picked score
+# weights. Weight vectors are drawn from a Dirichlet distribution (centred on the
+# baseline weights, or flat), every candidate is scored under every draw with one
+# matrix product per chunk of draws, and the result is a rank-probability table: how
+# often each airfoil finishes 1st, 2nd, ... and inside the top k.
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_CHUNK = 8192 # Weight draws scored per matrix product; bounds memory at chunk x candidates floats
+MISSING_SCORE = -1.0e9 # Candidates with a NaN term rank below every scored candidate
+
+def sampleDirichletWeights(baselineWeights,samples: int,concentration: float = None,
+                           rng: np.random.Generator = None) -> np.ndarray:
+    # concentration scales the baseline into Dirichlet parameters: large values stay close to
+    # the baseline, concentration=None samples uniformly over all weight vectors
+    if rng is None:
+        rng = np.random.default_rng()
+    baselineWeights = np.asarray(baselineWeights,dtype=float)
+    baselineWeights = baselineWeights / baselineWeights.sum()
+    if concentration is None:
+        parameters = np.ones_like(baselineWeights)
+    else:
+        parameters = concentration * baselineWeights
+    return rng.dirichlet(parameters,size=samples)
+
+def dominatorCounts(terms: np.ndarray,chunk: int = 256) -> np.ndarray:
+    # For every candidate, how many others are >= on every term and > on at least one. With
+    # strictly positive weights each of those always scores higher, so a candidate with
+    # k or more dominators can never finish inside the top k.
+    counts = np.zeros(len(terms),dtype=np.int64)
+    for start in range(0,len(terms),chunk):
+        block = terms[start:start + chunk,None,:]
+        dominates = np.all(terms[None,:,:] >= block,axis=-1) & np.any(terms[None,:,:] > block,axis=-1)
+        counts[start:start + chunk] = dominates.sum(axis=1)
+    return counts
+
+def rankProbabilities(terms: np.ndarray,weights: np.ndarray,names,maxRank: int = 5) -> pd.DataFrame:
+    # terms: (candidates, terms) score inputs, weights: (samples, terms). Returns, per candidate,
+    # the fraction of samples in which it finished at each rank up to maxRank, the cumulative
+    # top-k fractions, and the baseline-free expected score.
+    terms = np.nan_to_num(np.asarray(terms,dtype=np.float32),nan=MISSING_SCORE)
+    weights = np.asarray(weights,dtype=np.float32)
+    candidateCount = terms.shape[0]
+    maxRank = min(maxRank,candidateCount)
+
+    # Only candidates that can reach the top maxRank under some weighting are ranked per sample
+    contenders = np.flatnonzero(dominatorCounts(terms) < maxRank)
+    contenderTerms = terms[contenders].T
+
+    rankCounts = np.zeros((maxRank,candidateCount),dtype=np.int64)
+    for start in range(0,len(weights),SAMPLE_CHUNK):
+        scores = weights[start:start + SAMPLE_CHUNK] @ contenderTerms # (chunk, contenders)
+        if maxRank < len(contenders):
+            leaders = np.argpartition(-scores,maxRank - 1,axis=1)[:,:maxRank]
+        else:
+            leaders = np.broadcast_to(np.arange(len(contenders)),scores.shape)
+        leaderScores = np.take_along_axis(scores,leaders,axis=1)
+        ordered = np.take_along_axis(leaders,np.argsort(-leaderScores,axis=1,kind="stable"),axis=1)
+        for rank in range(maxRank):
+            rankCounts[rank] += np.bincount(contenders[ordered[:,rank]],minlength=candidateCount)
+
+    rankShares = rankCounts.T / max(len(weights),1)
+    table = pd.DataFrame(rankShares,index=pd.Index(names,name="airfoil"),
+                         columns=[f"P(rank {rank + 1})" for rank in range(maxRank)])
+    for k in range(2,maxRank + 1):
+        table[f"P(top {k})"] = rankShares[:,:k].sum(axis=1)
+    table["meanScore"] = terms @ weights.mean(axis=0)
+    return table.sort_values(["P(rank 1)"] + [f"P(top {k})" for k in range(2,maxRank + 1)] + ["meanScore"],
+                             ascending=False)
+
+def weightSensitivity(termMatrices: dict,baselineWeights: dict,names,samples: int = 100000,
+                      concentration: float = None,maxRank: int = 5,seed: int = None) -> dict:
+    # termMatrices / baselineWeights: {score name: (candidates, terms) matrix / term weights}
+    rng = np.random.default_rng(seed)
+    tables = {}
+    for scoreName,terms in termMatrices.items():
+        weights = sampleDirichletWeights(baselineWeights[scoreName],samples,concentration,rng)
+        tables[scoreName] = rankProbabilities(terms,weights,names,maxRank)
+    return tables
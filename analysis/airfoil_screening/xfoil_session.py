@@ -0,0 +1,213 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Persistent XFoil Sessions
+#Utilizes XFoil 6.99 for Windows
+
+# ============================== #
+#|     PROGRAM DESCRIPTION      |#
+# ============================== #
+# Keeps a pool of long-lived XFoil processes open and drives them over stdin/stdout.
+# Each session loads and panels a geometry once, runs any number of OPER/ASEQ blocks
+# against it, and reads the accumulated polar back with PLIS instead of through a
+# PACC save file on disk. Used by airfoil_screening.py when XFOIL_SESSIONS = True.
+
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from polar_io import parsePolarRows
+
+SESSION_TIMEOUT = 300.0 # Seconds to wait for one case before the session is killed and restarted
+DEFAULT_NCRIT = 9.0 # XFoil's own default; sent explicitly so no case inherits an earlier case's value
+SYNC_COMMAND = "ZZZZ" # Not an XFoil command; XFoil answers "ZZZZ command not recognized", marking the end of a case
+
+# ============================== #
+#|         XFOIL SESSION        |#
+# ============================== #
+class XfoilSession:
+    def __init__(self,executable: Path,workDirectory: Path,iterations: int = 200,
+                 timeout: float = SESSION_TIMEOUT,repanel: bool = True):
+        self.executable = Path(executable)
+        self.workDirectory = Path(workDirectory)
+        self.iterations = iterations
+        self.timeout = timeout
+        self.repanel = repanel # False when the geometry files are already paneled for XFoil
+        self.process = None
+        self.output = None
+        self.loadedGeometry = None
+        self.viscous = False
+
+    def start(self) -> None:
+        self.workDirectory.mkdir(parents=True,exist_ok=True)
+        # gfortran block-buffers stdout on pipes; without this, replies only arrive at exit
+        environment = dict(os.environ,GFORTRAN_UNBUFFERED_PRECONNECTED="y")
+        self.process = subprocess.Popen(
+            [str(self.executable)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            cwd=self.workDirectory,
+            env=environment,
+        )
+        self.output = queue.Queue()
+        threading.Thread(target=self._readOutput,args=(self.process,self.output),daemon=True).start()
+        self.loadedGeometry = None
+        self.viscous = False
+
+        self._send(["PLOP","G",""])
+        self._sync()
+
+    def isAlive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def close(self) -> None:
+        if self.isAlive():
+            try:
+                self._send(["","QUIT"])
+                self.process.wait(timeout=5.0)
+            except (OSError,subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+
+    @staticmethod
+    def _readOutput(process,output: queue.Queue) -> None:
+        for line in process.stdout:
+            output.put(line.rstrip("\r\n"))
+        output.put(None)
+
+    def _send(self,cmdLines) -> None:
+        self.process.stdin.write("\r\n".join(cmdLines) + "\r\n")
+        self.process.stdin.flush()
+
+    def _sync(self) -> list:
+        # Commands are answered strictly in order, so everything printed before the
+        # reply to SYNC_COMMAND belongs to the commands sent before it.
+        self._send([SYNC_COMMAND])
+        deadline = time.monotonic() + self.timeout
+        lines = []
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                line = self.output.get(timeout=max(remaining,0.0))
+            except queue.Empty:
+                raise TimeoutError(f"XFoil session did not respond within {self.timeout:.0f} s.")
+            if line is None:
+                raise RuntimeError("XFoil session exited unexpectedly.")
+            if SYNC_COMMAND in line:
+                return lines
+            lines.append(line)
+
+    def runCase(self,airfoilDAT: Path,re: float,aoaRange,mach: float = 0.0,ncrit: float = None) -> list:
+        if not self.isAlive():
+            self.start()
+
+        cmdLines = []
+        if self.loadedGeometry != Path(airfoilDAT):
+            shutil.copyfile(airfoilDAT,self.workDirectory / "airfoil.dat")
+            cmdLines += ["LOAD airfoil.dat",""] + (["PANE"] if self.repanel else [])
+            self.loadedGeometry = Path(airfoilDAT)
+
+        aoaList = list(aoaRange)
+        aStart = aoaList[0]
+        aEnd = aoaList[-1]
+        aStep = aoaList[1] - aoaList[0] if len(aoaList) > 1 else 1.0
+
+        cmdLines.append("OPER")
+        # VISC toggles viscous mode, so it is only sent once per session; RE changes Re after that
+        cmdLines.append(f"RE {int(re)}" if self.viscous else f"VISC {int(re)}")
+        self.viscous = True
+        # Every per-case OPER/VPAR setting is sent on every case, since a reused session keeps
+        # whatever the previous case set
+        cmdLines += [f"MACH {mach}",f"ITER {self.iterations}"]
+        cmdLines += ["VPAR",f"N {DEFAULT_NCRIT if ncrit is None else ncrit}",""]
+        cmdLines += [
+            "PACC",
+            "", # Keep the polar in memory only
+            "", # No dump file
+            "INIT",
+            f"ASEQ {aStart} {aEnd} {aStep}",
+            "PLIS",
+            "PACC",
+            "PDEL 1",
+            "", # Back to the top-level menu
+        ]
+
+        self._send(cmdLines)
+        try:
+            lines = self._sync()
+        except (TimeoutError,RuntimeError):
+            self.close()
+            raise
+
+        # PLIS prints the stored polar table last; only rows after its dashed header count
+        dashIndices = [i for i,line in enumerate(lines) if line.strip().startswith("------")]
+        if not dashIndices:
+            return []
+        return parsePolarRows(lines[dashIndices[-1] + 1:])
+
+# ============================== #
+#|          SESSION POOL        |#
+# ============================== #
+class XfoilSessionPool:
+    def __init__(self,executable: Path,workers: int,scratchDirectory: Path,iterations: int = 200,
+                 timeout: float = SESSION_TIMEOUT,repanel: bool = True):
+        Path(scratchDirectory).mkdir(parents=True,exist_ok=True)
+        self.sessions = [
+            XfoilSession(
+                executable,
+                Path(tempfile.mkdtemp(prefix="session_",dir=scratchDirectory)),
+                iterations=iterations,
+                timeout=timeout,
+                repanel=repanel,
+            )
+            for _ in range(max(1,workers))
+        ]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+    def close(self) -> None:
+        for session in self.sessions:
+            session.close()
+            shutil.rmtree(session.workDirectory,ignore_errors=True)
+
+    def runCases(self,cases) -> list:
+        # cases: (airfoilDAT, re, aoaRange[, mach[, ncrit]]) tuples. Cases sharing a geometry run
+        # back-to-back on one session so the airfoil is loaded and paneled only once.
+        # Returns one list of row dicts per case, in case order; failed cases return [].
+        cases = list(cases)
+        groups = {}
+        for index,case in enumerate(cases):
+            groups.setdefault(Path(case[0]),[]).append(index)
+
+        idleSessions = queue.Queue()
+        for session in self.sessions:
+            idleSessions.put(session)
+
+        results = [[] for _ in cases]
+
+        def runGroup(indices):
+            session = idleSessions.get()
+            try:
+                for index in indices:
+                    try:
+                        results[index] = session.runCase(*cases[index])
+                    except (TimeoutError,RuntimeError,OSError) as error:
+                        print(f"[WARNING] XFoil session failed on {cases[index][0]} "
+                              f"at Re={cases[index][1]:.0f}: {error}\n")
+            finally:
+                idleSessions.put(session)
+
+        with ThreadPoolExecutor(max_workers=len(self.sessions)) as executor:
+            list(executor.map(runGroup,groups.values()))
+
+        return results
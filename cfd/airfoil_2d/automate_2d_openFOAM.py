@@ -22,14 +22,25 @@
 
 import subprocess
 import shutil
+import hashlib
 import os
+import sys
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+
+# Geometry reading and repaneling are shared with the XFoil screening scripts
+sys.path.insert(0,str(Path(__file__).resolve().parents[2] / "analysis" / "airfoil_screening"))
+from airfoil_geometry import loadAirfoilGeometry,readAirfoilCoordinates
+from case_scheduler import CaseJob,CaseScheduler,writeRunSummary
+from convergence_monitor import ConvergenceMonitor
+from force_coefficients import coefficientWindowStatistics
 
 # ============================== #
 # |       CONFIGURATION        | #
@@ -51,12 +62,50 @@ SOLVER = "simpleFoam" # Set to your choice of OpenFOAM solve
 FOAM_BASHRC_PATH = "/usr/lib/openfoam/openfoam2412/etc/bashrc" # Set to your personal install directory
 VERBOSE = True # Set to 'True' to include DEBUG prints, 'False' to omit
 meshOnly = False # Set to 'True' to verify meshes, else leave 'False'
-DEBUG_WSL = True
 RUN_DETAILED_ANALYSIS = True # Set to 'False' if you only want the sweep
 RUN_DETAILED_ONLY = True # Set to 'True' to only run the detailed case(s); 'False' for all cases
 DETAILED_AOA_LIST = [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16] # Key AoAs: Cruise, near-stall, and post-stall
 DETAILED_SAMPLE_NAME = "cpLine" # Must match the controlDict functionObject name
 DATA_HANDLING_ONLY = False # Set to 'True' if you do not have CFD results, set to 'False' to run CFD and all postprocessing
+STL_PANELS = None # e.g. 200: export the shared cosine repaneling instead of the raw .dat points
+COEFFICIENT_WINDOW = 200 # Final iterations averaged into each case's Cl, Cd and Cm
+RESULT_READ_WORKERS = 16 # Threads reading coefficient.dat files in parallel
+
+# ===== CASE SCHEDULER ===== #
+MAX_PARALLEL_CASES = None # Cases meshed and solved at once; None = one per scheduler core
+MAX_SCHEDULER_CORES = None # Cores the scheduler may fill; None = every core on this machine
+CASE_CORES = 1 # Cores one case uses (simpleFoam runs serial unless decomposed)
+CASE_MEMORY_MB = 1500 # Estimated peak memory of one mesh-and-solve chain
+MEMORY_RESERVE_MB = 2048 # Memory always left free for Windows, WSL and everything else
+CASE_STEP_TIMEOUT = None # Seconds before a hung step is killed; None waits indefinitely
+FAKE_SOLVER = False # Set to 'True' to run fake_openfoam.py instead of OpenFOAM (scheduler testing)
+MESH_REUSE = True # Mesh once per airfoil and base case, then share constant/polyMesh with every alpha case
+MESH_LINK_MODE = "hardlink" # "hardlink", "symlink" or "copy" of the shared polyMesh into each case
+
+# ===== CASE MATERIALIZATION ===== #
+CASE_MATERIALIZE_MODE = "hardlink" # "hardlink" or "symlink": cases share the template files; "copy": full copies
+CASE_SETUP_WORKERS = 8 # Threads creating case directories at once
+
+# ===== SOLUTION INITIALIZATION ===== #
+#   "uniform": solve from the baseCase 0/ fields as they are
+#   "potentialFoam": run potentialFoam before every solve
+#   "warmStart": start each alpha from the converged fields of its neighbour, inlet turned to the new alpha.
+#     Results near stall can differ (hysteresis), and each chain of neighbours runs one case at a time
+INITIALIZATION = "uniform" # For the AOA_LIST sweep; "potentialFoam" and "warmStart" are opt-in
+DETAILED_INITIALIZATION = "uniform" # For the DETAILED_AOA_LIST sweep
+WARM_START_SEEDS = [0] # Alphas solved from scratch; more seeds = more warm-start chains running in parallel
+WARM_START_SEED_POTENTIAL = False # Set to 'True' to initialize the seed cases with potentialFoam
+
+# ===== CONVERGENCE MONITOR ===== #
+#   A solve is stopped (stopAt writeNow) once, over the last window of iterations, the Cl and Cd
+#   means have stopped moving, their scatter is small, and every residual target is met
+CONVERGENCE_MONITOR = True # Set to 'False' to always run to endTime
+CONVERGENCE_WINDOW = 200 # Iterations per averaging window
+CONVERGENCE_RELATIVE_CHANGE = 1e-3 # Largest change of the windowed Cl/Cd mean, relative to the mean
+CONVERGENCE_RELATIVE_STD = 2e-3 # Largest windowed Cl/Cd standard deviation, relative to the mean
+CONVERGENCE_RESIDUALS = {"Ux": 1e-4,"Uy": 1e-4,"p": 1e-3} # Initial residual targets from the solver log
+CONVERGENCE_MIN_ITERATIONS = 300 # Never stop before this iteration
+CONVERGENCE_POLL_SECONDS = 10.0 # Seconds between checks of a running solve
 
 # ===== CONFIG INITIALIZERS ===== #
 sns.set_theme(style='whitegrid',context='talk',palette='deep')
@@ -70,6 +119,29 @@ DETAILED_BASE_CASE_DIR = ROOT_DIR / "baseCase_detailed"
 DETAILED_PLOT_DIR = ROOT_DIR / "postprocessing" / "plots_detailed"
 CP_SAMPLE_DIR = ROOT_DIR / "cp_samples"
 CP_FILENAME_TEMPLATE = "{airfoil}_alpha{alpha:.1f}_Cp.csv"
+GEOMETRY_CACHE_DIR = ROOT_DIR / "geometry" / "cache" # Repaneled geometry keyed by .dat contents
+FAKE_SOLVER_PATH = ROOT_DIR / "fake_openfoam.py"
+CASE_RUNS_CSV = ROOT_DIR / "postprocessing" / "case_runs.csv"
+DETAILED_CASE_RUNS_CSV = ROOT_DIR / "postprocessing" / "case_runs_detailed.csv"
+MESH_CACHE_DIR = ROOT_DIR / "meshes" # Shared meshes keyed by the STL and mesh dictionaries; safe to delete
+MESH_RUNS_CSV = ROOT_DIR / "postprocessing" / "mesh_runs.csv"
+STL_CACHE_DIR = ROOT_DIR / "geometry" / "stl" # One STL per airfoil, keyed by its .dat and export settings
+# Template paths every case gets its own copy of: the 0/ fields (inlet update, potentialFoam and
+# warm starts rewrite them in place) and the AoA marker. Everything else is linked.
+CASE_COPY_PATHS = [Path("0"),AOA_MARKER_RELATIVE]
+CONVERGENCE_CSV = ROOT_DIR / "postprocessing" / "convergence.csv"
+DETAILED_CONVERGENCE_CSV = ROOT_DIR / "postprocessing" / "convergence_detailed.csv"
+MESH_CACHE_VERSION = 1 # Bump to force every shared mesh to be rebuilt
+MESH_DONE_MARKER = "mesh.done"
+STEP_PGID_FILE = ".step.pgid" # Written in each case by the Linux shell running its current step
+# Everything that changes the mesh; each is also looked for with the repository's .txt suffix
+MESH_INPUTS = [
+    Path("constant") / "triSurface" / "airfoil.stl",
+    Path("system") / "blockMeshDict",
+    Path("system") / "snappyHexMeshDict",
+    Path("system") / "surfaceFeatureExtractDict",
+    Path("system") / "meshQualityDict",
+]
 
 # ==== SCORING / ANALYSIS PARAMETERS ==== #
 #   If you intend to score on different features, you will need to set up
@@ -138,15 +210,21 @@ def setInletVelocityForAoA(caseDir: Path, alphaDeg: float, UInf: float = U_INF)
         f"alpha = {alphaDeg}°, U = ({Ux:.3f}, {Uy:.3f}, {Uz:.3f}) m/s\n"
     )
 
-def DATtoSTL(datPath,stlPath,thickness=0.01,chord: float = None) -> None:
+def DATtoSTL(datPath,stlPath,thickness=0.01,chord: float = None,panels: int = None) -> None:
     if chord is None:
         chord = MAC
+    if panels is None:
+        panels = STL_PANELS
 
     os.makedirs(os.path.dirname(stlPath),exist_ok=True)
 
-    coords = np.loadtxt(datPath,comments='#',skiprows=1)
-    xRaw = coords[:,0]
-    yRaw = coords[:,1]
+    # Selig or Lednicer input; with panels set, the cached cosine repaneling is used instead
+    if panels is None:
+        _,_,xRaw,yRaw = readAirfoilCoordinates(datPath)
+    else:
+        geometry = loadAirfoilGeometry(datPath,panels,GEOMETRY_CACHE_DIR)
+        xRaw = geometry["x"]
+        yRaw = geometry["y"]
 
     x = xRaw * chord
     y = yRaw * chord
@@ -195,13 +273,84 @@ def DATtoSTL(datPath,stlPath,thickness=0.01,chord: float = None) -> None:
         
         file.write(f"endsolid airfoil\n")
 
-def attachAirfoilStlToCase(caseDir: Path,airfoil: str,thickness: float = 0.01) -> None:
+def sharedAirfoilStl(airfoil: str,thickness: float = 0.01) -> Path:
+    # The airfoil's STL, written once per .dat content and export settings
     datPath = ROOT_DIR / "geometry" / f"{airfoil.lower()}.dat"
+    digest = hashlib.sha256(datPath.read_bytes())
+    digest.update(f"chord={MAC};thickness={thickness};panels={STL_PANELS}".encode("utf-8"))
+    stlPath = STL_CACHE_DIR / f"{airfoil}_{digest.hexdigest()[:16]}.stl"
+    if not stlPath.exists():
+        # Written aside and renamed, so parallel case setup never links a half-written STL
+        pendingPath = stlPath.with_name(f"{stlPath.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        DATtoSTL(str(datPath),str(pendingPath),thickness=thickness,chord=MAC)
+        os.replace(pendingPath,stlPath)
+    return stlPath
+
+def attachAirfoilStlToCase(caseDir: Path,airfoil: str,thickness: float = 0.01) -> None:
     stlDir = caseDir / "constant" / "triSurface"
     stlDir.mkdir(parents=True,exist_ok=True)
     stlPath = stlDir / "airfoil.stl"
+    if stlPath.is_symlink() or stlPath.exists():
+        stlPath.unlink()
+    placeFile(sharedAirfoilStl(airfoil,thickness),stlPath,CASE_MATERIALIZE_MODE)
+
+# ===== CASE FILE PLACEMENT ===== #
+def linkOrCopy(source: str,destination: str) -> None:
+    try:
+        os.link(source,destination)
+    except OSError:
+        shutil.copy2(source,destination)
+
+def symlinkOrCopy(source: str,destination: str) -> None:
+    # Relative, so the link resolves the same from Windows and from WSL; Windows without
+    # symlink rights falls back to a copy
+    try:
+        os.symlink(os.path.relpath(source,os.path.dirname(destination)),destination)
+    except OSError:
+        shutil.copy2(source,destination)
+
+def placeFile(source: Path,destination: Path,mode: str) -> None:
+    if mode == "hardlink":
+        linkOrCopy(str(source),str(destination))
+    elif mode == "symlink":
+        symlinkOrCopy(str(source),str(destination))
+    else:
+        shutil.copy2(source,destination)
+
+def isPerCaseFile(relative: Path) -> bool:
+    return any(relative == path or path in relative.parents for path in CASE_COPY_PATHS)
+
+def materializeCase(templateDir: Path,caseDir: Path,mode: str = None) -> bool:
+    # Builds caseDir from templateDir: per-case files (CASE_COPY_PATHS) are copied, the rest is
+    # hardlinked, symlinked or copied according to mode. The case is assembled in a sibling
+    # directory and renamed into place, so concurrent setups never see a partial case.
+    # Returns False when the case already existed.
+    mode = mode or CASE_MATERIALIZE_MODE
+    if caseDir.exists():
+        return False
+    caseDir.parent.mkdir(parents=True,exist_ok=True)
+    pendingDir = caseDir.with_name(f".{caseDir.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    shutil.rmtree(pendingDir,ignore_errors=True)
+    pendingDir.mkdir()
+
+    for source in sorted(templateDir.rglob("*")):
+        relative = source.relative_to(templateDir)
+        target = pendingDir / relative
+        if source.is_dir():
+            target.mkdir(parents=True,exist_ok=True)
+            continue
+        target.parent.mkdir(parents=True,exist_ok=True)
+        placeFile(source,target,"copy" if isPerCaseFile(relative) else mode)
 
-    DATtoSTL(str(datPath),str(stlPath),thickness=thickness,chord=MAC)
+    try:
+        os.rename(pendingDir,caseDir)
+    except OSError:
+        # Another setup got there first
+        shutil.rmtree(pendingDir,ignore_errors=True)
+        if not caseDir.exists():
+            raise
+        return False
+    return True
 
 # ===== WINDOWS TO LINUX GOVERNANCE ===== #
 def windowsCaseToWSL(caseDir: Path) -> str:
@@ -209,26 +358,6 @@ def windowsCaseToWSL(caseDir: Path) -> str:
     relativeDirectory = caseDir.relative_to(ROOT_DIR)
     return f"{WSL_ROOT_DIR}/{relativeDirectory.as_posix()}"
 
-def runWSLcommandInCase(caseDir: Path,command: str) -> None:
-    wslCase = windowsCaseToWSL(caseDir)
-    foamInit = f'source "{FOAM_BASHRC_PATH}"' # TODO: Remove if bashCommand runs smooth without
-    bashCommand = f'source "{FOAM_BASHRC_PATH}" && cd "{wslCase}" && {command}'
-    print(f"[RUN (WSL)] {bashCommand}\n")
-
-    result = subprocess.run(
-        ["wsl","bash","-lc",bashCommand],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-
-    if result.returncode != 0:
-        print(f"[ERROR] WSL command failed in case:",caseDir)
-        print(f"STDOUT:\n",result.stdout)
-        print(f"STDERR:\n",result.stderr)
-    else:
-        print(f"[PROGRAM] WSL command finished in:",caseDir)
-
 # ============================== #
 # |         CASE SETUP         | #
 # ============================== #
@@ -255,9 +384,8 @@ def checkBaseCase() -> None:
 
 def ensureCaseDirectory(airfoil: str,alphaDeg: int) -> Path:
     caseDir = ROOT_DIR / airfoil / f"alpha_{alphaDeg}"
-    if not caseDir.exists():
-        print(f"[SETUP] Creating case: {caseDir}\n")
-        shutil.copytree(BASE_CASE_DIR,caseDir)
+    if materializeCase(BASE_CASE_DIR,caseDir):
+        print(f"[SETUP] Created case ({CASE_MATERIALIZE_MODE}): {caseDir}\n")
     else:
         print(f"[SETUP] Case already exists (skipping template copy): {caseDir}\n")
     return caseDir
@@ -268,16 +396,20 @@ def writeAOAmarker(caseDir: Path,alphaDeg: int) -> None:
     markerPath.write_text(f"{alphaDeg}\n",encoding="utf-8")
     print(f"[SETUP] Wrote AoA marker ({alphaDeg} deg) to {markerPath}\n")
 
+def setUpCase(airfoil: str,alpha: int) -> Path:
+    caseDir = ensureCaseDirectory(airfoil,alpha)
+    attachAirfoilStlToCase(caseDir,airfoil)
+    writeAOAmarker(caseDir,alpha)
+    setInletVelocityForAoA(caseDir,alpha)
+    return caseDir
+
 def createAllCases() -> List[Path]:
-    allCaseDirs = []
+    # Each STL is written once up front; the cases themselves are set up in parallel
     for airfoil in AIRFOILS:
-        for alpha in AOA_LIST:
-            caseDir = ensureCaseDirectory(airfoil,alpha)
-            attachAirfoilStlToCase(caseDir,airfoil)
-            writeAOAmarker(caseDir,alpha)
-            setInletVelocityForAoA(caseDir,alpha)
-            allCaseDirs.append(caseDir)
-    return allCaseDirs
+        sharedAirfoilStl(airfoil)
+    cases = [(airfoil,alpha) for airfoil in AIRFOILS for alpha in AOA_LIST]
+    with ThreadPoolExecutor(max_workers=max(1,CASE_SETUP_WORKERS)) as executor:
+        return list(executor.map(lambda case: setUpCase(*case),cases))
 
 # ===== DETAILED CFD ===== #
 def checkDetailedBaseCase() -> None:
@@ -303,9 +435,8 @@ def checkDetailedBaseCase() -> None:
 def ensureDetailedCaseDirectory(airfoil: str,alphaDeg: int) -> Path:
     caseRoot = ROOT_DIR / f"{airfoil}_detailed"
     caseDir = caseRoot / f"alpha_{alphaDeg}"
-    if not caseDir.exists():
-        print(f"[SETUP] Creating detailed case: {caseDir}\n")
-        shutil.copytree(DETAILED_BASE_CASE_DIR,caseDir)
+    if materializeCase(DETAILED_BASE_CASE_DIR,caseDir):
+        print(f"[SETUP] Created detailed case ({CASE_MATERIALIZE_MODE}): {caseDir}\n")
     else:
         print(f"[SETUP] Detailed case already exists (skipping template copy): {caseDir}\n")
     return caseDir
@@ -316,166 +447,398 @@ def writeDetailedAoAMarker(caseDir: Path,alphaDeg: int) -> None:
     markerPath.write_text(f"{alphaDeg}\n",encoding="utf-8")
     print(f"[SETUP] Wrote AoA marker (detailed stage, {alphaDeg}°) to {markerPath}.\n")
 
+def setUpDetailedCase(airfoil: str,alpha: int) -> Path:
+    caseDir = ensureDetailedCaseDirectory(airfoil,alpha)
+    attachAirfoilStlToCase(caseDir,airfoil)
+    writeDetailedAoAMarker(caseDir,alpha)
+    setInletVelocityForAoA(caseDir,alpha)
+    return caseDir
+
 def createAllDetailedCases() -> None:
     for airfoil in AIRFOILS:
-        for alpha in DETAILED_AOA_LIST:
-            caseDir = ensureDetailedCaseDirectory(airfoil,alpha)
-            attachAirfoilStlToCase(caseDir,airfoil)
-            writeDetailedAoAMarker(caseDir,alpha)
-            setInletVelocityForAoA(caseDir,alpha)
+        sharedAirfoilStl(airfoil)
+    cases = [(airfoil,alpha) for airfoil in AIRFOILS for alpha in DETAILED_AOA_LIST]
+    with ThreadPoolExecutor(max_workers=max(1,CASE_SETUP_WORKERS)) as executor:
+        list(executor.map(lambda case: setUpDetailedCase(*case),cases))
 
 # ================================= #
 # |      OPENFOAM SIMULATION      | #
 # ================================= #
 # ===== OPENFOAM EXECUTIONS ===== #
-# ----- INITIAL SCREENING VERIFICATIONS ----- #
-def runOpenFOAMforCase(caseDir: Path,meshOnly: bool = False) -> None:
-    if DEBUG_WSL:
-        if meshOnly:
-            command = "blockMesh && snappyHexMesh -overwrite"
-        else:
-            command = f"blockMesh && snappyHexMesh -overwrite && {SOLVER}"
+# ----- CASE SCHEDULING ----- #
+def caseCommandArgs(caseDir: Path,command: str) -> Tuple[List[str],Path]:
+    # (args, cwd) running one OpenFOAM command inside a case, through WSL or the fake solver.
+    # Under WSL the shell leads its own process group and records it in STEP_PGID_FILE, so
+    # killCaseProcesses can stop the Linux-side solver and not only wsl.exe. --exec starts
+    # setsid without a wrapping shell, so $$ is expanded by the setsid bash itself.
+    if FAKE_SOLVER:
+        return [sys.executable,str(FAKE_SOLVER_PATH)] + command.split(),caseDir
+    (caseDir / STEP_PGID_FILE).unlink(missing_ok=True) # Never leave a previous step's group to be killed
+    bashCommand = (f'cd "{windowsCaseToWSL(caseDir)}" && echo $$ > {STEP_PGID_FILE} && '
+                   f'source "{FOAM_BASHRC_PATH}" && {command}')
+    return ["wsl","--exec","setsid","--wait","bash","-lc",bashCommand],ROOT_DIR
+
+def killCaseProcesses(job: CaseJob) -> None:
+    # Kills the Linux process group of the case's running WSL step (timeout or interrupt)
+    if FAKE_SOLVER:
+        return # The fake solver runs locally and goes down with the scheduler's own kill
+    pgidPath = job.caseDir / STEP_PGID_FILE
+    try:
+        pgid = int(pgidPath.read_text(encoding="utf-8").split()[0])
+    except (OSError,IndexError,ValueError):
+        return
+    subprocess.run(["wsl","--exec","kill","-KILL","--",f"-{pgid}"],stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL,timeout=60)
+    pgidPath.unlink(missing_ok=True)
+
+def caseSteps(meshOnly: bool = False,exportVTKbool: bool = False,meshed: bool = False,
+              initSteps: List[Tuple[str,Any]] = ()) -> List[Tuple[str,Any]]:
+    # (log name, command) chain for one case; each step writes log.<name> in the case.
+    # meshed: the case already holds its (shared) mesh, so meshing is skipped.
+    # initSteps: run between clearing old results and the solver (see SOLUTION INITIALIZATION).
+    steps = [] if meshed else [("blockMesh","blockMesh"),("snappyHexMesh","snappyHexMesh -overwrite")]
+    if not meshOnly:
+        steps.append(("clearResults",clearPreviousResults))
+        steps += list(initSteps)
+        steps.append((SOLVER,SOLVER))
+        if exportVTKbool:
+            steps.append(("foamToVTK","foamToVTK"))
+    return steps
+
+def scheduleCases(cases: List[Tuple[str,Path]],steps: List[Tuple[str,Any]],summaryPath: Path) -> List[CaseJob]:
+    jobs = [
+        CaseJob(name,caseDir,steps,cores=CASE_CORES,memoryMB=CASE_MEMORY_MB)
+        for name,caseDir in cases
+    ]
+    return scheduleJobs(jobs,summaryPath)
+
+def solverMonitor(job: CaseJob,stepName: str) -> Optional[ConvergenceMonitor]:
+    if not CONVERGENCE_MONITOR or stepName != SOLVER:
+        return None
+    return ConvergenceMonitor(
+        job.caseDir,
+        job.logPath(stepName),
+        window=CONVERGENCE_WINDOW,
+        relativeChange=CONVERGENCE_RELATIVE_CHANGE,
+        relativeStd=CONVERGENCE_RELATIVE_STD,
+        residualTargets=CONVERGENCE_RESIDUALS,
+        minIterations=CONVERGENCE_MIN_ITERATIONS,
+    )
+
+def writeConvergenceSummary(jobs: List[CaseJob],path: Path) -> None:
+    rows = [
+        {"case": job.name,"status": job.status,**job.monitors[SOLVER].statistics()}
+        for job in jobs if SOLVER in job.monitors
+    ]
+    if not rows:
+        return
+    dataframe = pd.DataFrame(rows)
+    path.parent.mkdir(parents=True,exist_ok=True)
+    dataframe.to_csv(path,index=False)
+    saved = dataframe["iterationsSaved"].sum()
+    budget = dataframe["endTime"].sum()
+    print(f"[POST] {int(dataframe['stoppedEarly'].sum())}/{len(dataframe)} solves stopped early, "
+          f"saving {saved:.0f} of {budget:.0f} budgeted iterations. Saved to {path}.\n")
+
+def scheduleJobs(jobs: List[CaseJob],summaryPath: Path,convergencePath: Path = None) -> List[CaseJob]:
+    scheduler = CaseScheduler(
+        caseCommandArgs,
+        maxParallel=MAX_PARALLEL_CASES,
+        maxCores=MAX_SCHEDULER_CORES,
+        memoryReserveMB=MEMORY_RESERVE_MB,
+        stepTimeout=CASE_STEP_TIMEOUT,
+        verbose=VERBOSE,
+        stepMonitor=solverMonitor,
+        monitorSeconds=CONVERGENCE_POLL_SECONDS,
+        killStep=killCaseProcesses,
+    )
+    print(f"[PROGRAM] Scheduling {len(jobs)} cases on up to {scheduler.maxParallel} at once "
+          f"({scheduler.maxCores} cores).\n")
+    scheduler.run(jobs)
+    writeRunSummary(jobs,summaryPath)
+    print(f"[POST] Saved case run summary to {summaryPath}.\n")
+    if convergencePath is not None:
+        writeConvergenceSummary(jobs,convergencePath)
+    return jobs
+
+# ----- SHARED MESHES ----- #
+def meshKey(caseDir: Path) -> str:
+    # Hash of the STL and mesh dictionaries a case would be meshed from
+    digest = hashlib.sha256(f"meshVersion={MESH_CACHE_VERSION}".encode("utf-8"))
+    for relative in MESH_INPUTS:
+        for candidate in (relative,relative.with_name(relative.name + ".txt")):
+            path = caseDir / candidate
+            if path.exists():
+                digest.update(candidate.as_posix().encode("utf-8") + b"\0")
+                digest.update(path.read_bytes() + b"\0")
+    return digest.hexdigest()[:16]
+
+def stageMeshDirectory(sourceCase: Path,meshDir: Path) -> None:
+    # Mesh-only copy of a case: system/ and constant/ without any previous polyMesh
+    if meshDir.exists():
+        shutil.rmtree(meshDir)
+    meshDir.mkdir(parents=True)
+    shutil.copytree(sourceCase / "system",meshDir / "system")
+    shutil.copytree(sourceCase / "constant",meshDir / "constant",ignore=shutil.ignore_patterns("polyMesh"))
+
+def linkSharedMesh(meshDir: Path,caseDir: Path) -> None:
+    # The solver only reads the mesh, so every alpha case can point at the same files
+    source = meshDir / "constant" / "polyMesh"
+    target = caseDir / "constant" / "polyMesh"
+    if target.is_symlink() or target.is_file():
+        target.unlink()
+    elif target.exists():
+        shutil.rmtree(target)
+    target.parent.mkdir(parents=True,exist_ok=True)
+
+    if MESH_LINK_MODE == "symlink":
+        # Relative, so the link resolves the same from Windows and from WSL; Windows without
+        # symlink rights falls back to hard links (or copies) of the mesh files
+        try:
+            os.symlink(os.path.relpath(source,target.parent),target,target_is_directory=True)
+        except OSError:
+            shutil.copytree(source,target,copy_function=linkOrCopy)
+    elif MESH_LINK_MODE == "hardlink":
+        shutil.copytree(source,target,copy_function=linkOrCopy)
     else:
-        if meshOnly:
-            command = (
-                f"blockMesh > log.blockMesh 2>&1 && "
-                f"snappyHexMesh -overwrite > log.snappyHexMesh 2>&1"
-            )
+        shutil.copytree(source,target)
+
+def attachSharedMeshes(cases: List[Tuple[str,Path]],summaryPath: Path) -> Tuple[List[Tuple[str,Path]],List[CaseJob]]:
+    # Builds each distinct mesh once and links it into its cases. Returns the cases that now
+    # hold a mesh and the mesh jobs that ran (none when every mesh was already built).
+    groups: Dict[Path,List[Tuple[str,Path]]] = {}
+    for name,caseDir in cases:
+        meshDir = MESH_CACHE_DIR / f"{name.split('/')[0]}_{meshKey(caseDir)}"
+        groups.setdefault(meshDir,[]).append((name,caseDir))
+
+    pending = []
+    for meshDir,members in groups.items():
+        if (meshDir / MESH_DONE_MARKER).exists():
+            if VERBOSE:
+                print(f"[DEBUG] Reusing mesh {meshDir.name} for {len(members)} cases.\n")
+            continue
+        stageMeshDirectory(members[0][1],meshDir)
+        pending.append((meshDir.name,meshDir))
+
+    meshJobs = []
+    if pending:
+        print(f"[PROGRAM] Building {len(pending)} shared meshes for {len(cases)} cases...\n")
+        meshJobs = scheduleCases(pending,caseSteps(meshOnly=True),summaryPath)
+        for job in meshJobs:
+            if job.status == "done":
+                (job.caseDir / MESH_DONE_MARKER).write_text(f"{date.today()}\n",encoding="utf-8")
+
+    meshedCases = []
+    for meshDir,members in groups.items():
+        if not (meshDir / MESH_DONE_MARKER).exists():
+            print(f"[ERROR] Shared mesh {meshDir.name} failed; skipping {len(members)} cases. "
+                  f"See the logs in {meshDir}.\n")
+            continue
+        for name,caseDir in members:
+            linkSharedMesh(meshDir,caseDir)
+            meshedCases.append((name,caseDir))
+    return meshedCases,meshJobs
+
+# ----- SOLUTION INITIALIZATION ----- #
+def caseAlpha(caseDir: Path) -> float:
+    return float(caseDir.name.split("_",1)[1])
+
+def latestTimeDirectory(caseDir: Path) -> Optional[Path]:
+    # Newest written time directory after 0, or None before the first write
+    times = []
+    for directory in caseDir.iterdir():
+        try:
+            value = float(directory.name)
+        except ValueError:
+            continue
+        if value > 0 and directory.is_dir():
+            times.append((value,directory))
+    return max(times)[1] if times else None
+
+def clearPreviousResults(job: CaseJob) -> None:
+    # A new solve makes older time directories and force histories stale; removing them keeps
+    # warm starts and result collection from reading a previous run
+    for directory in job.caseDir.iterdir():
+        try:
+            isTime = float(directory.name) > 0
+        except ValueError:
+            isTime = False
+        if isTime and directory.is_dir():
+            shutil.rmtree(directory)
+    shutil.rmtree(job.caseDir / "postProcessing",ignore_errors=True)
+
+def copyConvergedFields(sourceCase: Path,caseDir: Path) -> bool:
+    # Latest fields of sourceCase into caseDir/0: copied directly on a shared mesh, else
+    # interpolated with mapFields
+    latest = latestTimeDirectory(sourceCase)
+    if latest is None:
+        return False
+    if not MESH_REUSE:
+        command = f"mapFields ../{sourceCase.name} -consistent -sourceTime latestTime"
+        args,cwd = caseCommandArgs(caseDir,command)
+        with (caseDir / "log.mapFields").open("w",encoding="utf-8") as log:
+            result = subprocess.run(args,cwd=cwd,stdout=log,stderr=subprocess.STDOUT)
+        return result.returncode == 0
+
+    initialDir = caseDir / "0"
+    for field in latest.iterdir():
+        target = initialDir / field.name
+        # Only fields the case defines (skips phi and the like); unlink first so a hardlinked
+        # template file is never written through
+        if field.is_file() and target.exists():
+            target.unlink()
+            shutil.copyfile(field,target)
+    return True
+
+def warmStartStep(sourceJob: CaseJob,alphaDeg: float):
+    def warmStart(job: CaseJob) -> None:
+        if sourceJob.status == "done" and copyConvergedFields(sourceJob.caseDir,job.caseDir):
+            setInletVelocityForAoA(job.caseDir,alphaDeg)
+            print(f"[SETUP] Warm-started {job.name} from {sourceJob.name}.\n")
         else:
-            command = (
-                f"blockMesh > log.blockMesh 2>&1 && "
-                f"snappyHexMesh -overwrite > log.snappyHexMesh 2>&1 && "
-                f"{SOLVER} > log.{SOLVER} 2>&1"
-            )
-    
-    runWSLcommandInCase(caseDir,command)
-
-def runAllCases(meshOnly: bool = False) -> None:
+            print(f"[WARNING] No converged fields from {sourceJob.name}; "
+                  f"{job.name} starts from its own 0/ fields.\n")
+    return warmStart
+
+def warmStartPredecessors(alphas: List[float],seeds: List[float]) -> Dict[float,Optional[float]]:
+    # Each alpha's neighbour one step closer (in sweep order) to its nearest seed; seeds map to None
+    ordered = sorted(alphas)
+    seedIndices = sorted({min(range(len(ordered)),key=lambda i: abs(ordered[i] - seed)) for seed in seeds or [0]})
+    predecessors = {}
+    for index,alpha in enumerate(ordered):
+        nearest = min(seedIndices,key=lambda seedIndex: (abs(seedIndex - index),seedIndex))
+        if nearest == index:
+            predecessors[alpha] = None
+        else:
+            predecessors[alpha] = ordered[index - 1] if nearest < index else ordered[index + 1]
+    return predecessors
+
+def buildSolveJobs(cases: List[Tuple[str,Path]],exportVTKbool: bool,meshed: bool,initialization: str) -> List[CaseJob]:
+    potentialSteps = [("potentialFoam","potentialFoam -writep")]
+    if initialization in ("uniform","potentialFoam"):
+        steps = caseSteps(False,exportVTKbool,meshed,potentialSteps if initialization == "potentialFoam" else ())
+        return [CaseJob(name,caseDir,steps,cores=CASE_CORES,memoryMB=CASE_MEMORY_MB) for name,caseDir in cases]
+    if initialization != "warmStart":
+        raise ValueError(f"Unknown initialization {initialization!r}; use 'uniform', 'potentialFoam' or 'warmStart'.")
+
+    # One warm-start chain per airfoil and seed, fanning out from the seed in sweep order
+    byAirfoil: Dict[Path,Dict[float,Tuple[str,Path]]] = {}
+    for name,caseDir in cases:
+        byAirfoil.setdefault(caseDir.parent,{})[caseAlpha(caseDir)] = (name,caseDir)
+
+    entries = []
+    for members in byAirfoil.values():
+        predecessors = warmStartPredecessors(list(members),WARM_START_SEEDS)
+        for alpha in members:
+            depth,previous = 0,predecessors[alpha]
+            while previous is not None:
+                depth,previous = depth + 1,predecessors[previous]
+            entries.append((depth,members,predecessors,alpha))
+
+    # Submitted seeds first, then one step further out at a time, so chains advance together
+    jobsByCase: Dict[Path,CaseJob] = {}
+    jobs = []
+    for depth,members,predecessors,alpha in sorted(entries,key=lambda entry: entry[0]):
+        name,caseDir = members[alpha]
+        previous = predecessors[alpha]
+        if previous is None:
+            initSteps = potentialSteps if WARM_START_SEED_POTENTIAL else ()
+            sourceJob = None
+        else:
+            sourceJob = jobsByCase[members[previous][1]]
+            initSteps = [("warmStart",warmStartStep(sourceJob,alpha))]
+        job = CaseJob(name,caseDir,caseSteps(False,exportVTKbool,meshed,initSteps),
+                      cores=CASE_CORES,memoryMB=CASE_MEMORY_MB,after=sourceJob)
+        jobsByCase[caseDir] = job
+        jobs.append(job)
+    return jobs
+
+def runCaseBatch(cases: List[Tuple[str,Path]],meshOnly: bool,exportVTKbool: bool,summaryPath: Path,
+                 initialization: str = "uniform",convergencePath: Path = None) -> List[CaseJob]:
+    if not MESH_REUSE:
+        if meshOnly:
+            return scheduleCases(cases,caseSteps(meshOnly=True),summaryPath)
+        return scheduleJobs(buildSolveJobs(cases,exportVTKbool,False,initialization),summaryPath,convergencePath)
+    meshedCases,meshJobs = attachSharedMeshes(cases,MESH_RUNS_CSV)
+    if meshOnly:
+        return meshJobs
+    return scheduleJobs(buildSolveJobs(meshedCases,exportVTKbool,True,initialization),summaryPath,convergencePath)
+
+def runAllCases(meshOnly: bool = False) -> List[CaseJob]:
+    cases = []
     for airfoil in AIRFOILS:
         for alpha in AOA_LIST:
             caseDir = ROOT_DIR / airfoil / f"alpha_{alpha}"
-            print(f"[CASE] {airfoil} at alpha = {alpha} deg\n")
             if not caseDir.exists():
                 print(f"[WARNING] Case directory missing for {airfoil} at alpha = {alpha} deg.\n")
                 if VERBOSE:
                     print(f"[DEBUG] Check that createAllCases() was called.\n")
                 print(f"Skipping {airfoil} at {alpha} degrees AoA.\n")
                 continue
-            runOpenFOAMforCase(caseDir,meshOnly=meshOnly)
+            cases.append((f"{airfoil}/alpha_{alpha}",caseDir))
+    return runCaseBatch(cases,meshOnly,False,CASE_RUNS_CSV,INITIALIZATION,CONVERGENCE_CSV)
 # ----- DETAILED CFD ----- #
-def exportVTK(caseDir: Path):
-    runWSLcommandInCase(caseDir,"foamToVTK > log.foamToVTK 2>&1")
-
-def runAllDetailedCases(meshOnly: bool = False,exportVTKbool: bool = True) -> None:
+def runAllDetailedCases(meshOnly: bool = False,exportVTKbool: bool = True) -> List[CaseJob]:
+    cases = []
     for airfoil in AIRFOILS:
         for alpha in DETAILED_AOA_LIST:
             caseDir = ROOT_DIR / f"{airfoil}_detailed" / f"alpha_{alpha}"
-            print(f"[DETAILED CASE] {airfoil} at alpha = {alpha}°.\n")
-
             if not caseDir.exists():
                 print(f"[WARNING] Detailed case directory missing for {airfoil} at alpha = {alpha}°.\n")
                 if VERBOSE:
                     print(f"[DEBUG] Check that createAllDetailedCases() was called.\n")
                 print(f"[PROGRAM] Skipping detailed case for {airfoil} at {alpha}° AoA.\n")
                 continue
-
-            runOpenFOAMforCase(caseDir,meshOnly=meshOnly)
-
-            if exportVTKbool and not meshOnly:
-                print(f"[VTK] Exporting VTK for {airfoil} at alpha = {alpha}°.\n")
-                exportVTK(caseDir)
+            cases.append((f"{airfoil}_detailed/alpha_{alpha}",caseDir))
+    # foamToVTK runs as the last step of each case, so a failed solve skips its export
+    return runCaseBatch(cases,meshOnly,exportVTKbool,DETAILED_CASE_RUNS_CSV,DETAILED_INITIALIZATION,
+                        DETAILED_CONVERGENCE_CSV)
 
 # ===== POSTPROCESSING ===== #
 # --- INITIAL SCREENING VERIFICATIONS --- #
 def extractForceCoefficients(caseDir: Path) -> Optional[Dict[str,float]]:
+    # Tail-window statistics of coefficient.dat: Cl, Cd and Cm are the means over the last
+    # COEFFICIENT_WINDOW rows, with _std/_min/_max/_drift/_last alongside
     coefficientFile = caseDir / "postProcessing" / "force_coefficient" / "0" / "coefficient.dat"
     if not coefficientFile.exists():
         print(f"[WARNING] No coefficient.dat in {caseDir}.\n")
         return None
-    
-    headerTokens: Optional[List[str]] = None
-    lastDataLine: Optional[str] = None
 
-    with coefficientFile.open("r",encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith('#'):
-                tokens = line.lstrip('#').split()
-                if "Time" in tokens or "Cl" in tokens or "Cd" in tokens:
-                    headerTokens = tokens
-            else:
-                lastDataLine = line
-
-    if lastDataLine is None:
-        print(f"[WARNING] coefficient.dat is empty in {caseDir}.\n")
-        return None
-    
-    parts = lastDataLine.split()
-
-    def getValue(nameCandidates,defaultIdx=None) -> float:
-        if headerTokens:
-            colMap = {name: idx for idx,name in enumerate(headerTokens)}
-            for candidate in nameCandidates:
-                if candidate in colMap:
-                    idx = colMap[candidate]
-                    break
-            else:
-                prefix = nameCandidates[0][:2]
-                idxCandidates = [
-                    i for i,token in enumerate(headerTokens)
-                    if token.startswith(prefix)
-                ]
-                if idxCandidates:
-                    idx = idxCandidates[0]
-                else:
-                    idx = defaultIdx
-        else:
-            idx = defaultIdx
-
-        if idx is None or idx >= len(parts):
-            raise ValueError(
-                f"Could not locate any of {nameCandidates} or default index {defaultIdx} "
-                f"in coefficient.dat columns {headerTokens} for {caseDir}.\n"
-            )
-
-        return float(parts[idx])
-    
     try:
-        timeVal = getValue(['Time'],defaultIdx=0)
-        clVal = getValue(['Cl'],defaultIdx=1)
-        cdVal = getValue(['Cd'],defaultIdx=2)
-        cmVal = getValue(['CmPitch','CmRoll','CmYaw','Cm'],defaultIdx=3)
-    except (IndexError,ValueError) as e:
-        print(f"[ERROR] Failed to parse coefficient line in {caseDir}: {lastDataLine}.\n")
+        coefficients = coefficientWindowStatistics(coefficientFile,COEFFICIENT_WINDOW)
+    except (OSError,ValueError) as e:
+        print(f"[ERROR] Failed to parse coefficient.dat in {caseDir}.\n")
         print(f"{e}\n")
         return None
-    
-    return {
-        "time": timeVal,
-        "Cl": clVal,
-        "Cd": cdVal,
-        "Cm": cmVal
-    }
 
-def collectResults() -> List[Dict[str,Any]]:
+    if coefficients is None:
+        print(f"[WARNING] coefficient.dat is empty in {caseDir}.\n")
+    return coefficients
+
+def collectCaseResults(cases: List[Tuple[str,float,Path]]) -> List[Dict[str,Any]]:
+    # cases: (airfoil, alpha, caseDir). Files are read concurrently; rows keep the case order.
+    with ThreadPoolExecutor(max_workers=max(1,min(RESULT_READ_WORKERS,len(cases)))) as executor:
+        allCoefficients = list(executor.map(extractForceCoefficients,[caseDir for _,_,caseDir in cases]))
+
     results: List[Dict[str,Any]] = []
-    for airfoil in AIRFOILS:
-        for alpha in AOA_LIST:
-            caseDir = ROOT_DIR / airfoil / f"alpha_{alpha}"
-            coefficients = extractForceCoefficients(caseDir)
-            if coefficients is None:
-                continue
-            row: Dict[str,Any] = {
-                "airfoil": airfoil,
-                "alpha": alpha,
-                **coefficients,
-            }
-            results.append(row)
+    for (airfoil,alpha,_),coefficients in zip(cases,allCoefficients):
+        if coefficients is None:
+            continue
+        row: Dict[str,Any] = {
+            "airfoil": airfoil,
+            "alpha": alpha,
+            **coefficients,
+        }
+        results.append(row)
     return results
 
+def collectResults() -> List[Dict[str,Any]]:
+    cases = [
+        (airfoil,alpha,ROOT_DIR / airfoil / f"alpha_{alpha}")
+        for airfoil in AIRFOILS for alpha in AOA_LIST
+    ]
+    return collectCaseResults(cases)
+
 def buildResultsDataframe(results: List[Dict[str,Any]]) -> pd.DataFrame:
     if not results:
         print(f"[WARNING] No CFD results to build dataframe from.\n")
@@ -526,20 +889,11 @@ def loadLatestCpRaw(caseDir: Path,surfaceName: str = 'airfoil') -> Optional[pd.D
             
 
 def collectResultsForDetailedStage() -> List[Dict[str,Any]]:
-    results: List[Dict[str,Any]] = []
-    for airfoil in AIRFOILS:
-        for alpha in DETAILED_AOA_LIST:
-            caseDir = ROOT_DIR / f"{airfoil}_detailed" / f"alpha_{alpha}"
-            coefficients = extractForceCoefficients(caseDir)
-            if coefficients is None:
-                continue
-            row: Dict[str,Any] = {
-                "airfoil": airfoil,
-                "alpha": alpha,
-                **coefficients,
-            }
-            results.append(row)
-    return results
+    cases = [
+        (airfoil,alpha,ROOT_DIR / f"{airfoil}_detailed" / f"alpha_{alpha}")
+        for airfoil in AIRFOILS for alpha in DETAILED_AOA_LIST
+    ]
+    return collectCaseResults(cases)
 
 def buildDetailedResultsDataframe(results: List[Dict[str,Any]]) -> pd.DataFrame:
     if not results:
@@ -0,0 +1,312 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: OpenFOAM Case Scheduler
+
+# ============================== #
+# |    PROGRAM DESCRIPTION     | #
+# ============================== #
+# Runs many OpenFOAM cases at once. Each case is a job holding an ordered chain of
+# steps (blockMesh, snappyHexMesh, the solver, ...) plus the cores and memory it is
+# expected to need. The scheduler starts the next job that fits the free cores and
+# free memory, up to a concurrency limit, and runs the steps of every job back to back
+# in its own thread. A job may wait on another one (after=), e.g. to start from its
+# converged fields. Each step's output goes to log.<step> inside the case directory,
+# as the single-case runner already does, and a failed step ends only its own job:
+# the rest of the batch keeps running and the failures are summarized at the end.
+#
+# How a step is launched (WSL, a local OpenFOAM install, or the fake solver) is left
+# to the caller through commandArgs(caseDir, command) -> (args, cwd). A step whose
+# command is a Python callable is called with the job instead, in the job's thread.
+# stepMonitor(job, stepName) may return an object whose poll() is called every
+# monitorSeconds while that step's process runs and whose finish(returnCode) is called
+# once it exits (see convergence_monitor.py); it is kept as job.monitors[stepName].
+# A step that times out, or is interrupted, has its whole process group killed.
+# killStep(job), when given, is called first for what the launched process started
+# outside that group (the Linux side of a wsl.exe call).
+
+import csv
+import ctypes
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+try:
+    import psutil # Optional; /proc/meminfo or the Win32 API are used without it
+except ImportError:
+    psutil = None
+
+POLL_SECONDS = 2.0 # Longest wait between scheduling decisions while jobs are running
+
+# ============================== #
+# |      MEMORY MEASUREMENT    | #
+# ============================== #
+def systemMemoryMB() -> Tuple[Optional[float],Optional[float]]:
+    # (available, total) in MB, or (None, None) when the platform gives no answer
+    if psutil is not None:
+        memory = psutil.virtual_memory()
+        return memory.available / 2**20,memory.total / 2**20
+
+    if sys.platform.startswith("linux"):
+        try:
+            values = {}
+            with open("/proc/meminfo","r") as file:
+                for line in file:
+                    key,value = line.split(":",1)
+                    values[key] = float(value.split()[0]) / 1024.0
+            return values.get("MemAvailable",values.get("MemFree")),values.get("MemTotal")
+        except (OSError,ValueError):
+            return None,None
+
+    if sys.platform == "win32":
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [
+                ("dwLength",ctypes.c_ulong),
+                ("dwMemoryLoad",ctypes.c_ulong),
+                ("ullTotalPhys",ctypes.c_ulonglong),
+                ("ullAvailPhys",ctypes.c_ulonglong),
+                ("ullTotalPageFile",ctypes.c_ulonglong),
+                ("ullAvailPageFile",ctypes.c_ulonglong),
+                ("ullTotalVirtual",ctypes.c_ulonglong),
+                ("ullAvailVirtual",ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual",ctypes.c_ulonglong),
+            ]
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys / 2**20,status.ullTotalPhys / 2**20
+
+    return None,None
+
+# ============================== #
+# |            JOBS            | #
+# ============================== #
+class CaseJob:
+    def __init__(self,name: str,caseDir: Path,steps: List[Tuple[str,Any]],
+                 cores: int = 1,memoryMB: float = 0.0,after: "CaseJob" = None):
+        self.name = name
+        self.caseDir = Path(caseDir)
+        self.steps = list(steps) # (stepName, command or callable(job)) pairs, run in order
+        self.cores = max(1,int(cores))
+        self.memoryMB = float(memoryMB)
+        self.after = after # Job that must finish (successfully or not) before this one starts
+        self.status = "pending" # pending -> running -> done | failed
+        self.monitors = {}
+        self.failedStep = None
+        self.returnCode = None
+        self.startTime = None
+        self.wallSeconds = None
+        self.process = None
+
+    def logPath(self,stepName: str) -> Path:
+        return self.caseDir / f"log.{stepName}"
+
+    def isReady(self) -> bool:
+        return self.after is None or self.after.status in ("done","failed")
+
+# ============================== #
+# |         SCHEDULER          | #
+# ============================== #
+class CaseScheduler:
+    def __init__(self,commandArgs: Callable,maxParallel: int = None,maxCores: int = None,
+                 memoryReserveMB: float = 2048.0,pollSeconds: float = POLL_SECONDS,
+                 stepTimeout: float = None,verbose: bool = False,stepMonitor: Callable = None,
+                 monitorSeconds: float = 5.0,killStep: Callable = None):
+        self.commandArgs = commandArgs
+        self.killStep = killStep
+        self.stepMonitor = stepMonitor
+        self.monitorSeconds = monitorSeconds
+        self.maxCores = maxCores or os.cpu_count() or 1
+        self.maxParallel = maxParallel or self.maxCores
+        self.memoryReserveMB = memoryReserveMB
+        self.pollSeconds = pollSeconds
+        self.stepTimeout = stepTimeout # Seconds per step; None waits indefinitely
+        self.verbose = verbose
+        self.lock = threading.Condition()
+        self.running = []
+
+    # ===== Resource accounting ===== #
+    def freeMemoryMB(self) -> float:
+        # Measured free memory, less what the running jobs are expected to grow into. Jobs
+        # that just started have not allocated yet, so the total minus the estimates of all
+        # running jobs bounds the measurement from above.
+        available,total = systemMemoryMB()
+        if available is None:
+            return float("inf")
+        committed = sum(job.memoryMB for job in self.running)
+        return min(available,total - committed) - self.memoryReserveMB
+
+    def nextJob(self,pending: List[CaseJob]) -> Optional[CaseJob]:
+        # First ready job, in submission order, that fits the free cores and memory
+        ready = [job for job in pending if job.isReady()]
+        if not ready or len(self.running) >= self.maxParallel:
+            return None
+        freeCores = self.maxCores - sum(job.cores for job in self.running)
+        freeMemory = self.freeMemoryMB()
+        for job in ready:
+            if job.cores <= freeCores and job.memoryMB <= freeMemory:
+                return job
+        if not self.running:
+            # Nothing would ever free up; run the job alone rather than wait forever
+            job = ready[0]
+            print(f"[WARNING] {job.name} needs {job.cores} core(s) and {job.memoryMB:.0f} MB but only "
+                  f"{freeCores} core(s) and {freeMemory:.0f} MB are free. Running it alone.\n")
+            return job
+        return None
+
+    # ===== Execution ===== #
+    def stopProcess(self,job: CaseJob) -> None:
+        process = job.process
+        if process is None:
+            return
+        if self.killStep is not None:
+            try:
+                self.killStep(job)
+            except Exception as error:
+                print(f"[WARNING] Could not stop the processes started by {job.name}: {error}\n")
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid,signal.SIGKILL)
+            else:
+                process.kill()
+        except (ProcessLookupError,PermissionError):
+            pass
+
+    def runStep(self,job: CaseJob,stepName: str,command) -> int:
+        if callable(command):
+            try:
+                command(job)
+                return 0
+            except Exception:
+                job.logPath(stepName).write_text(traceback.format_exc(),encoding="utf-8")
+                return 1
+
+        args,cwd = self.commandArgs(job.caseDir,command)
+        if self.verbose:
+            print(f"[DEBUG] {job.name} | {stepName}: {command}\n")
+        monitor = self.stepMonitor(job,stepName) if self.stepMonitor else None
+        if monitor is not None:
+            job.monitors[stepName] = monitor
+        with job.logPath(stepName).open("w",encoding="utf-8") as log:
+            job.process = subprocess.Popen(args,cwd=cwd,stdout=log,stderr=subprocess.STDOUT,
+                                           stdin=subprocess.DEVNULL,text=True,
+                                           start_new_session=(os.name == "posix"))
+            deadline = None if self.stepTimeout is None else time.monotonic() + self.stepTimeout
+            interval = self.monitorSeconds if monitor is not None else None
+            try:
+                while True:
+                    wait = interval
+                    if deadline is not None:
+                        remaining = max(0.0,deadline - time.monotonic())
+                        wait = remaining if wait is None else min(wait,remaining)
+                    try:
+                        returnCode = job.process.wait(timeout=wait)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if deadline is not None and time.monotonic() >= deadline:
+                            self.stopProcess(job)
+                            job.process.wait()
+                            log.write(f"\n[ERROR] Step killed after {self.stepTimeout:.0f} s.\n")
+                            returnCode = -9
+                            break
+                        if monitor is None:
+                            continue
+                        try:
+                            monitor.poll()
+                        except Exception as error:
+                            # A broken monitor must not take the solve down with it
+                            print(f"[WARNING] Monitor for {job.name} stopped: {error}\n")
+                            monitor,interval = None,None
+                if monitor is not None:
+                    monitor.finish(returnCode)
+                return returnCode
+            finally:
+                job.process = None
+
+    def runJob(self,job: CaseJob) -> None:
+        job.startTime = time.perf_counter()
+        job.status = "running"
+        try:
+            for stepName,command in job.steps:
+                returnCode = self.runStep(job,stepName,command)
+                if returnCode != 0:
+                    job.status = "failed"
+                    job.failedStep = stepName
+                    job.returnCode = returnCode
+                    print(f"[ERROR] {job.name} failed in {stepName} (exit code {returnCode}). "
+                          f"See {job.logPath(stepName)}.\n")
+                    return
+            job.returnCode = 0
+            job.status = "done"
+        except OSError as error:
+            job.status = "failed"
+            job.failedStep = job.failedStep or "launch"
+            print(f"[ERROR] {job.name} could not be started: {error}\n")
+        finally:
+            if job.status == "running":
+                # Left by an unexpected exception; dependents must still be released
+                job.status = "failed"
+                job.failedStep = job.failedStep or "scheduler"
+            job.wallSeconds = time.perf_counter() - job.startTime
+
+    def run(self,jobs: List[CaseJob]) -> List[CaseJob]:
+        # Runs every job and returns them with status, failedStep and wallSeconds filled in
+        pending = list(jobs)
+        total = len(pending)
+        finished = 0
+
+        def execute(job):
+            try:
+                self.runJob(job)
+            finally:
+                with self.lock:
+                    self.running.remove(job)
+                    self.lock.notify()
+
+        with self.lock:
+            try:
+                while pending or self.running:
+                    job = self.nextJob(pending)
+                    if job is not None:
+                        pending.remove(job)
+                        self.running.append(job)
+                        job.status = "running"
+                        print(f"[PROGRAM] Started {job.name} ({len(self.running)} running, "
+                              f"{len(pending)} queued).\n")
+                        threading.Thread(target=execute,args=(job,),daemon=True).start()
+                        continue
+                    self.lock.wait(timeout=self.pollSeconds)
+                    done = total - len(pending) - len(self.running)
+                    if done != finished:
+                        finished = done
+                        print(f"[PROGRAM] {finished}/{total} cases finished.\n")
+            except KeyboardInterrupt:
+                print(f"[WARNING] Interrupted; stopping {len(self.running)} running case(s).\n")
+                for job in self.running:
+                    self.stopProcess(job)
+                raise
+
+        failed = [job for job in jobs if job.status == "failed"]
+        print(f"[PROGRAM] Batch complete: {total - len(failed)}/{total} cases succeeded.\n")
+        for job in failed:
+            print(f"  - {job.name}: {job.failedStep} (exit code {job.returnCode})\n")
+        return jobs
+
+def writeRunSummary(jobs: List[CaseJob],path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True,exist_ok=True)
+    with path.open("w",newline="",encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["case","caseDir","status","failedStep","returnCode","wallSeconds","cores","memoryMB"])
+        for job in jobs:
+            writer.writerow([
+                job.name,job.caseDir,job.status,job.failedStep or "",
+                "" if job.returnCode is None else job.returnCode,
+                "" if job.wallSeconds is None else round(job.wallSeconds,3),
+                job.cores,job.memoryMB,
+            ])
+    return path
@@ -0,0 +1,183 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Solver Convergence Monitor
+
+# ============================== #
+# |    PROGRAM DESCRIPTION     | #
+# ============================== #
+# Watches a running steady solve and stops it once it has converged, instead of
+# letting it run to endTime. While the solver runs, the monitor tails
+# postProcessing/force_coefficient/0/coefficient.dat and the solver log, reading only
+# the bytes added since the last poll. A case counts as converged when, over the last
+# `window` iterations,
+#   - the mean of Cl and of Cd moved less than relativeChange (relative to the mean of
+#     the window before it), and
+#   - their standard deviation is below relativeStd of the mean, and
+#   - the latest initial residual of every field in residualTargets is below its target.
+# The solver is then stopped cleanly by switching controlDict to "stopAt writeNow",
+# which OpenFOAM picks up because the cases run with runTimeModifiable. controlDict is
+# put back to "stopAt endTime" when the solver exits, so a rerun starts normally.
+
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from force_coefficients import coefficientColumns,isColumnHeader
+
+COEFFICIENT_RELATIVE = Path("postProcessing") / "force_coefficient" / "0" / "coefficient.dat"
+RESIDUAL_PATTERN = re.compile(r"Solving for (\w+), Initial residual = ([-+0-9.eE]+)")
+TIME_PATTERN = re.compile(r"^Time = ([-+0-9.eE]+)",re.MULTILINE)
+
+# ============================== #
+# |        CASE FILES          | #
+# ============================== #
+def findControlDict(caseDir: Path) -> Optional[Path]:
+    for name in ("controlDict","controlDict.txt"):
+        path = caseDir / "system" / name
+        if path.exists():
+            return path
+    return None
+
+def setStopAt(controlDict: Path,value: str) -> bool:
+    # Rewrites the stopAt entry through a temporary file, so the running solver never reads
+    # a half-written controlDict (and a hardlinked template is left untouched)
+    text = controlDict.read_text(encoding="utf-8")
+    updated,count = re.subn(r"^(\s*stopAt\s+)\w+(\s*;)",rf"\g<1>{value}\g<2>",text,count=1,flags=re.MULTILINE)
+    if count == 0 or updated == text:
+        return count > 0
+    pendingPath = controlDict.with_name(f"{controlDict.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    pendingPath.write_text(updated,encoding="utf-8")
+    os.replace(pendingPath,controlDict)
+    return True
+
+class FileTail:
+    # Yields the complete lines appended to a file since the previous call
+    def __init__(self,path: Path):
+        self.path = Path(path)
+        self.offset = 0
+        self.partial = b""
+
+    def readLines(self) -> List[str]:
+        try:
+            with self.path.open("rb") as file:
+                file.seek(self.offset)
+                data = file.read()
+        except OSError:
+            return []
+        self.offset += len(data)
+        lines = (self.partial + data).split(b"\n")
+        self.partial = lines.pop()
+        return [line.decode("utf-8",errors="replace").strip() for line in lines]
+
+# ============================== #
+# |          MONITOR           | #
+# ============================== #
+class ConvergenceMonitor:
+    def __init__(self,caseDir: Path,logPath: Path,window: int = 200,relativeChange: float = 1e-3,
+                 relativeStd: float = 2e-3,residualTargets: Dict[str,float] = None,
+                 minIterations: int = 300,absoluteFloor: float = 1e-3):
+        self.caseDir = Path(caseDir)
+        self.window = window
+        self.relativeChange = relativeChange
+        self.relativeStd = relativeStd
+        self.residualTargets = dict(residualTargets or {})
+        self.minIterations = minIterations
+        self.absoluteFloor = absoluteFloor # Keeps the relative tests meaningful for Cl near 0
+
+        self.coefficientTail = FileTail(self.caseDir / COEFFICIENT_RELATIVE)
+        self.logTail = FileTail(logPath)
+        self.columns = coefficientColumns(None)
+        self.history = {"Cl": deque(maxlen=2 * window),"Cd": deque(maxlen=2 * window)}
+        self.residuals: Dict[str,float] = {}
+        self.lastTime = None
+        self.controlDict = findControlDict(self.caseDir)
+        self.endTime = self.readEndTime()
+        self.stopRequested = False
+        self.stopTime = None
+
+    def readEndTime(self) -> Optional[float]:
+        if self.controlDict is None:
+            return None
+        match = re.search(r"^\s*endTime\s+([^;]+);",self.controlDict.read_text(encoding="utf-8"),re.MULTILINE)
+        try:
+            return float(match.group(1)) if match else None
+        except ValueError:
+            return None
+
+    def update(self) -> None:
+        for line in self.coefficientTail.readLines():
+            if not line:
+                continue
+            if line.startswith("#"):
+                if isColumnHeader(line):
+                    self.columns = coefficientColumns(line.lstrip("#").split())
+                continue
+            parts = line.split()
+            try:
+                self.lastTime = float(parts[self.columns["Time"]])
+                self.history["Cl"].append(float(parts[self.columns["Cl"]]))
+                self.history["Cd"].append(float(parts[self.columns["Cd"]]))
+            except (IndexError,ValueError):
+                continue
+        for line in self.logTail.readLines():
+            match = RESIDUAL_PATTERN.search(line)
+            if match:
+                self.residuals[match.group(1)] = float(match.group(2))
+
+    def coefficientsSettled(self) -> bool:
+        for values in self.history.values():
+            if len(values) < 2 * self.window:
+                return False
+            series = np.asarray(values)
+            previous,latest = series[:self.window],series[self.window:]
+            scale = max(abs(latest.mean()),self.absoluteFloor)
+            if abs(latest.mean() - previous.mean()) / scale > self.relativeChange:
+                return False
+            if latest.std() / scale > self.relativeStd:
+                return False
+        return True
+
+    def residualsSettled(self) -> bool:
+        return all(
+            field in self.residuals and self.residuals[field] <= target
+            for field,target in self.residualTargets.items()
+        )
+
+    def isConverged(self) -> bool:
+        if self.lastTime is None or self.lastTime < self.minIterations:
+            return False
+        return self.coefficientsSettled() and self.residualsSettled()
+
+    def poll(self) -> None:
+        # Called periodically while the solver runs
+        self.update()
+        if not self.stopRequested and self.controlDict is not None and self.isConverged():
+            if setStopAt(self.controlDict,"writeNow"):
+                self.stopRequested = True
+                self.stopTime = self.lastTime
+                print(f"[PROGRAM] {self.caseDir} converged at iteration {self.lastTime:.0f}; "
+                      f"requested stopAt writeNow.\n")
+
+    def finish(self,returnCode: int) -> None:
+        # Called once the solver has exited
+        self.update()
+        if self.stopRequested:
+            setStopAt(self.controlDict,"endTime")
+
+    def statistics(self) -> dict:
+        iterations = self.lastTime
+        saved = None
+        if iterations is not None and self.endTime is not None:
+            saved = max(0.0,self.endTime - iterations)
+        return {
+            "stoppedEarly": self.stopRequested,
+            "stopRequestedAt": self.stopTime,
+            "iterations": iterations,
+            "endTime": self.endTime,
+            "iterationsSaved": saved,
+            "finalCl": self.history["Cl"][-1] if self.history["Cl"] else None,
+            "finalCd": self.history["Cd"][-1] if self.history["Cd"] else None,
+            **{f"residual_{field}": value for field,value in self.residuals.items()},
+        }
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+#Tropochief RC Plane Project
+#Airfoil Selection: Fake OpenFOAM Utilities
+
+# ============================== #
+# |    PROGRAM DESCRIPTION     | #
+# ============================== #
+# Stand-in for the OpenFOAM utilities automate_2d_openFOAM.py calls, so the case
+# scheduler and the post-processing can be exercised without OpenFOAM or WSL. Run
+# from inside a case directory as
+#   python fake_openfoam.py <utility> [arguments]
+# with <utility> one of blockMesh, snappyHexMesh, potentialFoam, mapFields, simpleFoam
+# or foamToVTK.
+#
+# The meshers write placeholder constant/polyMesh files. The solver reads endTime from
+# system/controlDict, the p residual target from system/fvSolution and the angle of
+# attack from constant/aoa_degrees.txt, prints OpenFOAM-style residual lines and writes
+# postProcessing/force_coefficient/0/coefficient.dat one iteration at a time, with Cl,
+# Cd and Cm relaxing towards a thin-airfoil estimate (slowly and with a lasting
+# oscillation past stall). It stops once the residual target is met and writes the
+# last time directory with a marker in U, which potentialFoam and mapFields also set in
+# 0/U, so a warm-started or potential-initialized case starts closer to convergence.
+# Like a runTimeModifiable case, it re-reads controlDict when the file changes and
+# writes and exits on "stopAt writeNow".
+#
+# Behaviour is set through environment variables:
+#   FAKE_FOAM_DELAY       Seconds per solver iteration (default 0)
+#   FAKE_FOAM_MESH_DELAY  Seconds spent in snappyHexMesh (default 0)
+#   FAKE_FOAM_FAIL        Comma-separated case path fragments whose run fails
+#   FAKE_FOAM_FAIL_STEP   Utility that fails for those cases (default simpleFoam)
+
+import math
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+DELAY = float(os.environ.get("FAKE_FOAM_DELAY","0") or 0.0)
+MESH_DELAY = float(os.environ.get("FAKE_FOAM_MESH_DELAY","0") or 0.0)
+FAIL_CASES = [part.strip() for part in os.environ.get("FAKE_FOAM_FAIL","").split(",") if part.strip()]
+FAIL_STEP = os.environ.get("FAKE_FOAM_FAIL_STEP","simpleFoam")
+
+COEFFICIENT_HEADER = (
+    "# Force and moment coefficients\n"
+    "# dragDir     : (1 0 0)\n"
+    "# liftDir     : (0 1 0)\n"
+    "# pitchAxis   : (0 0 1)\n"
+    "# Time          \tCd            \tCd(f)         \tCd(r)         \tCl            \tCl(f)         "
+    "\tCl(r)         \tCmPitch       \tCmRoll        \tCmYaw         \tCs            \tCs(f)         \tCs(r)\n"
+)
+
+# ============================== #
+# |         CASE FILES         | #
+# ============================== #
+def caseFile(relativePath: str) -> Path:
+    # The repository keeps the templates as <name>.txt; real cases drop the suffix
+    path = Path(relativePath)
+    return path if path.exists() else path.with_name(path.name + ".txt")
+
+def readControlEntry(key: str,default: str) -> str:
+    path = caseFile("system/controlDict")
+    if not path.exists():
+        return default
+    match = re.search(rf"^\s*{key}\s+([^;]+);",path.read_text(encoding="utf-8"),re.MULTILINE)
+    return match.group(1).strip() if match else default
+
+def readResidualTarget() -> float:
+    path = caseFile("system/fvSolution")
+    if not path.exists():
+        return 0.0
+    match = re.search(r"residualControl\s*\{[^}]*?\bp\s+([0-9.eE+-]+);",path.read_text(encoding="utf-8"))
+    return float(match.group(1)) if match else 0.0
+
+def readAlpha() -> float:
+    path = caseFile("constant/aoa_degrees.txt")
+    try:
+        return float(path.read_text(encoding="utf-8").split()[0])
+    except (OSError,IndexError,ValueError):
+        return 0.0
+
+def fatalError(message: str) -> None:
+    print(f"\n--> FOAM FATAL ERROR:\n    {message}\n",flush=True)
+    sys.exit(1)
+
+def checkFailure(utility: str) -> None:
+    caseName = Path.cwd().as_posix()
+    if utility == FAIL_STEP and any(fragment in caseName for fragment in FAIL_CASES):
+        fatalError(f"{utility} failed for {caseName} (FAKE_FOAM_FAIL)")
+
+def readInitialState():
+    # ("uniform" | "potential" | "warm", source alpha) from the marker line in 0/U
+    path = caseFile("0/U")
+    text = path.read_text(encoding="utf-8") if path.exists() else ""
+    match = re.search(r"^// fake converged alpha=([-0-9.eE+]+)",text,re.MULTILINE)
+    if match:
+        return "warm",float(match.group(1))
+    if re.search(r"^// fake potentialFoam",text,re.MULTILINE):
+        return "potential",None
+    return "uniform",None
+
+def markField(path: Path,marker: str) -> None:
+    # Replaces any earlier fake marker line at the top of a field file
+    lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+    lines = [line for line in lines if not line.startswith("// fake ")]
+    path.write_text("\n".join([marker] + lines) + "\n",encoding="utf-8")
+
+# ============================== #
+# |         UTILITIES          | #
+# ============================== #
+def blockMesh(arguments) -> None:
+    meshDirectory = Path("constant/polyMesh")
+    meshDirectory.mkdir(parents=True,exist_ok=True)
+    for name in ("points","faces","owner","neighbour","boundary"):
+        (meshDirectory / name).write_text(f"// fake blockMesh {name}\n",encoding="utf-8")
+    print("Creating block mesh topology\nEnd\n",flush=True)
+
+def snappyHexMesh(arguments) -> None:
+    if not Path("constant/polyMesh/points").exists():
+        fatalError("cannot find constant/polyMesh; run blockMesh first")
+    if not Path("constant/triSurface/airfoil.stl").exists():
+        fatalError("cannot find constant/triSurface/airfoil.stl")
+    if MESH_DELAY:
+        time.sleep(MESH_DELAY)
+    stlSize = Path("constant/triSurface/airfoil.stl").stat().st_size
+    Path("constant/polyMesh/points").write_text(f"// fake snappyHexMesh points from {stlSize} byte STL\n",encoding="utf-8")
+    print("Snapping\nMesh snapped\nEnd\n",flush=True)
+
+def targetCoefficients(alpha: float):
+    # Thin-airfoil lift with a soft stall near 13 degrees; (Cl, Cd, Cm, stalled)
+    alphaStall = 13.0
+    clAttached = 0.25 + 0.105 * alpha
+    if alpha <= alphaStall:
+        cl = clAttached
+    else:
+        cl = 0.25 + 0.105 * alphaStall - 0.06 * (alpha - alphaStall)
+    cd = 0.011 + 0.0004 * alpha ** 2 + (0.02 * (alpha - alphaStall) if alpha > alphaStall else 0.0)
+    return cl,cd,-0.05 - 0.002 * alpha,alpha > alphaStall
+
+def potentialFoam(arguments) -> None:
+    if not Path("constant/polyMesh/points").exists():
+        fatalError("cannot find constant/polyMesh; run the mesher first")
+    markField(caseFile("0/U"),"// fake potentialFoam")
+    if "-writep" in arguments:
+        markField(caseFile("0/p"),"// fake potentialFoam")
+    print("Calculating potential flow\nEnd\n",flush=True)
+
+def mapFields(arguments) -> None:
+    # mapFields <sourceCase> -consistent -sourceTime latestTime; the meshes are taken as identical
+    if not arguments:
+        fatalError("mapFields needs a source case")
+    source = Path(arguments[0])
+    times = [(float(entry.name),entry) for entry in source.iterdir()
+             if entry.is_dir() and re.fullmatch(r"[0-9.eE+-]+",entry.name) and float(entry.name) > 0] if source.exists() else []
+    if not times:
+        fatalError(f"no time directories in {source}")
+    latest = max(times)[1]
+    for field in latest.iterdir():
+        target = Path("0") / field.name
+        if field.is_file() and target.exists():
+            target.unlink()
+            target.write_bytes(field.read_bytes())
+    print(f"Mapping fields from {latest}\nEnd\n",flush=True)
+
+def writeTimeDirectory(iteration: int,alpha: float) -> None:
+    timeDirectory = Path(str(iteration))
+    timeDirectory.mkdir(exist_ok=True)
+    for field in Path("0").iterdir():
+        if field.is_file():
+            (timeDirectory / field.name).write_bytes(field.read_bytes())
+    markField(timeDirectory / caseFile("0/U").name,f"// fake converged alpha={alpha}")
+
+def simpleFoam(arguments) -> None:
+    if not Path("constant/polyMesh/points").exists():
+        fatalError("cannot find constant/polyMesh; run the mesher first")
+    endTime = int(float(readControlEntry("endTime","2000")))
+    residualTarget = readResidualTarget()
+    alpha = readAlpha()
+    cl,cd,cm,stalled = targetCoefficients(alpha)
+    timeConstant = 450.0 if stalled else 120.0
+    lastingAmplitude = 0.04 if stalled else 0.0
+
+    # How far the initial fields are from this alpha's solution
+    state,sourceAlpha = readInitialState()
+    if state == "warm":
+        clStart,cdStart,cmStart,_ = targetCoefficients(sourceAlpha)
+        amplitude = min(1.0,0.01 + 0.02 * abs(alpha - sourceAlpha))
+    elif state == "potential":
+        clStart,cdStart,cmStart = 1.1 * cl,0.5 * cd,cm
+        amplitude = 0.3
+    else:
+        clStart,cdStart,cmStart = 0.2 * cl,3.0 * cd,0.5 * cm
+        amplitude = 1.0
+    print(f"Initial fields: {state}" + (f" from alpha = {sourceAlpha}" if state == "warm" else "") + "\n",flush=True)
+
+    controlDict = caseFile("system/controlDict")
+    controlStamp = controlDict.stat().st_mtime_ns if controlDict.exists() else None
+
+    outputDirectory = Path("postProcessing/force_coefficient/0")
+    outputDirectory.mkdir(parents=True,exist_ok=True)
+    with (outputDirectory / "coefficient.dat").open("w",encoding="utf-8") as coefficients:
+        coefficients.write(COEFFICIENT_HEADER)
+        for iteration in range(1,endTime + 1):
+            if DELAY:
+                time.sleep(DELAY)
+            decay = math.exp(-iteration / timeConstant)
+            # Integrated forces settle well before the residuals do
+            forceDecay = math.exp(-2.0 * iteration / timeConstant)
+            wobble = math.cos(iteration / 12.0)
+            swing = 0.3 * amplitude * forceDecay + lastingAmplitude
+            clNow = cl + (clStart - cl) * forceDecay + swing * wobble
+            cdNow = cd + (cdStart - cd) * forceDecay + 0.2 * swing * wobble
+            cmNow = cm + (cmStart - cm) * forceDecay
+            residual = max(1e-7,amplitude * decay) * (1.0 + 0.1 * abs(wobble)) + lastingAmplitude * 0.025
+            print(f"Time = {iteration}\n\n"
+                  f"smoothSolver:  Solving for Ux, Initial residual = {residual:.6g}, Final residual = {0.01 * residual:.6g}, No Iterations 3\n"
+                  f"smoothSolver:  Solving for Uy, Initial residual = {residual:.6g}, Final residual = {0.01 * residual:.6g}, No Iterations 3\n"
+                  f"GAMG:  Solving for p, Initial residual = {2.0 * residual:.6g}, Final residual = {0.02 * residual:.6g}, No Iterations 5\n"
+                  f"ExecutionTime = {iteration * DELAY:.2f} s  ClockTime = {int(iteration * DELAY)} s\n")
+            coefficients.write(f"{iteration}\t{cdNow:.8e}\t{0.5 * cdNow:.8e}\t{0.5 * cdNow:.8e}\t{clNow:.8e}\t"
+                               f"{0.5 * clNow:.8e}\t{0.5 * clNow:.8e}\t{cmNow:.8e}\t0\t0\t0\t0\t0\n")
+            coefficients.flush()
+            if 2.0 * residual < residualTarget:
+                print(f"\nSIMPLE solution converged in {iteration} iterations\n",flush=True)
+                break
+            if controlStamp is not None and controlDict.stat().st_mtime_ns != controlStamp:
+                controlStamp = controlDict.stat().st_mtime_ns
+                print(f"Re-reading object controlDict from file {controlDict}\n",flush=True)
+                if readControlEntry("stopAt","endTime") == "writeNow":
+                    print(f"\nStopping at iteration {iteration} (stopAt writeNow)\n",flush=True)
+                    break
+    writeTimeDirectory(iteration,alpha)
+    print("End\n",flush=True)
+
+def foamToVTK(arguments) -> None:
+    Path("VTK").mkdir(exist_ok=True)
+    Path("VTK/case.vtm").write_text("<!-- fake foamToVTK -->\n",encoding="utf-8")
+    print("End\n",flush=True)
+
+UTILITIES = {
+    "blockMesh": blockMesh,
+    "snappyHexMesh": snappyHexMesh,
+    "potentialFoam": potentialFoam,
+    "mapFields": mapFields,
+    "simpleFoam": simpleFoam,
+    "foamToVTK": foamToVTK,
+}
+
+# ============================== #
+# |         EXECUTION          | #
+# ============================== #
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in UTILITIES:
+        fatalError(f"usage: fake_openfoam.py <{'|'.join(UTILITIES)}> [arguments]")
+    utility = sys.argv[1]
+    checkFailure(utility)
+    UTILITIES[utility](sys.argv[2:])
+
+if __name__ == "__main__":
+    main()
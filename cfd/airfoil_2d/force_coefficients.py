@@ -0,0 +1,149 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Force Coefficient Files
+
+# ============================== #
+# |    PROGRAM DESCRIPTION     | #
+# ============================== #
+# Reads OpenFOAM forceCoeffs output (postProcessing/force_coefficient/0/coefficient.dat)
+# without walking the whole history. The file is read backwards from its end in blocks
+# until the last `rows` data lines are in hand, or a column header turns up first (a
+# restarted run); the header is otherwise taken from the top of the file. Only those
+# rows are parsed, so the cost does not grow with the number of iterations written.
+#
+# Instead of one final, possibly oscillating sample, Cl, Cd and Cm are summarized over
+# that tail window: mean (reported as the coefficient itself), standard deviation,
+# min/max, the last sample, and the drift across the window (least-squares slope times
+# the window's iteration span).
+
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+TAIL_BLOCK_BYTES = 64 * 1024
+HEADER_SCAN_BYTES = 64 * 1024 # The comment header of coefficient.dat is well under this
+COEFFICIENTS = ("Cl","Cd","Cm")
+
+# ============================== #
+# |           HEADER           | #
+# ============================== #
+def coefficientColumns(headerTokens: Optional[List[str]]) -> Dict[str,int]:
+    # Column index of Time, Cl, Cd and Cm in coefficient.dat; without a header, OpenFOAM's
+    # old fixed order (Time Cl Cd Cm) is assumed
+    columns = {"Time": 0,"Cl": 1,"Cd": 2,"Cm": 3}
+    if not headerTokens:
+        return columns
+    positions = {name: index for index,name in enumerate(headerTokens)}
+    candidates = {"Time": ["Time"],"Cl": ["Cl"],"Cd": ["Cd"],"Cm": ["CmPitch","CmRoll","CmYaw","Cm"]}
+    for key,names in candidates.items():
+        for name in names:
+            if name in positions:
+                columns[key] = positions[name]
+                break
+        else:
+            prefixed = [index for index,token in enumerate(headerTokens) if token.startswith(names[0][:2])]
+            if prefixed:
+                columns[key] = prefixed[0]
+    return columns
+
+def isColumnHeader(line: str) -> bool:
+    tokens = line.lstrip("#").split()
+    return line.startswith("#") and ("Time" in tokens or "Cl" in tokens or "Cd" in tokens)
+
+def readHeaderTokens(path: Path) -> Optional[List[str]]:
+    # Column names from the comment block at the top of the file
+    with Path(path).open("rb") as file:
+        head = file.read(HEADER_SCAN_BYTES).decode("utf-8",errors="replace")
+    headerTokens = None
+    for line in head.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith("#"):
+            break
+        if isColumnHeader(line):
+            headerTokens = line.lstrip("#").split()
+    return headerTokens
+
+# ============================== #
+# |         TAIL READING       | #
+# ============================== #
+def reversedLines(file,blockSize: int = TAIL_BLOCK_BYTES) -> Iterator[bytes]:
+    # Lines of a binary file from last to first, reading blockSize bytes at a time
+    file.seek(0,os.SEEK_END)
+    position = file.tell()
+    remainder = b""
+    while position > 0:
+        step = min(blockSize,position)
+        position -= step
+        file.seek(position)
+        lines = (file.read(step) + remainder).split(b"\n")
+        remainder = lines.pop(0)
+        yield from reversed(lines)
+    yield remainder
+
+def readTailRows(path: Path,rows: int) -> Tuple[Optional[List[str]],List[str]]:
+    # (header tokens, last `rows` data lines in file order)
+    dataLines = []
+    headerTokens = None
+    with Path(path).open("rb") as file:
+        file.seek(0,os.SEEK_END)
+        if file.tell() == 0:
+            return None,[]
+        file.seek(-1,os.SEEK_END)
+        complete = file.read(1) == b"\n" # A run still writing may leave a partial last line
+        for index,raw in enumerate(reversedLines(file)):
+            if index == 0 and not complete:
+                continue
+            line = raw.decode("utf-8",errors="replace").strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                if isColumnHeader(line):
+                    headerTokens = line.lstrip("#").split()
+                    break
+                continue
+            if len(dataLines) < rows:
+                dataLines.append(line)
+            elif headerTokens is None:
+                break
+    if headerTokens is None:
+        headerTokens = readHeaderTokens(path)
+    dataLines.reverse()
+    return headerTokens,dataLines
+
+def coefficientWindowStatistics(path: Path,rows: int = 200) -> Optional[Dict[str,float]]:
+    # Tail-window summary of coefficient.dat, or None when it holds no data rows
+    headerTokens,dataLines = readTailRows(path,rows)
+    columns = coefficientColumns(headerTokens)
+    order = ["Time"] + list(COEFFICIENTS)
+    indices = [columns[name] for name in order]
+
+    values = []
+    for line in dataLines:
+        parts = line.split()
+        try:
+            values.append([float(parts[index]) for index in indices])
+        except (IndexError,ValueError):
+            continue
+    if not values:
+        if dataLines:
+            raise ValueError(f"Could not locate columns {order} in {path} (header {headerTokens}).")
+        return None
+
+    table = np.asarray(values)
+    times = table[:,0]
+    statistics = {"time": float(times[-1]),"samples": len(table)}
+    span = float(times[-1] - times[0])
+    for offset,name in enumerate(COEFFICIENTS,start=1):
+        series = table[:,offset]
+        drift = float(np.polyfit(times,series,1)[0] * span) if len(series) > 1 and span > 0 else 0.0
+        statistics.update({
+            name: float(series.mean()),
+            f"{name}_std": float(series.std()),
+            f"{name}_min": float(series.min()),
+            f"{name}_max": float(series.max()),
+            f"{name}_drift": drift,
+            f"{name}_last": float(series[-1]),
+        })
+    return statistics
@@ -0,0 +1,107 @@
+#Tropochief RC Plane Project
+#Airfoil Selection: Case Scheduler Tests
+#   Usage: python -m pytest cfd/airfoil_2d/tests
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0,str(Path(__file__).resolve().parent.parent))
+from case_scheduler import CaseJob,CaseScheduler
+
+FAKE_OPENFOAM = Path(__file__).resolve().parent.parent / "fake_openfoam.py"
+
+def fakeFoamArgs(caseDir,command):
+    # Same launch as automate_2d_openFOAM.caseCommandArgs with FAKE_SOLVER = True
+    return [sys.executable,str(FAKE_OPENFOAM)] + command.split(),caseDir
+
+def makeFakeCase(caseDir: Path,alpha: float) -> Path:
+    (caseDir / "system").mkdir(parents=True)
+    (caseDir / "constant").mkdir()
+    (caseDir / "0").mkdir()
+    (caseDir / "system" / "controlDict").write_text("endTime 20;\n",encoding="utf-8")
+    (caseDir / "constant" / "aoa_degrees.txt").write_text(f"{alpha}\n",encoding="utf-8")
+    for field in ("U","p"):
+        (caseDir / "0" / field).write_text(f"// {field}\n",encoding="utf-8")
+    return caseDir
+
+def sleepArgs(caseDir,command):
+    # Every command is a short sleep in a real subprocess
+    return [sys.executable,"-c",f"import time; time.sleep({float(command)})"],caseDir
+
+def recordStep(times,key):
+    def step(job):
+        times[key] = time.monotonic()
+    return step
+
+def test_dependent_job_starts_after_source_finishes(tmp_path):
+    times = {}
+    source = CaseJob("A",tmp_path,[("start",recordStep(times,"A.start")),("solve","0.5"),
+                                   ("end",recordStep(times,"A.end"))])
+    dependent = CaseJob("B",tmp_path,[("start",recordStep(times,"B.start"))],after=source)
+    independent = CaseJob("C",tmp_path,[("start",recordStep(times,"C.start"))])
+    scheduler = CaseScheduler(sleepArgs,maxCores=4,memoryReserveMB=0.0,pollSeconds=0.05)
+    scheduler.run([source,dependent,independent])
+
+    assert [job.status for job in (source,dependent,independent)] == ["done","done","done"]
+    assert times["B.start"] >= times["A.end"]
+    assert times["C.start"] < times["A.end"] # Free cores are still used by unrelated jobs
+
+def test_dependent_job_runs_after_failed_source(tmp_path):
+    def fail(job):
+        raise RuntimeError("step failed")
+    times = {}
+    source = CaseJob("A",tmp_path,[("solve","0.2"),("fail",fail)])
+    dependent = CaseJob("B",tmp_path,[("start",recordStep(times,"B.start"))],after=source)
+    CaseScheduler(sleepArgs,maxCores=4,memoryReserveMB=0.0,pollSeconds=0.05).run([source,dependent])
+
+    assert source.status == "failed" and source.failedStep == "fail"
+    assert dependent.status == "done"
+    assert (tmp_path / "log.fail").read_text(encoding="utf-8").strip().endswith("RuntimeError: step failed")
+
+def test_status_is_running_while_steps_execute(tmp_path):
+    seen = []
+    job = CaseJob("A",tmp_path,[("check",lambda job: seen.append(job.status))])
+    CaseScheduler(sleepArgs,maxCores=1,memoryReserveMB=0.0,pollSeconds=0.05).run([job])
+    assert seen == ["running"] and job.status == "done"
+
+def test_timeout_kills_the_whole_process_group(tmp_path):
+    # The step's own child would write child.alive after 1 s unless it is killed with its parent
+    child = "import pathlib,time; time.sleep(1.0); pathlib.Path('child.alive').write_text('x')"
+    parent = f"import subprocess,sys,time; subprocess.Popen([sys.executable,'-c',{child!r}]); time.sleep(30)"
+    killed = []
+    scheduler = CaseScheduler(lambda caseDir,command: ([sys.executable,"-c",parent],caseDir),
+                              maxCores=1,memoryReserveMB=0.0,pollSeconds=0.05,stepTimeout=0.3,
+                              killStep=lambda job: killed.append(job.name))
+    job = CaseJob("A",tmp_path,[("solve","solve")])
+    started = time.monotonic()
+    scheduler.run([job])
+
+    assert time.monotonic() - started < 5.0
+    assert job.status == "failed" and job.returnCode == -9
+    assert killed == ["A"]
+    time.sleep(1.5)
+    if os.name == "posix":
+        assert not (tmp_path / "child.alive").exists()
+
+def test_fake_openfoam_batch_continues_past_a_failed_case(tmp_path,monkeypatch):
+    monkeypatch.setenv("FAKE_FOAM_FAIL","alpha_4")
+    monkeypatch.setenv("FAKE_FOAM_FAIL_STEP","simpleFoam")
+    steps = [("blockMesh","blockMesh"),("simpleFoam","simpleFoam"),("foamToVTK","foamToVTK")]
+    jobs = [CaseJob(f"alpha_{alpha}",makeFakeCase(tmp_path / f"alpha_{alpha}",alpha),steps)
+            for alpha in (0,4,8)]
+    CaseScheduler(fakeFoamArgs,maxCores=2,memoryReserveMB=0.0,pollSeconds=0.05).run(jobs)
+
+    assert [job.status for job in jobs] == ["done","failed","done"]
+    assert jobs[1].failedStep == "simpleFoam" and jobs[1].returnCode == 1
+    for job in jobs:
+        # Each case logs its own steps; the failed case stops before foamToVTK
+        assert "End" in (job.caseDir / "log.blockMesh").read_text(encoding="utf-8")
+        solverLog = (job.caseDir / "log.simpleFoam").read_text(encoding="utf-8")
+        if job.status == "failed":
+            assert "FOAM FATAL ERROR" in solverLog and "alpha_4" in solverLog
+            assert not (job.caseDir / "log.foamToVTK").exists()
+        else:
+            assert "Time = 20" in solverLog and "alpha_4" not in solverLog
+            assert (job.caseDir / "VTK" / "case.vtm").exists()